@@ -1,15 +1,22 @@
 # -*- coding: utf-8 -*-
 
-# Importa a biblioteca pandas
-import pandas as pd
+import os
+import sys
+
+# Camada de acesso aos datasets do curso (datasets/cache_dados.py): na primeira
+# execução a planilha é convertida para um arquivo colunar em datasets/.cache;
+# nas seguintes a leitura vem desse cache, a menos que o arquivo Excel mude.
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'datasets'))
+from cache_dados import ler_excel
 
 # Define o nome do arquivo Excel a ser lido
 nome_arquivo_excel = 'rendimentos.xlsx'
 
 try:
     # 1. Importa os dados da planilha Excel para um DataFrame
-    # O Pandas lê o arquivo e o transforma em uma tabela (DataFrame)
-    df_rendimento = pd.read_excel(nome_arquivo_excel)
+    # Lê só a primeira aba e só as colunas usadas na análise
+    df_rendimento = ler_excel(nome_arquivo_excel, planilhas=0,
+                              colunas=['Temperatura (°C)', 'Rendimento de Óleo (%)'])
 
     # 2. Imprime os dados importados
     print(f"--- Dados de Rendimento Importados de '{nome_arquivo_excel}' ---")
@@ -1,3 +1,9 @@
+import os
+import sys
+# renderização compartilhada com o projeto final (FIGDIR definido -> figuras salvas em arquivo)
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Aula_15_Projeto_Final"))
+from graficos_secagem import configurar_renderizacao, mostrar_ou_salvar
+configurar_renderizacao()
 import matplotlib.pyplot as plt
 horas = [1,2,3,4,5]
 umidade = [25.0,22.5,20.1,18.0,16.2]
@@ -5,4 +11,4 @@ plt.plot(horas, umidade, marker='o')
 plt.xlabel("Hora")
 plt.ylabel("Teor de água (% b.s.)")
 plt.title("Curva de Secagem")
-plt.show()
\ No newline at end of file
+mostrar_ou_salvar('aula_09')
\ No newline at end of file
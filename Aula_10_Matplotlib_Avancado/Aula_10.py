@@ -1,3 +1,9 @@
+import os
+import sys
+# renderização compartilhada com o projeto final (FIGDIR definido -> figuras salvas em arquivo)
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Aula_15_Projeto_Final"))
+from graficos_secagem import configurar_renderizacao, mostrar_ou_salvar
+configurar_renderizacao()
 import matplotlib.pyplot as plt
 import numpy as np
 horas = [1,2,3,4,5]
@@ -9,4 +15,4 @@ plt.plot(horas, secagem2, label="60°C")
 plt.legend()
 plt.subplot(1,2,2)
 plt.boxplot([secagem1, secagem2], labels=["40°C","60°C"])
-plt.show()
\ No newline at end of file
+mostrar_ou_salvar('aula_10')
\ No newline at end of file
@@ -1,3 +1,9 @@
+import os
+import sys
+# renderização compartilhada com o projeto final (FIGDIR definido -> figuras salvas em arquivo)
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Aula_15_Projeto_Final"))
+from graficos_secagem import configurar_renderizacao, mostrar_ou_salvar
+configurar_renderizacao()
 import matplotlib.pyplot as plt
 horas = [1,2,3,4,5]
 umid1 = [25,22,20,18,16]
@@ -8,4 +14,4 @@ plt.xlabel("Tempo (h)")
 plt.ylabel("Umidade (%)")
 plt.title("Curvas de Secagem")
 plt.legend()
-plt.show()
\ No newline at end of file
+mostrar_ou_salvar('aula_11')
\ No newline at end of file
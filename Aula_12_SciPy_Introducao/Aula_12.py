@@ -1,5 +1,11 @@
 import numpy as np
 from scipy.optimize import curve_fit
+import os
+import sys
+# renderização compartilhada com o projeto final (FIGDIR definido -> figuras salvas em arquivo)
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Aula_15_Projeto_Final"))
+from graficos_secagem import configurar_renderizacao, mostrar_ou_salvar
+configurar_renderizacao()
 import matplotlib.pyplot as plt
 
 # Dados experimentais (simulados)
@@ -8,8 +14,10 @@ teor = np.array([25,20,16,13,11,10])
 
 def modelo(t, a, b):
     return a*np.exp(-b*t)
-params, _ = curve_fit(modelo, tempo, teor)
+# Chute inicial pela reta ln(teor) = ln(a) - b*t
+inclinacao, intercepto = np.polyfit(tempo, np.log(teor), 1)
+params, _ = curve_fit(modelo, tempo, teor, p0=[np.exp(intercepto), -inclinacao])
 plt.scatter(tempo, teor, label="Dados")
 plt.plot(tempo, modelo(tempo, *params), label="Ajuste", color='red')
 plt.legend()
-plt.show()
+mostrar_ou_salvar('aula_12')
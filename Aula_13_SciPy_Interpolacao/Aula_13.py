@@ -1,5 +1,12 @@
 import numpy as np
 from scipy.interpolate import interp1d
+from interpolacao_lote import InterpoladorLote
+import os
+import sys
+# renderização compartilhada com o projeto final (FIGDIR definido -> figuras salvas em arquivo)
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Aula_15_Projeto_Final"))
+from graficos_secagem import configurar_renderizacao, mostrar_ou_salvar
+configurar_renderizacao()
 import matplotlib.pyplot as plt
 
 prof = np.array([0,10,20,30])
@@ -9,4 +16,15 @@ novos = np.linspace(0,30,100)
 plt.plot(prof, temp, 'o', novos, f(novos), '-')
 plt.xlabel("Profundidade (cm)")
 plt.ylabel("Temperatura (°C)")
-plt.show()
+mostrar_ou_salvar('aula_13')
+
+# Muitas sondas de uma vez: os coeficientes de todos os perfis são calculados
+# juntos e a grade de consulta (trechos via searchsorted) é montada uma só vez
+sondas = temp + np.random.default_rng(0).normal(0, 0.5, size=(1000, len(prof)))
+grade = InterpoladorLote(prof, sondas).grade(novos)
+for metodo in ("linear", "pchip", "cubica"):
+    lote = InterpoladorLote(prof, sondas, metodo=metodo)
+    perfis = lote(grade)   # (1000, 100)
+    print(f"{metodo}: {perfis.shape[0]} perfis x {perfis.shape[1]} profundidades, "
+          f"temperatura média a 15 cm = {lote(15.0).mean():.2f} °C")
+print("Igual ao interp1d:", np.allclose(InterpoladorLote(prof, temp)(novos)[0], f(novos)))
@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+"""
+Interpolação em lote de muitos perfis (ex.: temperatura x profundidade)
+Disciplina: ENG6001 - Introdução à Ciência de Dados com Python Aplicada à Engenharia Agrícola
+
+Descrição:
+    Em vez de um interp1d por sonda, todos os perfis medidos nos mesmos nós
+    (profundidades) são interpolados juntos:
+    - os coeficientes de cada trecho são calculados uma única vez para todos
+      os perfis: linear, PCHIP (scipy.interpolate.PchipInterpolator) ou spline
+      cúbica (CubicSpline), ambas com axis=1 sobre a matriz (perfis x nós)
+    - cada trecho vira um polinômio c0 + c1*d + c2*d² + c3*d³, com d = q - x_i
+    - as consultas passam por GradeConsulta: o trecho de cada ponto
+      (np.searchsorted), as consultas agrupadas por trecho, as potências
+      [1, d, d², d³] e a máscara de pontos fora do intervalo são calculados
+      uma vez e reaproveitados para todos os perfis e para outros
+      interpoladores com os mesmos nós
+    - como todos os perfis compartilham o trecho de cada consulta, a
+      avaliação de um trecho é um único produto matricial
+      (perfis x 4) @ (4 x consultas do trecho), sem indexação por consulta
+    - os perfis são processados em blocos de ELEMENTOS_POR_BLOCO // n_consultas
+      linhas, para limitar os temporários; a saída (perfis x consultas) é
+      alocada uma vez. Consultas fora de ordem são calculadas na ordem dos
+      trechos e devolvidas à ordem original com np.take linha a linha
+
+Uso:
+    from interpolacao_lote import InterpoladorLote
+    lote = InterpoladorLote(prof, perfis, metodo="pchip")   # perfis: (n_sondas, n_nós)
+    grade = lote.grade(np.linspace(0, 30, 1_000_000))
+    temperaturas = lote(grade)                               # (n_sondas, 1_000_000)
+"""
+
+import numpy as np
+from scipy.interpolate import CubicSpline, PchipInterpolator
+
+
+METODOS = ("linear", "pchip", "cubica")
+ELEMENTOS_POR_BLOCO = 1 << 22  # perfis x consultas de cada bloco temporário (~32 MB em float64)
+
+
+class GradeConsulta:
+    """
+    Pontos de consulta já localizados nos trechos de x.
+    - trecho: índice i do trecho [x_i, x_i+1] de cada ponto (extremos fora do
+      intervalo usam o primeiro/último trecho)
+    - ordem, limites: consultas ordenadas por trecho; as do trecho i são
+      ordem[limites[i]:limites[i + 1]] (ordem e inversa são None quando as
+      consultas já estão em ordem)
+    - potencias: [1, d, d², d³] de cada consulta, na ordem de `ordem`, com d = q - x_i
+    - fora: pontos fora de [x_0, x_n]
+    """
+
+    def __init__(self, x, q):
+        self.x = np.asarray(x, dtype=float)
+        self.q = np.asarray(q, dtype=float)
+        plano = self.q.ravel()
+        self.trecho = np.clip(np.searchsorted(self.x, plano, side="right") - 1, 0, len(self.x) - 2)
+        self.fora = (plano < self.x[0]) | (plano > self.x[-1]) | np.isnan(plano)
+
+        # consultas já em ordem (ex.: linspace) dispensam a permutação
+        self.ordenada = bool(np.all(np.diff(self.trecho) >= 0))
+        self.ordem = None if self.ordenada else np.argsort(self.trecho, kind="stable")
+        self.inversa = None if self.ordenada else np.argsort(self.ordem)
+        trecho = self.trecho if self.ordenada else self.trecho[self.ordem]
+        self.limites = np.searchsorted(trecho, np.arange(len(self.x)))
+        d = (plano if self.ordenada else plano[self.ordem]) - self.x[trecho]
+        self.potencias = np.column_stack([np.ones_like(d), d, d * d, d * d * d])
+
+    def __len__(self):
+        return self.trecho.size
+
+    def compativel(self, x) -> bool:
+        return self.x.shape == np.shape(x) and np.array_equal(self.x, x)
+
+
+class InterpoladorLote:
+    """
+    Interpolantes 1-D de vários perfis com os mesmos nós.
+    - x: nós (n,), estritamente crescentes (são ordenados se necessário)
+    - Y: valores (n_perfis, n) ou (n,) para um único perfil
+    - metodo: "linear", "pchip" ou "cubica"
+    - extrapolar: fora de [x_0, x_n] usa o polinômio do trecho extremo
+      (como o extrapolate do scipy); senão devolve valor_fora
+    - kwargs: repassados ao CubicSpline (ex.: bc_type="natural")
+    """
+
+    def __init__(self, x, Y, metodo="linear", extrapolar=False, valor_fora=np.nan, **kwargs):
+        if metodo not in METODOS:
+            raise ValueError(f"Método de interpolação desconhecido: {metodo} (use {METODOS})")
+        x = np.asarray(x, dtype=float)
+        Y = np.atleast_2d(np.asarray(Y, dtype=float))
+        if Y.shape[1] != len(x):
+            raise ValueError(f"Y tem {Y.shape[1]} colunas, mas há {len(x)} nós")
+        if len(x) < 2:
+            raise ValueError("São necessários pelo menos 2 nós")
+        ordem = np.argsort(x, kind="stable")
+        self.x, Y = x[ordem], Y[:, ordem]
+        if np.any(np.diff(self.x) <= 0):
+            raise ValueError("Os nós x precisam ser distintos")
+
+        self.metodo = metodo
+        self.extrapolar = extrapolar
+        self.valor_fora = valor_fora
+        self.coeficientes = self._coeficientes(Y, **kwargs)   # (n_perfis, n - 1, 4): c0..c3
+
+    def _coeficientes(self, Y, **kwargs) -> np.ndarray:
+        if self.metodo == "linear":
+            inclinacao = np.diff(Y, axis=1) / np.diff(self.x)
+            zeros = np.zeros_like(inclinacao)
+            return np.stack([Y[:, :-1], inclinacao, zeros, zeros], axis=-1)
+        if self.metodo == "pchip":
+            spline = PchipInterpolator(self.x, Y, axis=1)
+        else:
+            spline = CubicSpline(self.x, Y, axis=1, **kwargs)
+        # scipy guarda c (4, n - 1, n_perfis) do grau mais alto para o mais baixo
+        return np.ascontiguousarray(spline.c[::-1].transpose(2, 1, 0))
+
+    @property
+    def n_perfis(self) -> int:
+        return self.coeficientes.shape[0]
+
+    def grade(self, q) -> GradeConsulta:
+        """Localiza os pontos de consulta uma vez, para reutilizar entre chamadas."""
+        return GradeConsulta(self.x, q)
+
+    def _avaliar(self, c, q, perfis, tamanho_bloco, dtype) -> np.ndarray:
+        """Produto (perfis x 4) @ (4 x consultas) por trecho e bloco de perfis, com c (n_perfis, n - 1, 4)."""
+        grade = q if isinstance(q, GradeConsulta) else self.grade(q)
+        if not grade.compativel(self.x):
+            raise ValueError("A grade de consulta foi construída com outros nós")
+        if perfis is not None:
+            c = c[perfis]
+        n_perfis, m = c.shape[0], len(grade)
+        saida = np.empty((n_perfis, m), dtype=dtype)
+        if tamanho_bloco is None:
+            tamanho_bloco = max(1, ELEMENTOS_POR_BLOCO // max(m, 1))
+
+        for inicio in range(0, n_perfis, tamanho_bloco):
+            linhas = slice(inicio, min(inicio + tamanho_bloco, n_perfis))
+            # valores na ordem dos trechos: direto na saída se as consultas já estão em ordem
+            destino = saida[linhas] if grade.ordenada else np.empty((linhas.stop - inicio, m))
+            for i in range(len(self.x) - 1):
+                trecho = slice(grade.limites[i], grade.limites[i + 1])
+                if trecho.start < trecho.stop:
+                    destino[:, trecho] = c[linhas, i, :] @ grade.potencias[trecho].T
+            if not grade.ordenada:
+                for j, linha in enumerate(destino):
+                    np.take(linha, grade.inversa, out=saida[inicio + j])
+
+        if not self.extrapolar:
+            saida[:, grade.fora] = self.valor_fora
+        return saida.reshape((n_perfis,) + grade.q.shape)
+
+    def __call__(self, q, perfis=None, tamanho_bloco=None, dtype=float) -> np.ndarray:
+        """
+        Valores de todos os perfis (ou só dos índices em `perfis`) nos pontos q.
+        - q: pontos ou uma GradeConsulta com os mesmos nós
+        - tamanho_bloco: perfis por bloco (padrão: ELEMENTOS_POR_BLOCO // n_consultas)
+        - dtype: tipo da saída (float32 reduz a memória à metade)
+        Retorna (n_perfis, *q.shape).
+        """
+        return self._avaliar(self.coeficientes, q, perfis, tamanho_bloco, dtype)
+
+    def derivada(self, q, perfis=None, tamanho_bloco=None, dtype=float) -> np.ndarray:
+        """Primeira derivada (ex.: gradiente térmico) de todos os perfis nos pontos q."""
+        c = self.coeficientes
+        c_derivada = np.stack([c[..., 1], 2 * c[..., 2], 3 * c[..., 3], np.zeros_like(c[..., 0])], axis=-1)
+        return self._avaliar(c_derivada, q, perfis, tamanho_bloco, dtype)
@@ -0,0 +1,202 @@
+# -*- coding: utf-8 -*-
+"""
+ANOVA fatorial e de medidas repetidas com matriz de delineamento esparsa
+Disciplina: ENG6001 - Introdução à Ciência de Dados com Python Aplicada à Engenharia Agrícola
+
+Descrição:
+    Generaliza o f_oneway (um fator) para vários fatores e suas interações
+    (ex.: temperatura x velocidade do ar x tempo), com células desbalanceadas
+    ou vazias:
+    - cada termo (fator ou interação) vira um bloco de colunas indicadoras,
+      uma por célula observada, em uma matriz esparsa (scipy.sparse) com
+      poucos valores não nulos por linha
+    - os dados são percorridos uma única vez para formar as equações normais
+      X'X e X'y; X'X é pequena (colunas x colunas) e, para termos
+      categóricos, contém apenas contagens de células
+    - cada modelo comparado usa um subconjunto das colunas de X'X (resolvido
+      por autodecomposição, que também dá o posto quando há colunas
+      redundantes), sem voltar aos dados
+    - somas de quadrados Tipo II (padrão: cada termo ajustado para os termos
+      que não o contêm) ou Tipo I (sequenciais, na ordem dos termos)
+    - medidas repetidas: com `sujeito` (a unidade experimental, ex.:
+      temperatura + repeticao), os termos constantes dentro de cada sujeito
+      são testados contra o erro entre sujeitos e os demais contra o resíduo
+      dentro de sujeitos (parcela subdividida no tempo)
+    Fatores numéricos (como tempo_min) são tratados como categóricos.
+
+Uso:
+    from anova_fatorial import anova_fatorial
+    tabela = anova_fatorial(df, "razao_umidade", ["temperatura", "tempo_min"],
+                            sujeito=["temperatura", "repeticao"])
+    tabela = anova_fatorial(df, "umidade", ["temperatura_C", "velocidade_ar_m_s", "tempo_h"], ordem=2)
+"""
+
+from itertools import combinations
+
+import numpy as np
+import pandas as pd
+from scipy import sparse, stats
+
+
+SEPARADOR = ":"
+TERMO_RESIDUO = "Resíduo"
+TERMO_ERRO_SUJEITOS = "Erro entre sujeitos"
+
+
+# ---------------------------
+# Termos e matriz de delineamento
+# ---------------------------
+
+def termos_fatoriais(fatores, ordem=None) -> list:
+    """Efeitos principais e interações até `ordem` fatores (padrão: todas), em ordem hierárquica."""
+    fatores = list(fatores)
+    ordem = len(fatores) if ordem is None else ordem
+    return [termo for k in range(1, ordem + 1) for termo in combinations(fatores, k)]
+
+
+def nome_termo(termo) -> str:
+    return SEPARADOR.join(termo)
+
+
+def _celulas(codigos: dict, termo) -> np.ndarray:
+    """Código (0..m-1) da célula observada de cada linha para o termo (combinação de fatores)."""
+    niveis = [codigos[f].max() + 1 for f in termo]
+    combinado = np.ravel_multi_index([codigos[f] for f in termo], niveis)
+    return pd.factorize(combinado, sort=True)[0]
+
+
+def matriz_delineamento(df: pd.DataFrame, termos, sujeito=None):
+    """
+    Matriz esparsa (N, p) com o intercepto e um bloco de indicadoras por
+    termo (e pelo sujeito, se houver). Retorna (X, blocos), em que blocos
+    leva o nome do termo às suas colunas em X.
+    """
+    fatores = sorted({f for termo in termos for f in termo} | set(sujeito or ()))
+    codigos = {f: pd.factorize(df[f], sort=True)[0] for f in fatores}
+    blocos_termos = [(nome_termo(t), tuple(t)) for t in termos]
+    if sujeito:
+        blocos_termos.append((TERMO_ERRO_SUJEITOS, tuple(sujeito)))
+
+    N = len(df)
+    linhas, colunas, blocos = [np.arange(N)], [np.zeros(N, dtype=np.int64)], {"Intercepto": np.arange(1)}
+    inicio = 1
+    for nome, termo in blocos_termos:
+        celulas = _celulas(codigos, termo)
+        m = int(celulas.max()) + 1
+        linhas.append(np.arange(N))
+        colunas.append(inicio + celulas)
+        blocos[nome] = np.arange(inicio, inicio + m)
+        inicio += m
+    linhas, colunas = np.concatenate(linhas), np.concatenate(colunas)
+    X = sparse.csr_matrix((np.ones(len(linhas)), (linhas, colunas)), shape=(N, inicio))
+    return X, blocos
+
+
+# ---------------------------
+# Equações normais
+# ---------------------------
+
+def _sq_modelo(XtX: np.ndarray, Xty: np.ndarray, colunas: np.ndarray):
+    """
+    Soma de quadrados explicada (y'X b) e posto do modelo com as colunas dadas.
+    Pseudo-inversa por autodecomposição: colunas redundantes (indicadoras que
+    somam o intercepto, termos contidos em outros) não atrapalham.
+    """
+    A = XtX[np.ix_(colunas, colunas)]
+    v = Xty[colunas]
+    autovalores, autovetores = np.linalg.eigh(A)
+    mantidos = autovalores > autovalores.max() * len(colunas) * np.finfo(float).eps
+    projecao = autovetores[:, mantidos].T @ v
+    return float(np.sum(projecao ** 2 / autovalores[mantidos])), int(mantidos.sum())
+
+
+def _somas_quadrados(XtX, Xty, blocos, base, termos, tipo):
+    """
+    (sq, gl) de cada termo, comparando modelos que sempre contêm os blocos de `base`.
+    Tipo II: termo contra os termos que não o contêm; Tipo I: sequencial.
+    """
+    def colunas(nomes):
+        return np.concatenate([blocos[n] for n in base + nomes])
+
+    resultados = {}
+    for i, termo in enumerate(termos):
+        if tipo == 1:
+            anteriores = [nome_termo(t) for t in termos[:i]]
+        else:
+            anteriores = [nome_termo(t) for t in termos if not set(termo) <= set(t)]
+        sq_sem, posto_sem = _sq_modelo(XtX, Xty, colunas(anteriores))
+        sq_com, posto_com = _sq_modelo(XtX, Xty, colunas(anteriores + [nome_termo(termo)]))
+        resultados[nome_termo(termo)] = (max(sq_com - sq_sem, 0.0), posto_com - posto_sem)
+    return resultados
+
+
+def _termos_entre(df: pd.DataFrame, termos, sujeito) -> list:
+    """Termos cujos fatores são todos constantes dentro de cada sujeito."""
+    constantes = {f for f in {f for t in termos for f in t}
+                  if (df.groupby(list(sujeito), sort=False)[f].nunique(dropna=False) <= 1).all()}
+    return [t for t in termos if set(t) <= constantes]
+
+
+# ---------------------------
+# API principal
+# ---------------------------
+
+def anova_fatorial(df: pd.DataFrame, resposta: str, fatores, ordem=None, sujeito=None, tipo=2,
+                   termos=None) -> pd.DataFrame:
+    """
+    ANOVA fatorial de `resposta` com os fatores e interações até `ordem`.
+    - sujeito: coluna(s) que identificam a unidade medida repetidamente;
+      ativa os dois estratos de erro (entre e dentro de sujeitos)
+    - tipo: 2 (padrão) ou 1 (sequencial) para as somas de quadrados
+    - termos: lista explícita de termos (tuplas de fatores), no lugar de fatores/ordem
+    Linhas com valor ausente na resposta, nos fatores ou no sujeito são descartadas.
+    Retorna um DataFrame indexado pelo termo com gl, sq, qm, F, p (e estrato,
+    com sujeito).
+    """
+    if tipo not in (1, 2):
+        raise ValueError(f"Tipo de soma de quadrados não suportado: {tipo} (use 1 ou 2)")
+    termos = [tuple(t) for t in (termos_fatoriais(fatores, ordem) if termos is None else termos)]
+    sujeito = [sujeito] if isinstance(sujeito, str) else list(sujeito or [])
+    usadas = list(dict.fromkeys([resposta] + [f for t in termos for f in t] + sujeito))
+    dados = df[usadas].dropna()
+
+    X, blocos = matriz_delineamento(dados, termos, sujeito)
+    y = dados[resposta].to_numpy(dtype=float)
+    y = y - y.mean()                     # o intercepto está em todos os modelos
+    XtX = (X.T @ X).toarray()
+    Xty = X.T @ y
+    sq_total = float(y @ y)
+    N = len(y)
+
+    linhas = []
+    if not sujeito:
+        for nome, (sq, gl) in _somas_quadrados(XtX, Xty, blocos, ["Intercepto"], termos, tipo).items():
+            linhas.append((nome, gl, sq, TERMO_RESIDUO, None))
+        sq_modelo, posto = _sq_modelo(XtX, Xty, np.concatenate(list(blocos.values())))
+        linhas.append((TERMO_RESIDUO, N - posto, sq_total - sq_modelo, None, None))
+    else:
+        entre = _termos_entre(dados, termos, sujeito)
+        dentro = [t for t in termos if t not in entre]
+        for nome, (sq, gl) in _somas_quadrados(XtX, Xty, blocos, ["Intercepto"], entre, tipo).items():
+            linhas.append((nome, gl, sq, TERMO_ERRO_SUJEITOS, "entre"))
+        colunas_entre = np.concatenate([blocos["Intercepto"]] + [blocos[nome_termo(t)] for t in entre])
+        colunas_sujeitos = np.concatenate([colunas_entre, blocos[TERMO_ERRO_SUJEITOS]])
+        sq_entre, posto_entre = _sq_modelo(XtX, Xty, colunas_entre)
+        sq_sujeitos, posto_sujeitos = _sq_modelo(XtX, Xty, colunas_sujeitos)
+        linhas.append((TERMO_ERRO_SUJEITOS, posto_sujeitos - posto_entre, sq_sujeitos - sq_entre, None, "entre"))
+
+        base = ["Intercepto", TERMO_ERRO_SUJEITOS]
+        for nome, (sq, gl) in _somas_quadrados(XtX, Xty, blocos, base, dentro, tipo).items():
+            linhas.append((nome, gl, sq, TERMO_RESIDUO, "dentro"))
+        sq_modelo, posto = _sq_modelo(XtX, Xty, np.concatenate(list(blocos.values())))
+        linhas.append((TERMO_RESIDUO, N - posto, sq_total - sq_modelo, None, "dentro"))
+
+    tabela = pd.DataFrame(linhas, columns=["termo", "gl", "sq", "erro", "estrato"]).set_index("termo")
+    with np.errstate(invalid="ignore", divide="ignore"):
+        tabela["qm"] = tabela["sq"] / tabela["gl"]
+        qm_erro = tabela["erro"].map(tabela["qm"])
+        gl_erro = tabela["erro"].map(tabela["gl"])
+        tabela["F"] = tabela["qm"] / qm_erro
+    tabela["p"] = stats.f.sf(tabela["F"], tabela["gl"], gl_erro)
+    colunas = ["gl", "sq", "qm", "F", "p"] + (["estrato"] if sujeito else [])
+    return tabela[colunas]
@@ -0,0 +1,204 @@
+# -*- coding: utf-8 -*-
+"""
+ANOVA de um fator e comparações múltiplas para muitas variáveis-resposta de uma vez
+Disciplina: ENG6001 - Introdução à Ciência de Dados com Python Aplicada à Engenharia Agrícola
+
+Descrição:
+    Recebe uma tabela em formato longo (coluna de tratamento + uma coluna por
+    variável-resposta) e, para todas as respostas ao mesmo tempo:
+    - calcula a ANOVA de um fator (F e p) a partir das somas e somas de
+      quadrados por grupo, em matrizes (grupo x resposta), sem laço por variável
+    - faz todas as comparações par a par como operações matriciais sobre os
+      pares (i < j): teste t de duas amostras (o mesmo de stats.ttest_ind) e
+      Tukey HSD (Tukey-Kramer para grupos desbalanceados, com o QM do resíduo
+      da ANOVA)
+    - corrige os p-valores dos testes t por Bonferroni e Holm dentro de cada resposta
+    Valores ausentes são ignorados resposta a resposta.
+
+    A distribuição da amplitude studentizada (Tukey) é cara de avaliar (uma
+    integral numérica por valor). O quantil crítico é calculado uma vez por
+    combinação (número de grupos, gl do resíduo), e os p-valores de Tukey,
+    quando há muitos, saem de uma spline de log(sf) em função de sqrt(q),
+    ajustada em PONTOS_TUKEY pontos de 0 a Q_MAXIMO_GRADE por combinação
+    (erro relativo ~1e-6); valores acima da grade, conjuntos pequenos ou
+    tukey_exato=True são calculados diretamente.
+
+Uso:
+    from anova_lote import anova_lote, comparacoes_multiplas
+    anova = anova_lote(df, "tratamento")                    # uma linha por resposta
+    pares = comparacoes_multiplas(df, "tratamento")         # uma linha por resposta e par
+"""
+
+import numpy as np
+import pandas as pd
+from scipy import stats
+from scipy.interpolate import CubicSpline
+
+
+PONTOS_TUKEY = 64
+Q_MAXIMO_GRADE = 12.0
+
+
+# ---------------------------
+# Estatísticas por grupo
+# ---------------------------
+
+def resumo_grupos(df: pd.DataFrame, tratamento: str, respostas=None):
+    """
+    Contagem, média e soma de quadrados dos desvios (em torno da média do
+    grupo) de cada resposta em cada grupo, todas como matrizes (G, R).
+    Retorna (grupos, respostas, n, media, sq).
+    """
+    if respostas is None:
+        respostas = [c for c in df.select_dtypes(include=[np.number]).columns if c != tratamento]
+    respostas = list(respostas)
+    codigos, grupos = pd.factorize(df[tratamento], sort=True)
+    validos_linha = codigos >= 0
+
+    ordem = np.argsort(codigos[validos_linha], kind="stable")
+    Y = df[respostas].to_numpy(dtype=float)[validos_linha][ordem]
+    codigos = codigos[validos_linha][ordem]
+    tamanhos = np.bincount(codigos, minlength=len(grupos))
+    inicios = np.concatenate([[0], np.cumsum(tamanhos)[:-1]])
+
+    presente = ~np.isnan(Y)
+    Y0 = np.where(presente, Y, 0.0)
+    n = np.add.reduceat(presente, inicios, axis=0).astype(float)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        media = np.add.reduceat(Y0, inicios, axis=0) / n
+    desvio = np.where(presente, Y - np.repeat(media, tamanhos, axis=0), 0.0)
+    sq = np.add.reduceat(desvio ** 2, inicios, axis=0)
+    return list(grupos), respostas, n, media, sq
+
+
+def _anova(n, media, sq):
+    """ANOVA de um fator a partir das matrizes (G, R); devolve vetores por resposta."""
+    N = n.sum(axis=0)
+    k = (n > 0).sum(axis=0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        media_geral = np.nansum(n * media, axis=0) / N
+        sq_entre = np.nansum(n * (media - media_geral) ** 2, axis=0)
+        sq_dentro = sq.sum(axis=0)
+        gl_entre = k - 1
+        gl_dentro = N - k
+        qm_entre = sq_entre / gl_entre
+        qm_dentro = sq_dentro / gl_dentro
+        F = qm_entre / qm_dentro
+    p = stats.f.sf(F, gl_entre, gl_dentro)
+    return {
+        "gl_entre": gl_entre, "gl_dentro": gl_dentro,
+        "sq_entre": sq_entre, "sq_dentro": sq_dentro,
+        "qm_entre": qm_entre, "qm_dentro": qm_dentro,
+        "F": F, "p": p,
+    }
+
+
+# ---------------------------
+# API principal
+# ---------------------------
+
+def anova_lote(df: pd.DataFrame, tratamento: str, respostas=None) -> pd.DataFrame:
+    """
+    ANOVA de um fator de todas as respostas em uma passada.
+    - respostas: colunas analisadas (padrão: todas as numéricas exceto o tratamento)
+    Retorna um DataFrame indexado pela resposta, com gl, SQ, QM, F e p.
+    """
+    _, respostas, n, media, sq = resumo_grupos(df, tratamento, respostas)
+    return pd.DataFrame(_anova(n, media, sq), index=pd.Index(respostas, name="resposta"))
+
+
+def _tukey(q, k, gl, alpha=0.05, exato=False):
+    """
+    p-valores (sf) e quantil crítico da amplitude studentizada para a matriz
+    q (P, R), com k grupos e gl graus de liberdade do resíduo por resposta.
+    """
+    p = np.full(q.shape, np.nan)
+    q_critico = np.full(q.shape[1], np.nan)
+    validas = (k >= 2) & (gl > 0)
+    combinacoes = np.unique(np.column_stack([k, gl])[validas], axis=0)
+    for k_c, gl_c in combinacoes:
+        colunas = validas & (k == k_c) & (gl == gl_c)
+        q_critico[colunas] = stats.studentized_range.ppf(1 - alpha, k_c, gl_c)
+        bloco = q[:, colunas]
+        sf = np.full(bloco.shape, np.nan)
+        finitos = np.isfinite(bloco)
+        na_grade = finitos & (bloco <= Q_MAXIMO_GRADE) & (not exato) & (finitos.sum() > PONTOS_TUKEY)
+        if na_grade.any():
+            raiz = np.linspace(0.0, np.sqrt(bloco[na_grade].max()), PONTOS_TUKEY)
+            log_sf = np.log(np.maximum(stats.studentized_range.sf(raiz ** 2, k_c, gl_c), 1e-300))
+            sf[na_grade] = np.minimum(np.exp(CubicSpline(raiz, log_sf)(np.sqrt(bloco[na_grade]))), 1.0)
+        diretos = finitos & ~na_grade
+        sf[diretos] = stats.studentized_range.sf(bloco[diretos], k_c, gl_c)
+        p[:, colunas] = sf
+    return p, q_critico
+
+
+def corrigir_pvalores(p: np.ndarray, metodo="holm") -> np.ndarray:
+    """
+    Correção para comparações múltiplas ao longo do último eixo de p
+    (uma família de testes por linha): "bonferroni" ou "holm".
+    p-valores NaN (pares sem dados) ficam NaN e não entram no número de testes.
+    """
+    p = np.asarray(p, dtype=float)
+    m = np.sum(~np.isnan(p), axis=-1, keepdims=True)
+    if metodo == "bonferroni":
+        return np.minimum(p * m, 1.0)
+    if metodo != "holm":
+        raise ValueError(f"Método de correção desconhecido: {metodo}")
+    ordem = np.argsort(p, axis=-1)
+    p_ordenado = np.take_along_axis(p, ordem, axis=-1)
+    # argsort deixa os NaN no fim: os finitos recebem os fatores m, m - 1, ..., 1
+    ajustado = np.minimum(np.maximum.accumulate(p_ordenado * (m - np.arange(p.shape[-1])), axis=-1), 1.0)
+    saida = np.empty_like(ajustado)
+    np.put_along_axis(saida, ordem, ajustado, axis=-1)
+    return saida
+
+
+def comparacoes_multiplas(df: pd.DataFrame, tratamento: str, respostas=None, alpha=0.05,
+                          tukey_exato=False) -> pd.DataFrame:
+    """
+    Todas as comparações par a par de todas as respostas.
+    Colunas: resposta, grupo_a, grupo_b, diferenca (média a - média b),
+    t e p do teste t de duas amostras (variância combinada dos dois grupos,
+    como stats.ttest_ind), p_bonferroni e p_holm (corrigidos entre os pares
+    de cada resposta), e p_tukey, ic_inf, ic_sup do Tukey HSD (nível 1 - alpha).
+    """
+    grupos, respostas, n, media, sq = resumo_grupos(df, tratamento, respostas)
+    anova = _anova(n, media, sq)
+    a, b = np.triu_indices(len(grupos), k=1)        # pares (P,)
+
+    # matrizes (P, R)
+    diferenca = media[a] - media[b]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        gl_par = n[a] + n[b] - 2
+        s2_par = (sq[a] + sq[b]) / gl_par
+        t = diferenca / np.sqrt(s2_par * (1 / n[a] + 1 / n[b]))
+        p_t = 2 * stats.t.sf(np.abs(t), gl_par)
+
+        # Tukey-Kramer: erro padrão com o QM do resíduo de todos os grupos
+        k = (n > 0).sum(axis=0)
+        erro = np.sqrt(anova["qm_dentro"] / 2 * (1 / n[a] + 1 / n[b]))
+        q = np.abs(diferenca) / erro
+    p_tukey, q_critico = _tukey(q, k, anova["gl_dentro"], alpha, tukey_exato)
+    margem = q_critico * erro
+
+    # correções por resposta: famílias nas colunas → transpor para (R, P)
+    p_bonf = corrigir_pvalores(p_t.T, "bonferroni").T
+    p_holm = corrigir_pvalores(p_t.T, "holm").T
+
+    # uma linha por (resposta, par), respostas na ordem de entrada
+    P, R = diferenca.shape
+    grupos = np.asarray(grupos, dtype=object)
+    return pd.DataFrame({
+        "resposta": np.repeat(respostas, P),
+        "grupo_a": np.tile(grupos[a], R),
+        "grupo_b": np.tile(grupos[b], R),
+        "diferenca": diferenca.T.ravel(),
+        "t": t.T.ravel(),
+        "p": p_t.T.ravel(),
+        "p_bonferroni": p_bonf.T.ravel(),
+        "p_holm": p_holm.T.ravel(),
+        "p_tukey": p_tukey.T.ravel(),
+        "ic_inf": (diferenca - margem).T.ravel(),
+        "ic_sup": (diferenca + margem).T.ravel(),
+    })
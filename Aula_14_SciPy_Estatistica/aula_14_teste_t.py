@@ -11,7 +11,10 @@ Original file is located at
 
 # Importa as bibliotecas necessárias
 import numpy as np
+import pandas as pd
 from scipy import stats
+from anova_lote import anova_lote, comparacoes_multiplas
+from reamostragem import permutacao_anova, permutacao_pares, bootstrap_pares
 
 # --- 1. Simulação dos Dados do Experimento ---
 # Delineamento Inteiramente Casualizado (DIC)
@@ -90,4 +93,30 @@ if prosseguir_com_t_test:
             print(f"  - Conclusão: Diferença NÃO significativa entre {nome1} e {nome2}.")
         print()
 else:
-    print("\nComo a ANOVA não foi significativa, não se prossegue com os testes t par-a-par.")
\ No newline at end of file
+    print("\nComo a ANOVA não foi significativa, não se prossegue com os testes t par-a-par.")
+
+# Passo C: ANOVA e comparações múltiplas em lote
+# anova_lote/comparacoes_multiplas fazem os Passos A e B para qualquer número
+# de variáveis-resposta de uma vez, já com correções de Bonferroni/Holm e Tukey HSD.
+print("\n--- Passo C: ANOVA e comparações múltiplas em lote ---")
+dados_longos = pd.DataFrame({
+    "tratamento": np.repeat(["45°C", "50°C", "55°C"], num_amostras_por_tratamento),
+    "canabinoides": np.concatenate([tratamento_45C, tratamento_50C, tratamento_55C]),
+})
+print(anova_lote(dados_longos, "tratamento")[["F", "p"]].round(4).to_string())
+print()
+pares = comparacoes_multiplas(dados_longos, "tratamento", alpha=alpha)
+print(pares[["grupo_a", "grupo_b", "diferenca", "t", "p", "p_holm", "p_tukey"]].round(4).to_string(index=False))
+
+
+# Passo D: testes de permutação e intervalos bootstrap
+# Com só 10 plantas por tratamento, a suposição de normalidade dos testes t é
+# difícil de verificar; os p-valores de permutação e os IC bootstrap não dependem dela.
+print("\n--- Passo D: Permutação e bootstrap ---")
+anova_perm = permutacao_anova(dados_longos, "tratamento", n_permutacoes=10_000)
+print(anova_perm[["F", "p", "p_permutacao"]].round(4).to_string())
+print()
+pares_perm = permutacao_pares(dados_longos, "tratamento", n_permutacoes=10_000)
+ic_boot = bootstrap_pares(dados_longos, "tratamento", n_reamostras=10_000, nivel=1 - alpha)
+pares_perm[["ic_inf", "ic_sup"]] = ic_boot[["ic_inf", "ic_sup"]]
+print(pares_perm.drop(columns="resposta").round(4).to_string(index=False))
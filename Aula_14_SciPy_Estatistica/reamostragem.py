@@ -0,0 +1,283 @@
+# -*- coding: utf-8 -*-
+"""
+Testes de permutação e intervalos bootstrap para comparação de tratamentos
+Disciplina: ENG6001 - Introdução à Ciência de Dados com Python Aplicada à Engenharia Agrícola
+
+Descrição:
+    Versões não paramétricas da ANOVA e das comparações par a par de
+    anova_lote.py, para todas as variáveis-resposta de uma vez e sem supor
+    normalidade:
+    - permutacao_anova: p-valor de permutação da ANOVA de um fator
+    - permutacao_pares: p-valor de permutação da diferença de médias de cada
+      par (rótulos permutados só entre as linhas dos dois grupos), com Holm
+    - bootstrap_anova: IC bootstrap (percentil) do eta² de cada resposta
+    - bootstrap_pares: IC bootstrap (percentil) da diferença de médias de
+      cada par; reamostragem estratificada, com reposição dentro de cada grupo
+
+    Um bloco de reamostras é gerado de uma vez como matriz (B, N): rótulos
+    permutados (permutação) ou número de vezes que cada linha foi sorteada
+    (bootstrap). As somas por grupo de todas as respostas saem então de um
+    único produto matricial (B, G, N) @ (N, R), sem laço por reamostra ou
+    por resposta. As reamostras são processadas em blocos de tamanho_bloco,
+    o que limita a memória, e os blocos podem ser distribuídos entre
+    processos. Cada bloco tem sua própria semente (SeedSequence.spawn), então
+    o resultado não depende de n_processos.
+
+    Na permutação, só as contagens de estatísticas tão extremas quanto a
+    observada são guardadas; o p-valor é (1 + contagem) / (1 + B). No
+    bootstrap, a distribuição inteira é guardada em float32 (B x
+    estatísticas) para os percentis. Valores ausentes são ignorados
+    resposta a resposta.
+
+Uso:
+    from reamostragem import permutacao_anova, permutacao_pares, bootstrap_pares
+    anova = permutacao_anova(df, "tratamento", n_permutacoes=100_000, n_processos=4)
+    pares = permutacao_pares(df, "tratamento", n_permutacoes=100_000)
+    ic = bootstrap_pares(df, "tratamento", n_reamostras=10_000, nivel=0.95)
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from anova_lote import anova_lote, corrigir_pvalores
+
+
+TAMANHO_BLOCO = 1000
+TOLERANCIA = 1e-12  # estatísticas iguais à observada (a menos de arredondamento) contam como extremas
+
+# dados do experimento no processo trabalhador (ou no próprio processo, se serial)
+_dados = {}
+
+
+# ---------------------------
+# Preparação e execução em blocos
+# ---------------------------
+
+def _preparar(df: pd.DataFrame, tratamento: str, respostas=None) -> dict:
+    """Linhas ordenadas por grupo: códigos, valores (ausentes = 0) e indicadora de presença."""
+    if respostas is None:
+        respostas = [c for c in df.select_dtypes(include=[np.number]).columns if c != tratamento]
+    respostas = list(respostas)
+    codigos, grupos = pd.factorize(df[tratamento], sort=True)
+    validos = codigos >= 0
+    ordem = np.argsort(codigos[validos], kind="stable")
+    Y = df[respostas].to_numpy(dtype=float)[validos][ordem]
+    codigos = codigos[validos][ordem]
+    presente = ~np.isnan(Y)
+    a, b = np.triu_indices(len(grupos), k=1)
+    return {
+        "grupos": list(grupos), "respostas": respostas, "a": a, "b": b,
+        "codigos": codigos, "tamanhos": np.bincount(codigos, minlength=len(grupos)),
+        "Y": np.where(presente, Y, 0.0), "presente": presente.astype(float),
+    }
+
+
+def _iniciar_trabalhador(dados: dict):
+    _dados.clear()
+    _dados.update(dados)
+
+
+def _blocos(total: int, tamanho_bloco: int) -> list:
+    return [min(tamanho_bloco, total - inicio) for inicio in range(0, total, tamanho_bloco)]
+
+
+def _executar(funcao, tarefas: list, dados: dict, n_processos=1) -> list:
+    """Aplica funcao às tarefas com os dados disponíveis em _dados (serial ou em processos)."""
+    if n_processos == 1:
+        _iniciar_trabalhador(dados)
+        try:
+            return [funcao(t) for t in tarefas]
+        finally:
+            _dados.clear()
+    with ProcessPoolExecutor(max_workers=n_processos, initializer=_iniciar_trabalhador,
+                             initargs=(dados,)) as pool:
+        return list(pool.map(funcao, tarefas))
+
+
+def _somas_grupos(pesos: np.ndarray, Y: np.ndarray, presente: np.ndarray):
+    """pesos (B, G, N) → somas e contagens por grupo, ambas (B, G, R)."""
+    return pesos @ Y, pesos @ presente
+
+
+def _soma_entre(S: np.ndarray, n: np.ndarray) -> np.ndarray:
+    """Σ S²/n nos grupos (eixo -2); com o total fixo, cresce junto com a SQ entre grupos e o F."""
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(n > 0, S ** 2 / n, 0.0).sum(axis=-2)
+
+
+def _indicadoras(rotulos: np.ndarray, G: int) -> np.ndarray:
+    """rotulos (B, N) → indicadora (B, G, N) de cada grupo."""
+    return (rotulos[:, None, :] == np.arange(G)[None, :, None]).astype(float)
+
+
+def _observado(dados: dict):
+    """Somas e contagens por grupo (G, R) com os rótulos originais."""
+    S, n = _somas_grupos(_indicadoras(dados["codigos"][None, :], len(dados["grupos"])),
+                         dados["Y"], dados["presente"])
+    return S[0], n[0]
+
+
+def _tabela_pares(dados: dict, **colunas) -> pd.DataFrame:
+    """Uma linha por (resposta, par); colunas recebe matrizes (P, R)."""
+    P, R = len(dados["a"]), len(dados["respostas"])
+    grupos = np.asarray(dados["grupos"], dtype=object)
+    tabela = pd.DataFrame({
+        "resposta": np.repeat(dados["respostas"], P),
+        "grupo_a": np.tile(grupos[dados["a"]], R),
+        "grupo_b": np.tile(grupos[dados["b"]], R),
+    })
+    for nome, valores in colunas.items():
+        tabela[nome] = np.asarray(valores).T.ravel()
+    return tabela
+
+
+# ---------------------------
+# Tarefas (um bloco de reamostras cada)
+# ---------------------------
+
+def _bloco_permutacao_anova(args):
+    semente, tamanho = args
+    rng = np.random.default_rng(semente)
+    rotulos = rng.permuted(np.tile(_dados["codigos"], (tamanho, 1)), axis=1)
+    S, n = _somas_grupos(_indicadoras(rotulos, len(_dados["grupos"])), _dados["Y"], _dados["presente"])
+    estatistica = _soma_entre(S, n)
+    return (estatistica >= _dados["observada"] * (1 - TOLERANCIA)).sum(axis=0)
+
+
+def _bloco_permutacao_par(args):
+    par, semente, tamanho = args
+    rng = np.random.default_rng(semente)
+    a, b = _dados["a"][par], _dados["b"][par]
+    linhas = np.isin(_dados["codigos"], [a, b])
+    Y, presente = _dados["Y"][linhas], _dados["presente"][linhas]
+    base = _dados["codigos"][linhas] == a
+    em_a = rng.permuted(np.tile(base, (tamanho, 1)), axis=1).astype(float)
+    S_a, n_a = em_a @ Y, em_a @ presente
+    S_b, n_b = Y.sum(axis=0) - S_a, presente.sum(axis=0) - n_a
+    with np.errstate(invalid="ignore", divide="ignore"):
+        diferenca = np.abs(S_a / n_a - S_b / n_b)
+    return (diferenca >= _dados["observada"][par] * (1 - TOLERANCIA)).sum(axis=0)
+
+
+def _bloco_bootstrap(args):
+    """Médias por grupo (e, para o eta², somas de quadrados) de um bloco de reamostras estratificadas."""
+    semente, tamanho, com_quadrados = args
+    rng = np.random.default_rng(semente)
+    tamanhos = _dados["tamanhos"]
+    G, N = len(tamanhos), int(tamanhos.sum())
+    pesos = np.zeros((tamanho, G, N))
+    inicio = 0
+    for g, n_g in enumerate(tamanhos):
+        # quantas vezes cada linha do grupo foi sorteada, em cada reamostra
+        pesos[:, g, inicio:inicio + n_g] = rng.multinomial(n_g, np.full(n_g, 1 / n_g), size=tamanho)
+        inicio += n_g
+    S, n = _somas_grupos(pesos, _dados["Y"], _dados["presente"])
+    with np.errstate(invalid="ignore", divide="ignore"):
+        media = S / n
+    if not com_quadrados:
+        return media.astype(np.float32), None
+    Q = (pesos @ _dados["Y"] ** 2).sum(axis=1)
+    S_total, N_total = S.sum(axis=1), n.sum(axis=1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        sq_total = Q - S_total ** 2 / N_total
+        eta2 = (_soma_entre(S, n) - S_total ** 2 / N_total) / sq_total
+    return media.astype(np.float32), eta2.astype(np.float32)
+
+
+# ---------------------------
+# API principal
+# ---------------------------
+
+def permutacao_anova(df: pd.DataFrame, tratamento: str, respostas=None, n_permutacoes=10_000,
+                     tamanho_bloco=TAMANHO_BLOCO, n_processos=1, seed=42) -> pd.DataFrame:
+    """
+    ANOVA de um fator com p-valor de permutação (rótulos dos tratamentos
+    embaralhados entre todas as linhas).
+    Retorna a tabela de anova_lote com a coluna p_permutacao.
+    """
+    dados = _preparar(df, tratamento, respostas)
+    dados["observada"] = _soma_entre(*_observado(dados))
+
+    tamanhos = _blocos(n_permutacoes, tamanho_bloco)
+    sementes = np.random.SeedSequence(seed).spawn(len(tamanhos))
+    contagens = _executar(_bloco_permutacao_anova, list(zip(sementes, tamanhos)), dados, n_processos)
+
+    tabela = anova_lote(df, tratamento, dados["respostas"])
+    tabela["p_permutacao"] = (1 + np.sum(contagens, axis=0)) / (1 + n_permutacoes)
+    return tabela
+
+
+def permutacao_pares(df: pd.DataFrame, tratamento: str, respostas=None, n_permutacoes=10_000,
+                     tamanho_bloco=TAMANHO_BLOCO, n_processos=1, seed=42) -> pd.DataFrame:
+    """
+    Teste de permutação bilateral da diferença de médias de cada par de
+    grupos. Em cada par, só os rótulos das linhas dos dois grupos são
+    permutados. Colunas: resposta, grupo_a, grupo_b, diferenca,
+    p_permutacao e p_holm (Holm entre os pares de cada resposta).
+    """
+    dados = _preparar(df, tratamento, respostas)
+    a, b = dados["a"], dados["b"]
+    S, n = _observado(dados)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        media = S / n
+    diferenca = media[a] - media[b]                      # (P, R)
+    dados["observada"] = np.abs(diferenca)
+
+    tamanhos = _blocos(n_permutacoes, tamanho_bloco)
+    sementes = np.random.SeedSequence(seed).spawn(len(a) * len(tamanhos))
+    tarefas = [(par, sementes[par * len(tamanhos) + i], t)
+               for par in range(len(a)) for i, t in enumerate(tamanhos)]
+    contagens = _executar(_bloco_permutacao_par, tarefas, dados, n_processos)
+    contagens = np.reshape(contagens, (len(a), len(tamanhos), -1)).sum(axis=1)
+
+    p = (1 + contagens) / (1 + n_permutacoes)
+    p[np.isnan(diferenca)] = np.nan
+    return _tabela_pares(dados, diferenca=diferenca, p_permutacao=p,
+                         p_holm=corrigir_pvalores(p.T, "holm").T)
+
+
+def _distribuicao_bootstrap(dados: dict, n_reamostras, tamanho_bloco, n_processos, seed, com_eta2):
+    tamanhos = _blocos(n_reamostras, tamanho_bloco)
+    sementes = np.random.SeedSequence(seed).spawn(len(tamanhos))
+    tarefas = [(s, t, com_eta2) for s, t in zip(sementes, tamanhos)]
+    resultados = _executar(_bloco_bootstrap, tarefas, dados, n_processos)
+    medias = np.concatenate([m for m, _ in resultados])
+    eta2 = np.concatenate([e for _, e in resultados]) if com_eta2 else None
+    return medias, eta2
+
+
+def _percentis(distribuicao: np.ndarray, nivel: float):
+    alfa = (1 - nivel) / 2
+    return np.nanquantile(distribuicao, [alfa, 1 - alfa], axis=0).astype(float)
+
+
+def bootstrap_pares(df: pd.DataFrame, tratamento: str, respostas=None, n_reamostras=10_000, nivel=0.95,
+                    tamanho_bloco=TAMANHO_BLOCO, n_processos=1, seed=42) -> pd.DataFrame:
+    """
+    IC bootstrap percentil da diferença de médias de cada par de grupos.
+    Colunas: resposta, grupo_a, grupo_b, diferenca, ic_inf, ic_sup.
+    """
+    dados = _preparar(df, tratamento, respostas)
+    a, b = dados["a"], dados["b"]
+    S, n = _observado(dados)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        media = S / n
+    medias, _ = _distribuicao_bootstrap(dados, n_reamostras, tamanho_bloco, n_processos, seed, False)
+    ic_inf, ic_sup = _percentis(medias[:, a] - medias[:, b], nivel)
+    return _tabela_pares(dados, diferenca=media[a] - media[b], ic_inf=ic_inf, ic_sup=ic_sup)
+
+
+def bootstrap_anova(df: pd.DataFrame, tratamento: str, respostas=None, n_reamostras=10_000, nivel=0.95,
+                    tamanho_bloco=TAMANHO_BLOCO, n_processos=1, seed=42) -> pd.DataFrame:
+    """
+    Tamanho de efeito da ANOVA (eta² = SQ entre / SQ total) com IC bootstrap
+    percentil. Retorna a tabela de anova_lote com as colunas eta2, ic_inf, ic_sup.
+    """
+    dados = _preparar(df, tratamento, respostas)
+    _, eta2 = _distribuicao_bootstrap(dados, n_reamostras, tamanho_bloco, n_processos, seed, True)
+    tabela = anova_lote(df, tratamento, dados["respostas"])
+    tabela["eta2"] = tabela["sq_entre"] / (tabela["sq_entre"] + tabela["sq_dentro"])
+    tabela["ic_inf"], tabela["ic_sup"] = _percentis(eta2, nivel)
+    return tabela
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+"""
+Camada de agregação dos dados de secagem
+Disciplina: ENG6001 - Introdução à Ciência de Dados com Python Aplicada à Engenharia Agrícola
+
+Descrição:
+    Calcula, em uma única passada agrupada, média, desvio padrão e contagem de
+    todas as colunas medidas por (temperatura, tempo_min) e guarda o resultado.
+    Gráficos, resumos impressos e ajustes de modelos leem desse cache em vez
+    de refiltrar o DataFrame (df[df['temperatura'] == temp]) e reagrupar por
+    tempo a cada uso.
+
+Uso:
+    from agregacao_secagem import ResumoSecagem
+    resumo = ResumoSecagem(df_clean)
+    medias, desvios = resumo.curva(50, 'razao_umidade')
+"""
+
+from functools import cached_property
+
+import pandas as pd
+
+
+COLUNAS_MEDIDAS = ["umidade_percentual", "massa_g", "razao_umidade"]
+
+
+class ResumoSecagem:
+    """
+    Estatísticas por (temperatura, tempo_min) calculadas sob demanda e em cache.
+    - df: dados em formato longo (uma linha por leitura)
+    - chave: colunas de agrupamento (a última é o tempo)
+    - colunas: colunas medidas a resumir
+    """
+
+    def __init__(self, df: pd.DataFrame, chave=("temperatura", "tempo_min"), colunas=None):
+        self.df = df
+        self.chave = list(chave)
+        self.colunas = list(COLUNAS_MEDIDAS if colunas is None else colunas)
+
+    @cached_property
+    def estatisticas(self) -> pd.DataFrame:
+        """Tabela indexada por (temperatura, tempo_min) com colunas (coluna, estatística)."""
+        return (self.df.groupby(self.chave, sort=True)[self.colunas]
+                .agg(["mean", "std", "count"]))
+
+    @cached_property
+    def temperaturas(self) -> list:
+        """Temperaturas presentes, em ordem crescente."""
+        return self.estatisticas.index.get_level_values(0).unique().tolist()
+
+    @cached_property
+    def _por_temperatura(self) -> dict:
+        """Fatias da tabela de estatísticas por temperatura (índice = tempo_min)."""
+        return {temp: bloco.droplevel(0)
+                for temp, bloco in self.estatisticas.groupby(level=0, sort=True)}
+
+    def curva(self, temperatura, coluna="razao_umidade"):
+        """Médias e desvios de coluna ao longo do tempo para uma temperatura."""
+        bloco = self._por_temperatura[temperatura][coluna]
+        return bloco["mean"], bloco["std"]
+
+    def medias(self, coluna="razao_umidade") -> pd.DataFrame:
+        """Curvas médias em formato longo (temperatura, tempo_min, coluna), para ajustes."""
+        return self.estatisticas[(coluna, "mean")].rename(coluna).reset_index()
+
+    def valor_final(self, coluna="umidade_percentual") -> pd.Series:
+        """Média de coluna no último tempo registrado de cada temperatura."""
+        return pd.Series({temp: bloco[(coluna, "mean")].iloc[-1]
+                          for temp, bloco in self._por_temperatura.items()}, name=coluna)
+
+    def valor_inicial(self, coluna="umidade_percentual") -> float:
+        """Média de coluna no primeiro tempo, considerando todas as leituras."""
+        primeiros = pd.concat([bloco.iloc[[0]] for bloco in self._por_temperatura.values()])
+        soma = (primeiros[(coluna, "mean")] * primeiros[(coluna, "count")]).sum()
+        return soma / primeiros[(coluna, "count")].sum()
@@ -0,0 +1,574 @@
+# -*- coding: utf-8 -*-
+"""
+Motor de ajuste em lote de modelos de cinética de secagem
+Disciplina: ENG6001 - Introdução à Ciência de Dados com Python Aplicada à Engenharia Agrícola
+
+Descrição:
+    Ajusta os modelos de Henderson-Pabis, Page e Newton a todos os grupos de um
+    DataFrame em formato longo (ex.: um grupo por temperatura, repetição e lote)
+    em uma única chamada. Em vez de um curve_fit por grupo, os grupos são
+    empilhados em matrizes (grupo x ponto) e resolvidos juntos por um
+    Levenberg-Marquardt vetorizado com jacobianos analíticos.
+
+    O resultado é uma tabela "tidy" com uma linha por (grupo, modelo):
+    parâmetros, erros padrão, R², RMSE e MAE, além do número de iterações e
+    de avaliações do jacobiano usadas por cada ajuste (o jacobiano só é
+    recalculado depois de um passo aceito; cada iteração avalia os resíduos
+    uma vez, mais uma avaliação inicial).
+
+    Por padrão o chute inicial de cada grupo vem de mínimos quadrados sobre o
+    modelo linearizado (ln MR x t para Henderson-Pabis e Newton, ln(-ln MR) x
+    ln t para Page), o que reduz iterações e falhas de convergência.
+
+    Com n_processos > 1 as tarefas (bloco de grupos, modelo) são distribuídas
+    em um pool de processos; a ordem e os valores do resultado são idênticos
+    aos do caminho serial, pois cada grupo é ajustado de forma independente.
+
+    ajustar_arrhenius ajusta um modelo cinético global a todos os pontos de
+    todas as temperaturas de uma vez, com k dependente da temperatura pela
+    equação de Arrhenius, k(T) = k_ref * exp(-Ea/R * (1/T - 1/T_ref)), em vez
+    de um k por temperatura seguido de uma regressão de ln k em 1/T. A
+    temperatura de referência T_ref (média de 1/T) reduz a correlação entre
+    ln k_ref e Ea. A matriz de covariância dos parâmetros é propagada (método
+    delta) para k0 e para k(T) em qualquer temperatura.
+
+Uso:
+    from ajuste_secagem import ajustar_modelos, ajustar_arrhenius
+    resultados = ajustar_modelos(df, chave=["temperatura", "repeticao"])
+    resultados = ajustar_modelos(df, chave=["temperatura", "repeticao"], n_processos=32)
+    arrhenius = ajustar_arrhenius(df, temperatura="temperatura")   # uma linha por modelo
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+
+# ---------------------------
+# Modelos e jacobianos analíticos
+# ---------------------------
+
+def henderson_pabis(t, a, k):
+    """Modelo de Henderson e Pabis: MR = a * exp(-k * t)"""
+    return a * np.exp(-k * t)
+
+
+def jac_henderson_pabis(t, a, k):
+    """Derivadas de Henderson e Pabis em relação a (a, k)"""
+    e = np.exp(-k * t)
+    return np.stack([e, -a * t * e], axis=-1)
+
+
+def page(t, a, k, n):
+    """Modelo de Page: MR = a * exp(-k * t^n)"""
+    return a * np.exp(-k * np.power(t, n))
+
+
+def jac_page(t, a, k, n):
+    """Derivadas de Page em relação a (a, k, n)"""
+    tn = np.power(t, n)
+    e = np.exp(-k * tn)
+    log_t = np.log(np.where(t > 0, t, 1.0))  # t^n * ln(t) -> 0 quando t -> 0
+    return np.stack([e, -a * tn * e, -a * k * tn * log_t * e], axis=-1)
+
+
+def newton(t, a, k, b):
+    """Modelo de Newton: MR = a * exp(-k * t) + b"""
+    return a * np.exp(-k * t) + b
+
+
+def jac_newton(t, a, k, b):
+    """Derivadas de Newton em relação a (a, k, b)"""
+    e = np.exp(-k * t)
+    return np.stack([e, -a * t * e, np.ones_like(e)], axis=-1)
+
+
+class ModeloExponencialAssintotico:
+    """
+    Modelo exponencial de 1ª ordem com umidade inicial conhecida:
+        U(t) = U_eq + (U_0 - U_eq) * exp(-k * t)
+    U_0 é capturado uma única vez como float na construção, de modo que cada
+    avaliação feita pelo curve_fit é só aritmética NumPy.
+    """
+
+    nomes_parametros = ("U_eq", "k")
+
+    def __init__(self, U_0):
+        self.U_0 = float(U_0)
+
+    def __call__(self, t, U_eq, k):
+        return U_eq + (self.U_0 - U_eq) * np.exp(-k * t)
+
+    def jacobiano(self, t, U_eq, k):
+        """Derivadas em relação a (U_eq, k); formato (n_pontos, 2) aceito por curve_fit(jac=...)"""
+        t = np.asarray(t, dtype=float)
+        e = np.exp(-k * t)
+        return np.stack([1 - e, -(self.U_0 - U_eq) * t * e], axis=-1)
+
+
+# nome -> (função, jacobiano, nomes dos parâmetros, chute inicial padrão)
+MODELOS = {
+    "Henderson-Pabis": (henderson_pabis, jac_henderson_pabis, ("a", "k"), (1.0, 0.01)),
+    "Page": (page, jac_page, ("a", "k", "n"), (1.0, 0.01, 1.0)),
+    "Newton": (newton, jac_newton, ("a", "k", "b"), (1.0, 0.01, 0.05)),
+}
+
+
+CONSTANTE_GASES = 8.314  # J/(mol·K)
+ZERO_CELSIUS = 273.15
+
+
+class ModeloArrhenius:
+    """
+    Modelo de secagem com k(T) de Arrhenius, para ajuste global:
+        Henderson-Pabis: MR = a * exp(-k(T) * t)
+        Page:            MR = a * exp(-k(T) * t^n)
+        Newton:          MR = a * exp(-k(T) * t) + b
+        k(T) = exp(ln_k_ref - Ea/R * (1/T - 1/T_ref))
+    A temperatura (K) de cada ponto é capturada na construção, como o U_0 de
+    ModeloExponencialAssintotico; as chamadas recebem só t e os parâmetros.
+    """
+
+    def __init__(self, nome_base: str, temperatura_K, T_ref=None):
+        if nome_base not in MODELOS:
+            raise ValueError(f"Modelo desconhecido: {nome_base} (use {list(MODELOS)})")
+        self.nome_base = nome_base
+        inverso = 1.0 / np.asarray(temperatura_K, dtype=float)
+        self.T_ref = float(1.0 / inverso.mean()) if T_ref is None else float(T_ref)
+        self.x = (inverso - 1.0 / self.T_ref) / CONSTANTE_GASES   # k = k_ref * exp(-Ea * x)
+        extra = MODELOS[nome_base][2][2:]                          # n (Page) ou b (Newton)
+        self.nomes_parametros = ("a", "ln_k_ref", "Ea") + extra
+
+    def k(self, ln_k_ref, Ea):
+        return np.exp(ln_k_ref - Ea * self.x)
+
+    def __call__(self, t, a, ln_k_ref, Ea, *extra):
+        k = self.k(ln_k_ref, Ea)
+        if self.nome_base == "Newton":
+            return newton(t, a, k, extra[0])
+        return MODELOS[self.nome_base][0](t, a, k, *extra)
+
+    def jacobiano(self, t, a, ln_k_ref, Ea, *extra):
+        """Derivadas em relação a (a, ln_k_ref, Ea[, n ou b]) pela regra da cadeia sobre o modelo base"""
+        k = self.k(ln_k_ref, Ea)
+        J = MODELOS[self.nome_base][1](t, a, k, *extra)    # (..., a, k, [n|b])
+        dk = J[..., 1] * k                                 # dMR/dln_k_ref = dMR/dk * k
+        colunas = [J[..., 0], dk, -dk * self.x] + [J[..., j] for j in range(2, J.shape[-1])]
+        return np.stack(colunas, axis=-1)
+
+
+# ---------------------------
+# Chutes iniciais por linearização
+# ---------------------------
+
+def _reta_ponderada(X, Z, W):
+    """Mínimos quadrados de Z = b0 + b1 * X por grupo, só nos pontos com W=True."""
+    X = np.where(W, X, 0.0)
+    Z = np.where(W, Z, 0.0)
+    n = W.sum(axis=1)
+    sx, sz = X.sum(axis=1), Z.sum(axis=1)
+    sxx, sxz = (X * X).sum(axis=1), (X * Z).sum(axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        b1 = (n * sxz - sx * sz) / (n * sxx - sx ** 2)
+        b0 = (sz - b1 * sx) / n
+    return b0, b1
+
+
+def chute_henderson_pabis(T, Y, M):
+    """ln(MR) = ln(a) - k * t"""
+    W = M & (Y > 0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        b0, b1 = _reta_ponderada(T, np.log(Y), W)
+    return np.column_stack([np.exp(b0), -b1])
+
+
+def chute_page(T, Y, M):
+    """ln(-ln(MR)) = ln(k) + n * ln(t), com a = 1 e pontos 0 < MR < 1, t > 0"""
+    W = M & (Y > 0) & (Y < 1) & (T > 0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        b0, b1 = _reta_ponderada(np.log(T), np.log(-np.log(Y)), W)
+    return np.column_stack([np.ones(len(T)), np.exp(b0), b1])
+
+
+def chute_newton(T, Y, M):
+    """b = metade do menor MR; depois ln(MR - b) = ln(a) - k * t"""
+    b = 0.5 * np.maximum(np.min(np.where(M, Y, np.inf), axis=1), 0.0)
+    ak = chute_henderson_pabis(T, Y - b[:, None], M)
+    return np.column_stack([ak, b])
+
+
+# chutes fixos usados antes da linearização (p0 do curve_fit original)
+CHUTES_FIXOS = {nome: m[3] for nome, m in MODELOS.items()}
+
+CHUTES = {
+    "Henderson-Pabis": chute_henderson_pabis,
+    "Page": chute_page,
+    "Newton": chute_newton,
+}
+
+
+def chute_arrhenius(modelo: ModeloArrhenius, t, y, temperatura_K) -> np.ndarray:
+    """
+    Chute do ajuste global pelo caminho em duas etapas, só com linearizações:
+    parâmetros de cada temperatura (chute_inicial) e reta de ln k em x = (1/T - 1/T_ref)/R.
+    a e n/b são as médias entre temperaturas.
+    """
+    dados = pd.DataFrame({"T": temperatura_K, "t": t, "y": y, "x": modelo.x})
+    _, T, Y, M = _empilhar_grupos(dados, "T", "t", "y")
+    por_temperatura = chute_inicial(modelo.nome_base, T, Y, M)
+    x = dados.groupby("T", sort=True)["x"].first().to_numpy()
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ln_k = np.log(por_temperatura[:, 1])
+    validos = np.isfinite(ln_k)
+    b0, b1 = _reta_ponderada(x[None, :], np.where(validos, ln_k, 0.0)[None, :], validos[None, :])
+    Ea = -b1[0] if np.isfinite(b1[0]) else 0.0
+    ln_k_ref = b0[0] if np.isfinite(b0[0]) else np.log(MODELOS[modelo.nome_base][3][1])
+    extra = list(np.mean(por_temperatura[:, 2:], axis=0))
+    return np.array([np.mean(por_temperatura[:, 0]), ln_k_ref, Ea] + extra)
+
+
+def chute_inicial(nome_modelo: str, T, Y, M) -> np.ndarray:
+    """
+    Chute inicial (n_grupos, n_parâmetros) por linearização. Grupos em que a
+    linearização não é possível (poucos pontos, valores fora do domínio do
+    logaritmo) recebem o chute padrão de MODELOS.
+    """
+    p_padrao = np.asarray(MODELOS[nome_modelo][3], dtype=float)
+    theta0 = CHUTES[nome_modelo](T, Y, M)
+    invalido = ~np.all(np.isfinite(theta0), axis=1)
+    theta0[invalido] = p_padrao
+    return theta0
+
+
+# ---------------------------
+# Funções auxiliares
+# ---------------------------
+
+def _empilhar_grupos(df: pd.DataFrame, chave, x: str, y: str):
+    """
+    Converte o DataFrame longo em matrizes (n_grupos, n_max) de x e y, mais a
+    máscara dos pontos válidos. Os grupos ficam na ordem de groupby(sort=True).
+    """
+    grupos = df.groupby(chave, sort=True)
+    # pandas 3 devolve os códigos como float, com NaN (antes -1) nas chaves com NaN
+    codigos = grupos.ngroup().to_numpy(dtype=float)
+    chaves = grupos.size().index.to_frame(index=False)
+
+    validos = codigos >= 0  # chaves com NaN ficam de fora (dropna do groupby)
+    codigos = codigos[validos].astype(np.intp)
+    xv = df[x].to_numpy(dtype=float)[validos]
+    yv = df[y].to_numpy(dtype=float)[validos]
+
+    ordem = np.argsort(codigos, kind="stable")
+    codigos = codigos[ordem]
+    contagem = np.bincount(codigos, minlength=len(chaves))
+    inicio = np.concatenate([[0], np.cumsum(contagem)[:-1]])
+    posicao = np.arange(len(codigos)) - inicio[codigos]
+
+    n_max = int(contagem.max()) if len(contagem) else 0
+    T = np.zeros((len(chaves), n_max))
+    Y = np.zeros((len(chaves), n_max))
+    M = np.zeros((len(chaves), n_max), dtype=bool)
+    T[codigos, posicao] = xv[ordem]
+    Y[codigos, posicao] = yv[ordem]
+    M[codigos, posicao] = True
+    return chaves, T, Y, M
+
+
+def _residuos(func, T, Y, M, theta):
+    with np.errstate(all="ignore"):
+        pred = func(T, *(theta[:, j, None] for j in range(theta.shape[1])))
+    return np.where(M, Y - pred, 0.0)
+
+
+def _jacobiano(jac, T, M, theta):
+    with np.errstate(all="ignore"):
+        J = jac(T, *(theta[:, j, None] for j in range(theta.shape[1])))
+    return np.where(M[..., None], J, 0.0)
+
+
+def _resolver(A, g):
+    """
+    Resolve A @ d = g para uma pilha de sistemas. Se algum sistema for singular,
+    cada um é resolvido isoladamente (pinv só para os singulares), de modo que o
+    resultado de um grupo não depende dos demais grupos da pilha.
+    """
+    try:
+        return np.linalg.solve(A, g[..., None])[..., 0]
+    except np.linalg.LinAlgError:
+        d = np.empty_like(g)
+        for i in range(len(A)):
+            try:
+                d[i] = np.linalg.solve(A[i], g[i])
+            except np.linalg.LinAlgError:
+                d[i] = np.linalg.pinv(A[i]) @ g[i]
+        return d
+
+
+def _levenberg_marquardt(func, jac, T, Y, M, theta0, max_iter=200, ftol=1e-12, xtol=1e-12):
+    """
+    Levenberg-Marquardt aplicado a todos os grupos ao mesmo tempo.
+    Cada grupo tem seu próprio amortecimento e critério de parada; grupos que
+    já convergiram deixam de ser atualizados.
+    O jacobiano (J'J e J'r) só é recalculado nos grupos cujo theta mudou: um
+    passo rejeitado apenas aumenta o amortecimento e reaproveita o anterior.
+    Retorna theta, soma dos quadrados dos resíduos, indicador de convergência,
+    número de iterações e número de avaliações do jacobiano por grupo.
+    """
+    theta = np.array(theta0, dtype=float)
+    lam = np.full(len(theta), 1e-3)
+    r = _residuos(func, T, Y, M, theta)
+    custo = np.sum(r ** 2, axis=1)
+    ativo = np.isfinite(custo)
+    convergiu = np.zeros(len(theta), dtype=bool)
+    n_iter = np.zeros(len(theta), dtype=int)
+    n_jac = np.zeros(len(theta), dtype=int)
+    p = theta.shape[1]
+    JtJ_grupos = np.zeros((len(theta), p, p))
+    g_grupos = np.zeros((len(theta), p))
+    recalcular = np.ones(len(theta), dtype=bool)
+
+    for _ in range(max_iter):
+        idx = np.flatnonzero(ativo)
+        if idx.size == 0:
+            break
+        novos_j = idx[recalcular[idx]]
+        if novos_j.size:
+            J = _jacobiano(jac, T[novos_j], M[novos_j], theta[novos_j])
+            JtJ_grupos[novos_j] = np.matmul(J.transpose(0, 2, 1), J)
+            g_grupos[novos_j] = np.matmul(J.transpose(0, 2, 1), r[novos_j][..., None])[..., 0]
+            n_jac[novos_j] += 1
+            recalcular[novos_j] = False
+        th = theta[idx]
+        JtJ, g = JtJ_grupos[idx], g_grupos[idx]
+
+        diag = np.diagonal(JtJ, axis1=1, axis2=2)
+        A = JtJ + lam[idx, None, None] * (np.eye(th.shape[1]) * np.maximum(diag, 1e-12)[:, None, :])
+        delta = _resolver(A, g)
+        novo = th + delta
+
+        r_novo = _residuos(func, T[idx], Y[idx], M[idx], novo)
+        custo_novo = np.sum(r_novo ** 2, axis=1)
+        n_iter[idx] += 1
+        aceito = np.isfinite(custo_novo) & (custo_novo <= custo[idx])
+
+        passo_pequeno = np.all(np.abs(delta) <= xtol * (np.abs(th) + xtol), axis=1)
+        queda_pequena = aceito & ((custo[idx] - custo_novo) <= ftol * custo[idx])
+
+        ok = idx[aceito]
+        theta[ok] = novo[aceito]
+        r[ok] = r_novo[aceito]
+        custo[ok] = custo_novo[aceito]
+        recalcular[ok] = True
+        lam[idx] = np.where(aceito, lam[idx] / 10, lam[idx] * 10)
+
+        fim = passo_pequeno | queda_pequena
+        convergiu[idx[fim]] = True
+        ativo[idx[fim | (lam[idx] > 1e16)]] = False
+
+    return theta, custo, convergiu, n_iter, n_jac
+
+
+def _metricas(func, jac, T, Y, M, theta, custo):
+    """Erros padrão (como no curve_fit), R², RMSE e MAE por grupo."""
+    n = M.sum(axis=1)
+    p = theta.shape[1]
+    J = _jacobiano(jac, T, M, theta)
+    JtJ = np.matmul(J.transpose(0, 2, 1), J)
+    cov = np.linalg.pinv(JtJ)
+    gl = n - p
+    with np.errstate(divide="ignore", invalid="ignore"):
+        s2 = np.where(gl > 0, custo / np.maximum(gl, 1), np.inf)
+        erros = np.sqrt(np.diagonal(cov, axis1=1, axis2=2) * s2[:, None])
+
+        r = _residuos(func, T, Y, M, theta)
+        media = np.sum(np.where(M, Y, 0.0), axis=1) / n
+        sst = np.sum(np.where(M, (Y - media[:, None]) ** 2, 0.0), axis=1)
+        r2 = 1 - custo / sst
+        rmse = np.sqrt(custo / n)
+        mae = np.sum(np.abs(r), axis=1) / n
+    return erros, r2, rmse, mae, n
+
+
+# ---------------------------
+# API principal
+# ---------------------------
+
+def ajustar_grupos(nome_modelo: str, T, Y, M, p0=None, max_iter=200) -> dict:
+    """
+    Ajusta um modelo a grupos já empilhados em matrizes (n_grupos, n_max).
+    - p0: chute inicial comum a todos os grupos, ou None para usar o chute
+      linearizado de cada grupo (chute_inicial)
+    Retorna um dicionário de arrays (um valor por grupo).
+    """
+    func, jac, nomes, _ = MODELOS[nome_modelo]
+    if p0 is None:
+        theta0 = chute_inicial(nome_modelo, T, Y, M)
+    else:
+        theta0 = np.broadcast_to(np.asarray(p0, dtype=float), (len(T), len(nomes)))
+
+    theta, custo, convergiu, n_iter, n_jac = _levenberg_marquardt(
+        func, jac, T, Y, M, theta0, max_iter=max_iter)
+    erros, r2, rmse, mae, n = _metricas(func, jac, T, Y, M, theta, custo)
+
+    saida = {"modelo": np.full(len(T), nome_modelo, dtype=object)}
+    for j, nome in enumerate(nomes):
+        saida[nome] = theta[:, j]
+    for j, nome in enumerate(nomes):
+        saida[f"erro_{nome}"] = erros[:, j]
+    saida.update({"r2": r2, "rmse": rmse, "mae": mae, "n_pontos": n, "convergiu": convergiu,
+                  "n_iter": n_iter, "n_jac": n_jac})
+    return saida
+
+
+def _tarefa_ajuste(args):
+    """Executa ajustar_grupos em um processo do pool (precisa ser global para o pickle)."""
+    nome_modelo, T, Y, M, p0, max_iter = args
+    return ajustar_grupos(nome_modelo, T, Y, M, p0=p0, max_iter=max_iter)
+
+
+def ajustar_modelos(df: pd.DataFrame, chave, x="tempo_min", y="razao_umidade",
+                    modelos=None, p0=None, max_iter=200,
+                    n_processos=1, grupos_por_tarefa=None) -> pd.DataFrame:
+    """
+    Ajusta os modelos de secagem a todos os grupos de df em uma única chamada.
+    - chave: coluna (ou lista de colunas) que define os grupos
+    - x, y: colunas de tempo e de razão de umidade
+    - modelos: nomes de MODELOS a ajustar (padrão: todos)
+    - p0: dicionário nome_modelo -> chute inicial fixo; modelos ausentes usam o
+      chute linearizado de cada grupo. Use p0=CHUTES_FIXOS para reproduzir os
+      chutes fixos antigos.
+    - n_processos: processos do pool (1 = serial; <= 0 usa todos os núcleos)
+    - grupos_por_tarefa: grupos enviados em cada tarefa do pool (padrão:
+      divide os grupos igualmente, com ~4 tarefas por processo e modelo)
+    Retorna uma linha por (grupo, modelo) com as colunas da chave, modelo,
+    parâmetros, erro_<parâmetro>, r2, rmse, mae, n_pontos, convergiu, n_iter
+    e n_jac.
+    """
+    modelos = list(MODELOS) if modelos is None else list(modelos)
+    p0 = {} if p0 is None else p0
+    chaves, T, Y, M = _empilhar_grupos(df, chave, x, y)
+
+    if n_processos is None or n_processos <= 0:
+        n_processos = os.cpu_count() or 1
+
+    if n_processos == 1:
+        resultados = [ajustar_grupos(nome, T, Y, M, p0=p0.get(nome), max_iter=max_iter)
+                      for nome in modelos]
+    else:
+        if grupos_por_tarefa is None:
+            grupos_por_tarefa = max(1, -(-len(T) // (4 * n_processos)))
+        fatias = [slice(i, i + grupos_por_tarefa) for i in range(0, len(T), grupos_por_tarefa)]
+        tarefas = [(nome, T[f], Y[f], M[f], p0.get(nome), max_iter)
+                   for nome in modelos for f in fatias]
+        with ProcessPoolExecutor(max_workers=n_processos) as pool:
+            partes = list(pool.map(_tarefa_ajuste, tarefas))  # map preserva a ordem
+
+        resultados = []
+        for i in range(len(modelos)):
+            blocos = partes[i * len(fatias):(i + 1) * len(fatias)]
+            resultados.append({col: np.concatenate([b[col] for b in blocos]) for col in blocos[0]})
+
+    tabelas = [pd.concat([chaves, pd.DataFrame(res)], axis=1) for res in resultados]
+    resultado = pd.concat(tabelas, ignore_index=True)
+    ordem = chaves.columns.tolist()
+    resultado = resultado.sort_values(ordem, kind="stable").reset_index(drop=True)
+    colunas_param = [c for c in ("a", "k", "n", "b") if c in resultado.columns]
+    colunas_erro = [f"erro_{c}" for c in colunas_param]
+    return resultado[ordem + ["modelo"] + colunas_param + colunas_erro
+                     + ["r2", "rmse", "mae", "n_pontos", "convergiu", "n_iter", "n_jac"]]
+
+
+def prever(nome_modelo: str, t, parametros):
+    """Avalia o modelo nome_modelo em t com a sequência de parâmetros dada."""
+    func = MODELOS[nome_modelo][0]
+    return func(np.asarray(t, dtype=float), *parametros)
+
+
+# ---------------------------
+# Ajuste global com Arrhenius
+# ---------------------------
+
+def ajuste_global(nome_modelo: str, t, y, temperatura_K, T_ref=None, p0=None, max_iter=200) -> dict:
+    """
+    Ajusta ModeloArrhenius(nome_modelo) a todos os pontos em um único problema
+    de mínimos quadrados (o Levenberg-Marquardt em lote com um só grupo).
+    - t, y, temperatura_K: um valor por ponto
+    - p0: chute (a, ln_k_ref, Ea[, n ou b]); None usa chute_arrhenius
+    Retorna um dicionário com o modelo, parâmetros, erros padrão, a matriz de
+    covariância (como no curve_fit), métricas e diagnósticos do ajuste.
+    """
+    t = np.asarray(t, dtype=float)
+    y = np.asarray(y, dtype=float)
+    modelo = ModeloArrhenius(nome_modelo, temperatura_K, T_ref)
+    theta0 = chute_arrhenius(modelo, t, y, temperatura_K) if p0 is None else np.asarray(p0, dtype=float)
+
+    T, Y, M = t[None, :], y[None, :], np.ones((1, len(t)), dtype=bool)
+    theta, custo, convergiu, n_iter, n_jac = _levenberg_marquardt(
+        modelo, modelo.jacobiano, T, Y, M, theta0[None, :], max_iter=max_iter)
+    erros, r2, rmse, mae, n = _metricas(modelo, modelo.jacobiano, T, Y, M, theta, custo)
+
+    J = _jacobiano(modelo.jacobiano, T, M, theta)[0]
+    gl = len(t) - len(theta0)
+    covariancia = np.linalg.pinv(J.T @ J) * (custo[0] / gl if gl > 0 else np.inf)
+    return {
+        "modelo": modelo, "parametros": theta[0], "erros": erros[0], "covariancia": covariancia,
+        "r2": r2[0], "rmse": rmse[0], "mae": mae[0], "n_pontos": int(n[0]),
+        "convergiu": bool(convergiu[0]), "n_iter": int(n_iter[0]), "n_jac": int(n_jac[0]),
+    }
+
+
+def k_arrhenius(ajuste: dict, temperatura_K):
+    """
+    k(T) do ajuste global e seu erro padrão, propagado da covariância de
+    (ln_k_ref, Ea). Com temperatura_K = inf devolve k0 (fator pré-exponencial).
+    """
+    modelo = ajuste["modelo"]
+    x = (1.0 / np.asarray(temperatura_K, dtype=float) - 1.0 / modelo.T_ref) / CONSTANTE_GASES
+    ln_k_ref, Ea = ajuste["parametros"][1:3]
+    C = ajuste["covariancia"][1:3, 1:3]
+    ln_k = ln_k_ref - Ea * x
+    var_ln_k = C[0, 0] - 2 * x * C[0, 1] + x ** 2 * C[1, 1]     # gradiente (1, -x)
+    k = np.exp(ln_k)
+    return k, k * np.sqrt(var_ln_k)
+
+
+def ajustar_arrhenius(df: pd.DataFrame, x="tempo_min", y="razao_umidade", temperatura="temperatura",
+                      modelos=None, celsius=True, T_ref=None, max_iter=200, retornar_ajustes=False):
+    """
+    Ajuste global de cada modelo (Henderson-Pabis, Page, Newton) com k(T) de
+    Arrhenius, usando todas as linhas de df (todas as repetições).
+    - temperatura: coluna de temperatura, em °C (celsius=True) ou K
+    - T_ref: temperatura de referência em K (padrão: média harmônica das temperaturas)
+    - retornar_ajustes: devolve também {modelo: ajuste} (saída de ajuste_global),
+      para usar em k_arrhenius sem ajustar de novo
+    Retorna uma linha por modelo com a, ln_k_ref, Ea (J/mol), n ou b, k_ref,
+    k0 e os erros padrão de todos eles, T_ref, r2, rmse, mae, n_pontos,
+    convergiu, n_iter e n_jac.
+    """
+    modelos = list(MODELOS) if modelos is None else list(modelos)
+    dados = df[[x, y, temperatura]].dropna()
+    temperatura_K = dados[temperatura].to_numpy(dtype=float) + (ZERO_CELSIUS if celsius else 0.0)
+
+    linhas, ajustes = [], {}
+    for nome in modelos:
+        ajuste = ajustes[nome] = ajuste_global(nome, dados[x], dados[y], temperatura_K, T_ref,
+                                               max_iter=max_iter)
+        nomes = ajuste["modelo"].nomes_parametros
+        linha = {"modelo": nome}
+        linha.update(dict(zip(nomes, ajuste["parametros"])))
+        linha.update({f"erro_{p}": e for p, e in zip(nomes, ajuste["erros"])})
+        (k_ref, k0), (erro_k_ref, erro_k0) = k_arrhenius(ajuste, [ajuste["modelo"].T_ref, np.inf])
+        linha.update({"k_ref": k_ref, "erro_k_ref": erro_k_ref, "k0": k0, "erro_k0": erro_k0,
+                      "T_ref": ajuste["modelo"].T_ref})
+        linha.update({c: ajuste[c] for c in ("r2", "rmse", "mae", "n_pontos", "convergiu", "n_iter", "n_jac")})
+        linhas.append(linha)
+
+    resultado = pd.DataFrame(linhas)
+    colunas_param = [c for c in ("a", "ln_k_ref", "Ea", "n", "b", "k_ref", "k0") if c in resultado.columns]
+    colunas_erro = [f"erro_{c}" for c in colunas_param]
+    resultado = resultado[["modelo"] + colunas_param + colunas_erro
+                          + ["T_ref", "r2", "rmse", "mae", "n_pontos", "convergiu", "n_iter", "n_jac"]]
+    return (resultado, ajustes) if retornar_ajustes else resultado
@@ -1,5 +1,7 @@
 import pandas as pd
 import numpy as np
+from graficos_secagem import configurar_renderizacao, mostrar_ou_salvar
+configurar_renderizacao()  # FIGDIR definido -> figuras salvas em arquivo
 import matplotlib.pyplot as plt
 from scipy.optimize import curve_fit
 
@@ -35,7 +37,7 @@ plt.ylabel("Umidade (kg água/kg ms)")
 plt.title("Curva de Secagem - Folhas Medicinais")
 plt.legend()
 plt.grid(True)
-plt.show()
+mostrar_ou_salvar('curva_secagem')
 
 # ---------------------------
 # 5. Ajuste de modelo com SciPy
@@ -48,8 +50,11 @@ def modelo_exponencial(t, k):
 umidade_inicial = dados["umidade"].iloc[0]
 MR = dados["umidade"] / umidade_inicial
 
+# Chute inicial pela linearização ln(MR) = -k*t (mínimos quadrados pela origem)
+k_inicial = -np.sum(dados["tempo"] * np.log(MR)) / np.sum(dados["tempo"] ** 2)
+
 # Ajuste do modelo
-parametros, _ = curve_fit(modelo_exponencial, dados["tempo"], MR, p0=[0.1])
+parametros, _ = curve_fit(modelo_exponencial, dados["tempo"], MR, p0=[k_inicial])
 k_otimo = parametros[0]
 
 print(f"\nParâmetro ajustado (k): {k_otimo:.4f}")
@@ -63,4 +68,4 @@ plt.ylabel("Razão de Umidade (MR)")
 plt.title("Ajuste de Modelo de Secagem")
 plt.legend()
 plt.grid(True)
-plt.show()
+mostrar_ou_salvar('ajuste_exponencial')
@@ -4,10 +4,17 @@
 
 import pandas as pd
 import numpy as np
+from graficos_secagem import (configurar_renderizacao, mostrar_ou_salvar,
+                              modo_headless, renderizar_em_paralelo,
+                              figura_ajuste_temperatura)
+configurar_renderizacao()  # FIGDIR definido -> backend Agg, figuras salvas em arquivo
 import matplotlib.pyplot as plt
 import seaborn as sns
-from scipy.optimize import curve_fit
-from scipy import stats
+from simulador_secagem import simular_secagem
+from ajuste_secagem import (MODELOS, ZERO_CELSIUS, ajustar_arrhenius, ajustar_modelos,
+                            k_arrhenius, prever)
+from agregacao_secagem import ResumoSecagem
+from limpeza_secagem import REGRAS_SECAGEM, aplicar_regras, mascara_outliers
 import warnings
 warnings.filterwarnings('ignore')
 
@@ -23,57 +30,15 @@ print("Planta Medicinal: Melissa officinalis (Erva-cidreira)")
 print("="*60)
 
 # Parâmetros do experimento simulado
-np.random.seed(42)  # Para reprodutibilidade
 temperaturas = [40, 50, 60, 70]  # °C
 n_repeticoes = 5
 tempo_max = 300  # minutos
 
-dados_simulados = []
-
-for temp in temperaturas:
-    for rep in range(1, n_repeticoes + 1):
-        # Parâmetros do modelo de Henderson e Pabis modificado
-        # MR = a * exp(-k * t) + c
-        if temp == 40:
-            a, k, c = 0.95 + np.random.normal(0, 0.02), 0.008 + np.random.normal(0, 0.001), 0.05
-        elif temp == 50:
-            a, k, c = 0.96 + np.random.normal(0, 0.02), 0.012 + np.random.normal(0, 0.001), 0.04
-        elif temp == 60:
-            a, k, c = 0.97 + np.random.normal(0, 0.02), 0.018 + np.random.normal(0, 0.002), 0.03
-        else:  # 70°C
-            a, k, c = 0.98 + np.random.normal(0, 0.02), 0.025 + np.random.normal(0, 0.002), 0.02
-        
-        # Tempos de amostragem (minutos)
-        tempos = np.array([0, 15, 30, 45, 60, 90, 120, 150, 180, 210, 240, 270, 300])
-        
-        for t in tempos:
-            # Razão de umidade (MR) com ruído
-            mr = a * np.exp(-k * t) + c + np.random.normal(0, 0.01)
-            mr = max(0.02, mr)  # Limitar valor mínimo
-            
-            # Umidade inicial típica: 80-85% (base úmida)
-            umidade_inicial = 82 + np.random.normal(0, 1)
-            # Umidade de equilíbrio típica: 3-8% (base úmida)
-            umidade_equilibrio = 5 + np.random.normal(0, 0.5)
-            
-            # Umidade atual
-            umidade_atual = (mr * (umidade_inicial - umidade_equilibrio)) + umidade_equilibrio
-            
-            # Massa atual (considerando massa seca constante de 10g)
-            massa_seca = 10  # g
-            massa_atual = massa_seca * (1 + umidade_atual/100) / (1 - umidade_atual/100)
-            
-            dados_simulados.append({
-                'temperatura': temp,
-                'repeticao': rep,
-                'tempo_min': t,
-                'umidade_percentual': round(umidade_atual, 2),
-                'massa_g': round(massa_atual, 3),
-                'razao_umidade': round(mr, 4)
-            })
-
-# Criação do DataFrame
-df = pd.DataFrame(dados_simulados)
+# Simulação vetorizada do modelo de Henderson e Pabis modificado
+# MR = a * exp(-k * t) + c, avaliado de uma vez sobre a grade
+# (temperatura x repetição x tempo) -- ver simulador_secagem.py
+df = simular_secagem(temperaturas=temperaturas, n_repeticoes=n_repeticoes,
+                     seed=42)  # Para reprodutibilidade
 
 # Salvando os dados simulados em CSV
 df.to_csv('dados_secagem_simulados.csv', index=False)
@@ -84,8 +49,9 @@ print("\n" + "="*50)
 print("2. IMPORTAÇÃO DOS DADOS")
 print("="*50)
 
-# Carregando os dados do CSV
-df_raw = pd.read_csv('dados_secagem_simulados.csv')
+# Os dados já estão em memória: não há necessidade de reler o CSV recém-salvo
+# (para dados externos, use pd.read_csv('dados_secagem_simulados.csv'))
+df_raw = df
 print(f"✓ Dados importados: {df_raw.shape[0]} linhas, {df_raw.shape[1]} colunas")
 print(f"✓ Temperaturas testadas: {sorted(df_raw['temperatura'].unique())}°C")
 print(f"✓ Número de repetições: {df_raw['repeticao'].nunique()}")
@@ -100,26 +66,21 @@ print("="*50)
 print("Valores ausentes por coluna:")
 print(df_raw.isnull().sum())
 
-# Verificação de outliers usando Z-score
-def detectar_outliers(df, coluna, threshold=3):
-    z_scores = np.abs(stats.zscore(df[coluna]))
-    return df[z_scores > threshold]
+# Verificação de outliers usando Z-score (todas as colunas em uma passada;
+# use grupos=['temperatura', 'tempo_min'] e robusto=True para escores por
+# condição experimental com mediana/MAD)
+outliers = mascara_outliers(df_raw, ['umidade_percentual', 'massa_g'], limite=3,
+                            por_coluna=True)
 
-outliers_umidade = detectar_outliers(df_raw, 'umidade_percentual')
-outliers_massa = detectar_outliers(df_raw, 'massa_g')
+print(f"\n✓ Outliers detectados em umidade: {outliers['umidade_percentual'].sum()}")
+print(f"✓ Outliers detectados em massa: {outliers['massa_g'].sum()}")
 
-print(f"\n✓ Outliers detectados em umidade: {len(outliers_umidade)}")
-print(f"✓ Outliers detectados em massa: {len(outliers_massa)}")
-
-# Limpeza: remover valores inconsistentes
-df_clean = df_raw.copy()
-
-# Filtrar valores fisicamente impossíveis
-df_clean = df_clean[df_clean['umidade_percentual'] >= 0]
-df_clean = df_clean[df_clean['umidade_percentual'] <= 100]
-df_clean = df_clean[df_clean['massa_g'] > 0]
-df_clean = df_clean[df_clean['razao_umidade'] >= 0]
+# Limpeza: remover valores fisicamente impossíveis. As regras (faixas válidas
+# do esquema) ficam em REGRAS_SECAGEM e são aplicadas com uma única máscara
+df_clean, rejeicoes = aplicar_regras(df_raw, REGRAS_SECAGEM)
 
+for regra, n_rejeitadas in rejeicoes.items():
+    print(f"  Regra '{regra}': {n_rejeitadas} linhas rejeitadas")
 print(f"✓ Dados após limpeza: {df_clean.shape[0]} linhas")
 
 # 4. ANÁLISE EXPLORATÓRIA DOS DADOS
@@ -139,9 +100,13 @@ resumo_temp = df_clean.groupby('temperatura').agg({
     'razao_umidade': ['mean', 'std']
 }).round(3)
 
-for temp in sorted(df_clean['temperatura'].unique()):
-    dados_temp = df_clean[df_clean['temperatura'] == temp]
-    print(f"{temp}°C: Umidade final média = {dados_temp[dados_temp['tempo_min'] == dados_temp['tempo_min'].max()]['umidade_percentual'].mean():.2f}%")
+# Estatísticas por (temperatura, tempo) calculadas uma única vez e reutilizadas
+# nos gráficos, nos ajustes e no relatório final (ver agregacao_secagem.py)
+resumo = ResumoSecagem(df_clean)
+umidade_final = resumo.valor_final('umidade_percentual')
+
+for temp in resumo.temperaturas:
+    print(f"{temp}°C: Umidade final média = {umidade_final[temp]:.2f}%")
 
 # 5. VISUALIZAÇÃO DOS DADOS
 print("\n" + "="*50)
@@ -156,11 +121,9 @@ fig.suptitle('Análise de Secagem de Folhas de Planta Medicinal\n(Melissa offici
 # Gráfico 1: Curvas de secagem (Razão de Umidade vs Tempo)
 ax1 = axes[0, 0]
 cores = ['#1f77b4', '#ff7f0e', '#2ca02c', '#d62728']
-for i, temp in enumerate(sorted(df_clean['temperatura'].unique())):
-    dados_temp = df_clean[df_clean['temperatura'] == temp]
-    # Calcular médias por tempo
-    medias = dados_temp.groupby('tempo_min')['razao_umidade'].mean()
-    stds = dados_temp.groupby('tempo_min')['razao_umidade'].std()
+for i, temp in enumerate(resumo.temperaturas):
+    # Médias e desvios por tempo (do cache)
+    medias, stds = resumo.curva(temp, 'razao_umidade')
     
     ax1.errorbar(medias.index, medias.values, yerr=stds.values, 
                 label=f'{temp}°C', marker='o', capsize=5, color=cores[i])
@@ -173,10 +136,8 @@ ax1.grid(True, alpha=0.3)
 
 # Gráfico 2: Perda de massa
 ax2 = axes[0, 1]
-for i, temp in enumerate(sorted(df_clean['temperatura'].unique())):
-    dados_temp = df_clean[df_clean['temperatura'] == temp]
-    medias = dados_temp.groupby('tempo_min')['massa_g'].mean()
-    stds = dados_temp.groupby('tempo_min')['massa_g'].std()
+for i, temp in enumerate(resumo.temperaturas):
+    medias, stds = resumo.curva(temp, 'massa_g')
     
     ax2.errorbar(medias.index, medias.values, yerr=stds.values, 
                 label=f'{temp}°C', marker='s', capsize=5, color=cores[i])
@@ -189,9 +150,8 @@ ax2.grid(True, alpha=0.3)
 
 # Gráfico 3: Taxa de secagem
 ax3 = axes[1, 0]
-for i, temp in enumerate(sorted(df_clean['temperatura'].unique())):
-    dados_temp = df_clean[df_clean['temperatura'] == temp]
-    medias = dados_temp.groupby('tempo_min')['umidade_percentual'].mean()
+for i, temp in enumerate(resumo.temperaturas):
+    medias, _ = resumo.curva(temp, 'umidade_percentual')
     
     # Calcular taxa de secagem (derivada numérica)
     tempos = medias.index.values
@@ -216,87 +176,62 @@ ax4.set_ylabel('Umidade Final (%)')
 ax4.set_title('Distribuição da Umidade Final')
 
 plt.tight_layout()
-plt.show()
+mostrar_ou_salvar('analise_exploratoria')
 
 # 6. AJUSTE DE MODELOS COM SCIPY
 print("\n" + "="*50)
 print("6. AJUSTE DE MODELOS MATEMÁTICOS")
 print("="*50)
 
-# Definição dos modelos matemáticos
-def henderson_pabis(t, a, k):
-    """Modelo de Henderson e Pabis: MR = a * exp(-k * t)"""
-    return a * np.exp(-k * t)
+# Modelos matemáticos (definidos em ajuste_secagem.py, com jacobianos analíticos):
+#   Henderson-Pabis: MR = a * exp(-k * t)
+#   Page:            MR = a * exp(-k * t^n)
+#   Newton:          MR = a * exp(-k * t) + b
 
-def page(t, a, k, n):
-    """Modelo de Page: MR = a * exp(-k * t^n)"""
-    return a * np.exp(-k * np.power(t, n))
+# Curvas médias por temperatura, em formato longo
+dados_medios = resumo.medias('razao_umidade')
 
-def newton(t, a, k, b):
-    """Modelo de Newton: MR = a * exp(-k * t) + b"""
-    return a * np.exp(-k * t) + b
+# Ajuste de todos os modelos para todas as temperaturas em uma única chamada
+tabela_ajustes = ajustar_modelos(dados_medios, chave='temperatura')
 
 # Dicionário para armazenar resultados
 resultados_modelos = {}
 
-# Ajuste para cada temperatura
-for temp in sorted(df_clean['temperatura'].unique()):
+for temp, ajustes_temp in tabela_ajustes.groupby('temperatura', sort=True):
     print(f"\nAjuste para {temp}°C:")
     print("-" * 30)
-    
-    # Dados para a temperatura específica
-    dados_temp = df_clean[df_clean['temperatura'] == temp]
-    dados_medios = dados_temp.groupby('tempo_min')['razao_umidade'].mean().reset_index()
-    
-    t_data = dados_medios['tempo_min'].values
-    mr_data = dados_medios['razao_umidade'].values
-    
-    # Ajuste dos modelos
-    modelos = {
-        'Henderson-Pabis': (henderson_pabis, [1.0, 0.01]),
-        'Page': (page, [1.0, 0.01, 1.0]),
-        'Newton': (newton, [1.0, 0.01, 0.05])
-    }
-    
+
+    t_data = resumo.curva(temp, 'razao_umidade')[0].index.values
     temp_resultados = {}
-    
-    for nome_modelo, (func, p0) in modelos.items():
-        try:
-            # Ajuste da curva
-            popt, pcov = curve_fit(func, t_data, mr_data, p0=p0, maxfev=5000)
-            
-            # Predição
-            mr_pred = func(t_data, *popt)
-            
-            # Cálculo de métricas
-            r2 = 1 - np.sum((mr_data - mr_pred)**2) / np.sum((mr_data - np.mean(mr_data))**2)
-            rmse = np.sqrt(np.mean((mr_data - mr_pred)**2))
-            mae = np.mean(np.abs(mr_data - mr_pred))
-            
-            # Erro padrão dos parâmetros
-            param_errors = np.sqrt(np.diag(pcov))
-            
-            temp_resultados[nome_modelo] = {
-                'parametros': popt,
-                'erro_parametros': param_errors,
-                'r2': r2,
-                'rmse': rmse,
-                'mae': mae,
-                'predicao': mr_pred
-            }
-            
-            # Exibir resultados
-            print(f"{nome_modelo}:")
-            for i, (param, erro) in enumerate(zip(popt, param_errors)):
-                print(f"  Parâmetro {i+1}: {param:.6f} ± {erro:.6f}")
-            print(f"  R²: {r2:.4f}")
-            print(f"  RMSE: {rmse:.6f}")
-            print(f"  MAE: {mae:.6f}")
-            print()
-            
-        except Exception as e:
-            print(f"Erro no ajuste do modelo {nome_modelo}: {e}")
-    
+
+    for _, linha in ajustes_temp.iterrows():
+        nome_modelo = linha['modelo']
+        if not linha['convergiu']:
+            print(f"Erro no ajuste do modelo {nome_modelo}: não convergiu")
+            continue
+
+        nomes_param = MODELOS[nome_modelo][2]
+        popt = linha[list(nomes_param)].to_numpy(dtype=float)
+        param_errors = linha[[f"erro_{p}" for p in nomes_param]].to_numpy(dtype=float)
+
+        temp_resultados[nome_modelo] = {
+            'parametros': popt,
+            'erro_parametros': param_errors,
+            'r2': linha['r2'],
+            'rmse': linha['rmse'],
+            'mae': linha['mae'],
+            'predicao': prever(nome_modelo, t_data, popt)
+        }
+
+        # Exibir resultados
+        print(f"{nome_modelo}:")
+        for i, (param, erro) in enumerate(zip(popt, param_errors)):
+            print(f"  Parâmetro {i+1}: {param:.6f} ± {erro:.6f}")
+        print(f"  R²: {linha['r2']:.4f}")
+        print(f"  RMSE: {linha['rmse']:.6f}")
+        print(f"  MAE: {linha['mae']:.6f}")
+        print()
+
     resultados_modelos[temp] = temp_resultados
 
 # Identificar melhor modelo para cada temperatura
@@ -313,15 +248,13 @@ for temp in sorted(resultados_modelos.keys()):
 fig, axes = plt.subplots(2, 2, figsize=(16, 12))
 fig.suptitle('Ajuste de Modelos Matemáticos de Secagem', fontsize=16, fontweight='bold')
 
-for i, temp in enumerate(sorted(df_clean['temperatura'].unique())):
+for i, temp in enumerate(resumo.temperaturas):
     ax = axes[i//2, i%2]
     
-    # Dados experimentais
-    dados_temp = df_clean[df_clean['temperatura'] == temp]
-    dados_medios = dados_temp.groupby('tempo_min')['razao_umidade'].mean().reset_index()
-    
-    t_data = dados_medios['tempo_min'].values
-    mr_data = dados_medios['razao_umidade'].values
+    # Dados experimentais (médias do cache)
+    medias, _ = resumo.curva(temp, 'razao_umidade')
+    t_data = medias.index.values
+    mr_data = medias.values
     
     # Plotar dados experimentais
     ax.scatter(t_data, mr_data, color='black', s=50, alpha=0.7, label='Dados Experimentais')
@@ -342,75 +275,90 @@ for i, temp in enumerate(sorted(df_clean['temperatura'].unique())):
     ax.grid(True, alpha=0.3)
 
 plt.tight_layout()
-plt.show()
+mostrar_ou_salvar('ajuste_modelos')
+
+# Em modo headless, um painel por temperatura (renderizados em paralelo
+# conforme FIGURAS_PROCESSOS)
+if modo_headless():
+    paineis = []
+    for temp in resumo.temperaturas:
+        medias, _ = resumo.curva(temp, 'razao_umidade')
+        curvas = {nome: (res['predicao'], res['r2'])
+                  for nome, res in resultados_modelos[temp].items()}
+        paineis.append({'temperatura': temp, 't_data': medias.index.values,
+                        'mr_data': medias.values, 'curvas': curvas})
+    arquivos = renderizar_em_paralelo(figura_ajuste_temperatura, paineis,
+                                      [f"ajuste_{temp}C" for temp in resumo.temperaturas])
+    print(f"✓ {len(arquivos)} painéis de ajuste salvos")
 
 # Análise da influência da temperatura nos parâmetros
 print("\n" + "="*50)
 print("7. ANÁLISE DA INFLUÊNCIA DA TEMPERATURA")
 print("="*50)
 
-# Extrair constante de secagem (k) do modelo de Henderson-Pabis
-k_values = []
-temperaturas_k = []
-
-for temp in sorted(resultados_modelos.keys()):
-    if 'Henderson-Pabis' in resultados_modelos[temp]:
-        k = resultados_modelos[temp]['Henderson-Pabis']['parametros'][1]
-        k_values.append(k)
-        temperaturas_k.append(temp)
+# k de cada temperatura (ajustes separados, Henderson-Pabis), para comparação
+temperaturas_k = [temp for temp in sorted(resultados_modelos.keys())
+                  if 'Henderson-Pabis' in resultados_modelos[temp]]
+k_values = [resultados_modelos[temp]['Henderson-Pabis']['parametros'][1] for temp in temperaturas_k]
 
 if len(k_values) > 1:
-    # Ajuste da equação de Arrhenius: k = k0 * exp(-Ea/(R*T))
-    # Linearização: ln(k) = ln(k0) - Ea/(R*T)
-    T_kelvin = np.array(temperaturas_k) + 273.15
-    ln_k = np.log(k_values)
-    
-    # Regressão linear
-    slope, intercept, r_value, p_value, std_err = stats.linregress(1/T_kelvin, ln_k)
-    
-    R = 8.314  # J/(mol·K)
-    Ea = -slope * R  # Energia de ativação (J/mol)
-    k0 = np.exp(intercept)
-    
-    print(f"Análise de Arrhenius:")
-    print(f"Energia de ativação (Ea): {Ea:.2f} J/mol ({Ea/1000:.2f} kJ/mol)")
-    print(f"Fator pré-exponencial (k0): {k0:.6f} min⁻¹")
-    print(f"Coeficiente de correlação (R): {r_value:.4f}")
-    
-    # Gráfico de Arrhenius
+    # Ajuste global: k(T) = k_ref * exp(-Ea/R * (1/T - 1/T_ref)) dentro de cada
+    # modelo, ajustado de uma vez a todos os pontos (todas as repetições), em vez
+    # de um k por temperatura seguido de uma regressão de ln(k) em 1/T com só 4
+    # pontos. Os erros padrão vêm da covariância do ajuste (ver ajuste_secagem.py)
+    tabela_arrhenius, ajustes_arrhenius = ajustar_arrhenius(
+        df_clean, x='tempo_min', y='razao_umidade', temperatura='temperatura', retornar_ajustes=True)
+
+    print("Análise de Arrhenius (ajuste global aos dados brutos):")
+    for _, linha in tabela_arrhenius.iterrows():
+        extra = ""
+        if pd.notna(linha.get('n', np.nan)):
+            extra = f", n = {linha['n']:.4f} ± {linha['erro_n']:.4f}"
+        elif pd.notna(linha.get('b', np.nan)):
+            extra = f", b = {linha['b']:.4f} ± {linha['erro_b']:.4f}"
+        print(f"\n{linha['modelo']} (R² = {linha['r2']:.4f}, {linha['n_pontos']} pontos):")
+        print(f"  Energia de ativação (Ea): {linha['Ea']:.2f} ± {linha['erro_Ea']:.2f} J/mol "
+              f"({linha['Ea']/1000:.2f} ± {linha['erro_Ea']/1000:.2f} kJ/mol)")
+        print(f"  Fator pré-exponencial (k0): {linha['k0']:.6f} ± {linha['erro_k0']:.6f} min⁻¹")
+        print(f"  a = {linha['a']:.4f} ± {linha['erro_a']:.4f}{extra}")
+
+    # Gráfico de Arrhenius: k por temperatura e a reta do ajuste global
+    # (Henderson-Pabis) com faixa de ±2 erros padrão de ln(k)
+    ajuste_hp = ajustes_arrhenius['Henderson-Pabis']
+    T_kelvin = np.array(temperaturas_k) + ZERO_CELSIUS
+    T_fino = np.linspace(T_kelvin.min(), T_kelvin.max(), 100)
+    k_fino, erro_k_fino = k_arrhenius(ajuste_hp, T_fino)
+    ln_k_fino = np.log(k_fino)
+    erro_ln_k_fino = erro_k_fino / k_fino       # erro padrão de ln(k)
+
     plt.figure(figsize=(10, 6))
-    plt.scatter(1/T_kelvin, ln_k, s=100, color='red', alpha=0.7, label='Dados experimentais')
-    
-    # Linha de ajuste
-    x_fit = np.linspace(min(1/T_kelvin), max(1/T_kelvin), 100)
-    y_fit = slope * x_fit + intercept
-    plt.plot(x_fit, y_fit, 'b-', linewidth=2, 
-             label=f'Ajuste linear (R = {r_value:.4f})')
-    
+    plt.scatter(1/T_kelvin, np.log(k_values), s=100, color='red', alpha=0.7,
+                label='k por temperatura (ajustes separados)')
+    plt.plot(1/T_fino, ln_k_fino, 'b-', linewidth=2,
+             label=f'Ajuste global (Ea = {ajuste_hp["parametros"][2]/1000:.1f} kJ/mol)')
+    plt.fill_between(1/T_fino, ln_k_fino - 2*erro_ln_k_fino, ln_k_fino + 2*erro_ln_k_fino,
+                     color='b', alpha=0.2, label='±2 erros padrão')
     plt.xlabel('1/T (K⁻¹)')
     plt.ylabel('ln(k)')
     plt.title('Gráfico de Arrhenius - Dependência da Temperatura')
     plt.legend()
     plt.grid(True, alpha=0.3)
     plt.tight_layout()
-    plt.show()
+    mostrar_ou_salvar('arrhenius')
 
 # Relatório final
 print("\n" + "="*60)
 print("RELATÓRIO FINAL DA ANÁLISE")
 print("="*60)
 print(f"✓ Total de dados analisados: {df_clean.shape[0]} pontos")
-print(f"✓ Temperaturas testadas: {sorted(df_clean['temperatura'].unique())}")
+print(f"✓ Temperaturas testadas: {resumo.temperaturas}")
 print(f"✓ Tempo de secagem: 0 a {df_clean['tempo_min'].max()} minutos")
-print(f"✓ Umidade inicial média: {df_clean[df_clean['tempo_min'] == 0]['umidade_percentual'].mean():.2f}%")
+print(f"✓ Umidade inicial média: {resumo.valor_inicial('umidade_percentual'):.2f}%")
 
 # Umidade final por temperatura
 print("\n✓ Umidade final por temperatura:")
-for temp in sorted(df_clean['temperatura'].unique()):
-    dados_final = df_clean[(df_clean['temperatura'] == temp) & 
-                          (df_clean['tempo_min'] == df_clean['tempo_min'].max())]
-    umidade_final = dados_final['umidade_percentual'].mean()
-    print(f"  {temp}°C: {umidade_final:.2f}%")
+for temp in resumo.temperaturas:
+    print(f"  {temp}°C: {umidade_final[temp]:.2f}%")
 
 print("\n✓ Modelos matemáticos testados: Henderson-Pabis, Page, Newton")
 print("✓ Todos os gráficos e análises foram gerados com sucesso!")
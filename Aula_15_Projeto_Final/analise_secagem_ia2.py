@@ -1,9 +1,12 @@
 # Importando bibliotecas necessárias
 import pandas as pd
 import numpy as np
+from graficos_secagem import configurar_renderizacao, mostrar_ou_salvar
+configurar_renderizacao()  # FIGDIR definido -> figuras salvas em arquivo
 import matplotlib.pyplot as plt
 from scipy.optimize import curve_fit
 import os
+from ajuste_secagem import ModeloExponencialAssintotico
 
 # 1. IMPORTAR OS DADOS
 print("1. Importando dados do arquivo CSV...")
@@ -73,7 +76,7 @@ plt.ylabel('Umidade (g água / g matéria seca)', fontsize=12)
 plt.grid(True, linestyle='--', alpha=0.7)
 plt.legend()
 plt.tight_layout()
-plt.show()
+mostrar_ou_salvar('curva_secagem')
 
 # 5. AJUSTAR MODELO COM SCIPY
 print("\n5. Ajustando modelo com SciPy...")
@@ -85,22 +88,23 @@ print("\n5. Ajustando modelo com SciPy...")
 #   Umidade_eq: umidade de equilíbrio (assintótica)
 #   k: constante de secagem
 
-def modelo_exponencial(t, U_eq, k):
-    U_0 = df['umidade_g_agua_g_ms'].iloc[0]  # Pega a umidade inicial dos dados
-    return U_eq + (U_0 - U_eq) * np.exp(-k * t)
-
 # Preparar dados para ajuste
 t_data = df['tempo_h'].values
 U_data = df['umidade_g_agua_g_ms'].values
 
+# U_0 (umidade inicial) é lido uma única vez e fica guardado no modelo;
+# antes ele era buscado no DataFrame a cada avaliação feita pelo curve_fit
+modelo_exponencial = ModeloExponencialAssintotico(U_data[0])
+
 # Chute inicial para os parâmetros [U_eq, k]
 # U_eq: valor próximo ao último ponto
 # k: um valor positivo pequeno
 p0 = [U_data[-1], 0.5]
 
-# Realizar o ajuste
+# Realizar o ajuste (com jacobiano analítico)
 try:
-    popt, pcov = curve_fit(modelo_exponencial, t_data, U_data, p0=p0)
+    popt, pcov = curve_fit(modelo_exponencial, t_data, U_data, p0=p0,
+                           jac=modelo_exponencial.jacobiano)
     U_eq_ajustado, k_ajustado = popt
     print(f"Parâmetros ajustados:")
     print(f"  Umidade de Equilíbrio (U_eq) = {U_eq_ajustado:.4f} g água / g ms")
@@ -126,7 +130,7 @@ try:
     plt.grid(True, linestyle='--', alpha=0.7)
     plt.legend()
     plt.tight_layout()
-    plt.show()
+    mostrar_ou_salvar('ajuste_exponencial')
 
 except Exception as e:
     print(f"Erro ao ajustar o modelo: {e}")
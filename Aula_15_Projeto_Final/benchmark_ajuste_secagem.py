@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark: ajuste por grupo com curve_fit x motor em lote (ajuste_secagem.py)
+
+Simula uma campanha com muitos grupos (temperatura x repetição), ajusta os três
+modelos de secagem das duas formas e compara tempo total e parâmetros obtidos.
+
+Uso:
+    python benchmark_ajuste_secagem.py [n_temperaturas] [n_repeticoes] [n_processos]
+"""
+
+import os
+import sys
+import time
+import warnings
+
+import numpy as np
+from scipy.optimize import curve_fit
+
+from ajuste_secagem import CHUTES_FIXOS, MODELOS, ajustar_modelos
+from simulador_secagem import simular_secagem
+
+
+def ajuste_curve_fit(df, chave):
+    """Laço original: um curve_fit por (grupo, modelo), com jacobiano numérico."""
+    linhas = []
+    for valores, grupo in df.groupby(chave, sort=True):
+        t = grupo["tempo_min"].values
+        mr = grupo["razao_umidade"].values
+        for nome, (func, _, _, p0) in MODELOS.items():
+            try:
+                popt, _ = curve_fit(func, t, mr, p0=p0, maxfev=5000)
+            except Exception:
+                popt = np.full(len(p0), np.nan)
+            linhas.append((valores, nome, popt))
+    return linhas
+
+
+def main():
+    n_temp = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    n_rep = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    n_proc = int(sys.argv[3]) if len(sys.argv) > 3 else (os.cpu_count() or 1)
+    chave = ["temperatura", "repeticao"]
+
+    df = simular_secagem(temperaturas=np.linspace(40, 70, n_temp), n_repeticoes=n_rep, seed=0)
+    n_ajustes = n_temp * n_rep * len(MODELOS)
+    print(f"{n_temp * n_rep} grupos x {len(MODELOS)} modelos = {n_ajustes} ajustes ({len(df)} linhas)")
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        inicio = time.perf_counter()
+        linhas = ajuste_curve_fit(df, chave)
+        t_loop = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    tabela = ajustar_modelos(df, chave=chave)
+    t_lote = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    tabela_fixa = ajustar_modelos(df, chave=chave, p0=CHUTES_FIXOS)
+    t_fixo = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    tabela_paralela = ajustar_modelos(df, chave=chave, n_processos=n_proc)
+    t_paralelo = time.perf_counter() - inicio
+
+    # Diferença máxima de parâmetros entre os dois caminhos
+    diferenca = 0.0
+    for (valores, nome, popt), (_, linha) in zip(linhas, tabela.iterrows()):
+        nomes = MODELOS[nome][2]
+        diferenca = max(diferenca, np.nanmax(np.abs(popt - linha[list(nomes)].to_numpy(dtype=float))))
+
+    print(f"curve_fit por grupo : {t_loop:8.3f} s ({1e3 * t_loop / n_ajustes:.3f} ms/ajuste)")
+    print(f"motor em lote       : {t_lote:8.3f} s ({1e3 * t_lote / n_ajustes:.3f} ms/ajuste)")
+    print(f"lote, {n_proc:3d} processos : {t_paralelo:8.3f} s")
+    print(f"aceleração          : {t_loop / t_lote:8.1f}x")
+    print(f"paralelo idêntico ao serial: {tabela_paralela.equals(tabela)}")
+    print(f"maior diferença nos parâmetros: {diferenca:.2e}")
+
+    print("\nChute inicial fixo x linearizado (médias por modelo):")
+    for tab, rotulo in ((tabela_fixa, f"fixo        {t_fixo:6.3f} s"),
+                        (tabela, f"linearizado {t_lote:6.3f} s")):
+        resumo = tab.groupby("modelo", sort=False).agg(
+            n_iter=("n_iter", "mean"), n_jac=("n_jac", "mean"),
+            falhas=("convergiu", lambda c: int((~c).sum())))
+        print(f"  {rotulo}")
+        print(resumo.round(2).to_string())
+
+
+if __name__ == "__main__":
+    main()
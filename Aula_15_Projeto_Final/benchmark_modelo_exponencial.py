@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark: custo por avaliação do modelo exponencial assintótico
+
+Compara a função original de analise_secagem_ia2.py, que lê U_0 do DataFrame
+(df[...].iloc[0]) a cada chamada, com ModeloExponencialAssintotico, que guarda
+U_0 como float. Mede o tempo por avaliação e o tempo total do curve_fit
+(jacobiano numérico x analítico).
+
+Uso:
+    python benchmark_modelo_exponencial.py
+"""
+
+import timeit
+
+import numpy as np
+import pandas as pd
+from scipy.optimize import curve_fit
+
+from ajuste_secagem import ModeloExponencialAssintotico
+
+
+def main():
+    df = pd.read_csv("dados_secagem_folhas.csv")
+    t_data = df["tempo_h"].values
+    U_data = df["umidade_g_agua_g_ms"].values
+    p0 = [U_data[-1], 0.5]
+
+    def modelo_original(t, U_eq, k):
+        U_0 = df["umidade_g_agua_g_ms"].iloc[0]
+        return U_eq + (U_0 - U_eq) * np.exp(-k * t)
+
+    modelo = ModeloExponencialAssintotico(U_data[0])
+
+    n = 20000
+    antes = timeit.timeit(lambda: modelo_original(t_data, *p0), number=n) / n
+    depois = timeit.timeit(lambda: modelo(t_data, *p0), number=n) / n
+    print("Custo por avaliação do modelo:")
+    print(f"  closure com df.iloc : {1e6 * antes:8.2f} µs")
+    print(f"  modelo com U_0 fixo : {1e6 * depois:8.2f} µs")
+    print(f"  sobrecarga removida : {1e6 * (antes - depois):8.2f} µs ({antes / depois:.1f}x)")
+
+    n = 500
+    ajuste_antes = timeit.timeit(
+        lambda: curve_fit(modelo_original, t_data, U_data, p0=p0), number=n) / n
+    ajuste_depois = timeit.timeit(
+        lambda: curve_fit(modelo, t_data, U_data, p0=p0, jac=modelo.jacobiano), number=n) / n
+    print("\nTempo de um curve_fit completo:")
+    print(f"  original (jacobiano numérico)    : {1e3 * ajuste_antes:8.3f} ms")
+    print(f"  modelo + jacobiano analítico     : {1e3 * ajuste_depois:8.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+"""
+Renderização de figuras em modo interativo ou headless (sem display)
+Disciplina: ENG6001 - Introdução à Ciência de Dados com Python Aplicada à Engenharia Agrícola
+
+Descrição:
+    Se a variável de ambiente FIGDIR estiver definida (ou se
+    configurar_renderizacao receber um diretório), o backend não interativo
+    Agg é selecionado e cada figura é salva em PNG nesse diretório e fechada,
+    como em analise_titanic_2.py (savefig + plt.close). Sem FIGDIR, as figuras
+    são exibidas com plt.show(), como antes.
+
+    renderizar_em_paralelo distribui a geração de muitas figuras independentes
+    (ex.: um painel por temperatura) em processos separados. Os processos são
+    criados por fork (Linux); com spawn/forkserver cada processo reexecutaria o
+    script chamador, que não tem guarda __main__, então nesses sistemas a
+    renderização é serial.
+
+Uso:
+    FIGDIR=figuras FIGURAS_PROCESSOS=8 python analise_secagem_ia1.py
+"""
+
+import multiprocessing
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import matplotlib
+
+
+_diretorio = None
+
+
+def configurar_renderizacao(diretorio=None):
+    """
+    Define o modo de renderização. Deve ser chamada antes de importar pyplot.
+    - diretorio: pasta de saída das figuras; se None, usa a variável FIGDIR.
+    Retorna o diretório (modo headless) ou None (modo interativo).
+    """
+    global _diretorio
+    _diretorio = diretorio or os.environ.get("FIGDIR") or None
+    if _diretorio:
+        matplotlib.use("Agg", force=True)
+        os.makedirs(_diretorio, exist_ok=True)
+    return _diretorio
+
+
+def modo_headless() -> bool:
+    return _diretorio is not None
+
+
+def processos_figuras() -> int:
+    """Número de processos para renderização paralela (variável FIGURAS_PROCESSOS, padrão 1)."""
+    return max(1, int(os.environ.get("FIGURAS_PROCESSOS", "1")))
+
+
+def mostrar_ou_salvar(nome: str, fig=None):
+    """
+    Finaliza a figura: salva em <diretorio>/<nome>.png e fecha (headless) ou
+    chama plt.show() (interativo).
+    """
+    import matplotlib.pyplot as plt
+
+    if _diretorio is None:
+        plt.show()
+        return None
+    fig = plt.gcf() if fig is None else fig
+    caminho = os.path.join(_diretorio, f"{nome}.png")
+    fig.savefig(caminho)
+    plt.close(fig)
+    return caminho
+
+
+def _renderizar_tarefa(args):
+    """Executa uma função de desenho em um processo do pool e salva a figura."""
+    funcao, kwargs, caminho = args
+    matplotlib.use("Agg", force=True)
+    import matplotlib.pyplot as plt
+
+    fig = funcao(**kwargs)
+    fig.savefig(caminho)
+    plt.close(fig)
+    return caminho
+
+
+def renderizar_em_paralelo(funcao, lista_kwargs, nomes, diretorio=None, n_processos=None):
+    """
+    Gera uma figura por item de lista_kwargs chamando funcao(**kwargs), que deve
+    devolver a Figure, e salva cada uma como <diretorio>/<nome>.png.
+    - funcao: função definida em nível de módulo (precisa ser serializável)
+    - n_processos: processos do pool (padrão: FIGURAS_PROCESSOS); 1 = serial
+      (sempre serial fora do Linux, onde não há fork seguro)
+    Retorna a lista de caminhos, na mesma ordem de nomes.
+    """
+    diretorio = diretorio or _diretorio
+    if diretorio is None:
+        raise ValueError("Renderização em lote requer um diretório de saída (FIGDIR)")
+    os.makedirs(diretorio, exist_ok=True)
+    n_processos = processos_figuras() if n_processos is None else n_processos
+
+    tarefas = [(funcao, kwargs, os.path.join(diretorio, f"{nome}.png"))
+               for kwargs, nome in zip(lista_kwargs, nomes)]
+    if n_processos == 1 or not sys.platform.startswith("linux"):
+        return [_renderizar_tarefa(t) for t in tarefas]
+    contexto = multiprocessing.get_context("fork")
+    with ProcessPoolExecutor(max_workers=n_processos, mp_context=contexto) as pool:
+        return list(pool.map(_renderizar_tarefa, tarefas))
+
+
+# ---------------------------
+# Figuras de secagem
+# ---------------------------
+
+def figura_ajuste_temperatura(temperatura, t_data, mr_data, curvas):
+    """
+    Painel de uma temperatura: dados médios e curvas ajustadas.
+    - curvas: dicionário nome_modelo -> (predição, R²)
+    """
+    import matplotlib.pyplot as plt
+
+    fig, ax = plt.subplots(figsize=(8, 6))
+    ax.scatter(t_data, mr_data, color='black', s=50, alpha=0.7, label='Dados Experimentais')
+    for nome_modelo, (mr_pred, r2) in curvas.items():
+        ax.plot(t_data, mr_pred, linewidth=2, label=f'{nome_modelo} (R²={r2:.3f})')
+    ax.set_xlabel('Tempo (minutos)')
+    ax.set_ylabel('Razão de Umidade (MR)')
+    ax.set_title(f'Temperatura: {temperatura}°C')
+    ax.legend()
+    ax.grid(True, alpha=0.3)
+    fig.tight_layout()
+    return fig
@@ -0,0 +1,187 @@
+# -*- coding: utf-8 -*-
+"""
+Limpeza dos dados de secagem: regras de validação e detecção de outliers
+Disciplina: ENG6001 - Introdução à Ciência de Dados com Python Aplicada à Engenharia Agrícola
+
+Descrição:
+    Calcula z-scores de várias colunas de uma vez, sobre a tabela inteira ou
+    dentro de grupos (ex.: por temperatura e tempo, onde a comparação faz
+    sentido físico), e devolve uma máscara booleana em vez de cópias filtradas
+    do DataFrame. O escore robusto usa mediana e MAD no lugar de média e
+    desvio padrão.
+
+    As faixas físicas válidas do esquema de secagem são declaradas uma única
+    vez em REGRAS_SECAGEM; aplicar_regras avalia todas em uma só máscara,
+    aplica-a com um único take e informa quantas linhas cada regra rejeitou.
+
+Uso:
+    from limpeza_secagem import mascara_outliers
+    outliers = mascara_outliers(df, ['umidade_percentual', 'massa_g'],
+                                grupos=['temperatura', 'tempo_min'], robusto=True)
+    df_sem_outliers = df[~outliers]
+
+    df_clean, rejeicoes = aplicar_regras(df_raw)
+"""
+
+import numpy as np
+import pandas as pd
+
+
+MAD_NORMAL = 1.4826  # torna a MAD comparável ao desvio padrão em dados normais
+
+OPERADORES = {
+    ">=": np.greater_equal,
+    ">": np.greater,
+    "<=": np.less_equal,
+    "<": np.less,
+}
+
+# Faixas fisicamente possíveis: nome da regra -> (coluna, operador, limite)
+REGRAS_SECAGEM = {
+    "umidade_percentual >= 0": ("umidade_percentual", ">=", 0),
+    "umidade_percentual <= 100": ("umidade_percentual", "<=", 100),
+    "massa_g > 0": ("massa_g", ">", 0),
+    "razao_umidade >= 0": ("razao_umidade", ">=", 0),
+}
+
+
+# ---------------------------
+# Funções auxiliares
+# ---------------------------
+
+def _codigos_grupo(df: pd.DataFrame, grupos):
+    """
+    Código inteiro do grupo de cada linha (0 para todas quando grupos=None).
+    Linhas com chave NaN recebem -1 (o ngroup do pandas 3 as devolve como NaN).
+    """
+    if grupos is None:
+        return np.zeros(len(df), dtype=np.intp), 1
+    codigos = df.groupby(grupos, sort=False).ngroup().fillna(-1).to_numpy().astype(np.intp)
+    return codigos, int(codigos.max()) + 1 if len(codigos) else 0
+
+
+def _centro_escala(x, codigos, n_grupos, robusto, ordem=None):
+    """Centro e escala de x por grupo (média/desvio ou mediana/MAD), ignorando NaN."""
+    if not robusto:
+        validos = ~np.isnan(x)
+        cv, xv = codigos[validos], x[validos]
+        n = np.bincount(cv, minlength=n_grupos).astype(float)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            centro = np.bincount(cv, weights=xv, minlength=n_grupos) / n
+            desvio = xv - centro[cv]
+            escala = np.sqrt(np.bincount(cv, weights=desvio ** 2, minlength=n_grupos) / n)
+        return centro, escala
+
+    centro = _mediana_por_grupo(x, codigos, n_grupos, ordem)
+    escala = MAD_NORMAL * _mediana_por_grupo(np.abs(x - centro[codigos]), codigos, n_grupos, ordem)
+    return centro, escala
+
+
+def _mediana_por_grupo(x, codigos, n_grupos, ordem=None):
+    """
+    Mediana por grupo, ignorando NaN. As linhas são reunidas por grupo (ordem =
+    argsort estável dos códigos, calculado uma vez e reaproveitado entre colunas)
+    em uma matriz (grupo x posição) completada com +inf; cada linha é ordenada e
+    a mediana sai das posições centrais. Se o preenchimento ficar grande demais
+    (grupos muito desiguais), usa um lexsort direto.
+    """
+    if len(x) == 0:
+        return np.full(n_grupos, np.nan)
+    if ordem is None:
+        ordem = np.argsort(codigos, kind="stable")
+    n_total = np.bincount(codigos, minlength=n_grupos)
+    n_max = int(n_total.max())
+    valor = np.where(np.isnan(x), np.inf, x)
+    n = np.bincount(codigos[~np.isnan(x)], minlength=n_grupos)
+
+    if n_grupos * n_max <= 4 * len(x) + 1024:
+        inicio = np.concatenate([[0], np.cumsum(n_total)[:-1]])
+        cs = codigos[ordem]
+        matriz = np.full((n_grupos, n_max), np.inf)
+        matriz[cs, np.arange(len(cs)) - inicio[cs]] = valor[ordem]
+        matriz.sort(axis=1)
+        linhas = np.arange(n_grupos)
+        baixo = matriz[linhas, np.maximum(n - 1, 0) // 2]
+        alto = matriz[linhas, n // 2]
+    else:
+        ordenado = valor[np.lexsort((valor, codigos))]
+        inicio = np.concatenate([[0], np.cumsum(n_total)[:-1]])
+        baixo = ordenado[np.minimum(inicio + np.maximum(n - 1, 0) // 2, len(x) - 1)]
+        alto = ordenado[np.minimum(inicio + n // 2, len(x) - 1)]
+
+    return np.where(n > 0, (baixo + alto) / 2, np.nan)
+
+
+# ---------------------------
+# API principal
+# ---------------------------
+
+def escores_z(df: pd.DataFrame, colunas, grupos=None, robusto=False) -> np.ndarray:
+    """
+    Matriz (n_linhas, n_colunas) de z-scores.
+    - grupos: coluna(s) dentro das quais o escore é calculado (None = tabela toda)
+    - robusto: usa (x - mediana) / (1.4826 * MAD) em vez de (x - média) / desvio
+    Linhas com NaN, ou grupos com escala zero, recebem NaN (nunca são outliers).
+    """
+    codigos, n_grupos = _codigos_grupo(df, grupos)
+    X = df[list(colunas)].to_numpy(dtype=float)
+    sem_grupo = codigos < 0
+    if sem_grupo.any():
+        # linhas com chave NaN vão para um grupo extra só de NaN: ficam fora das
+        # estatísticas e recebem NaN
+        codigos = np.where(sem_grupo, n_grupos, codigos)
+        n_grupos += 1
+        X = np.where(sem_grupo[:, None], np.nan, X)
+    ordem = np.argsort(codigos, kind="stable") if robusto else None
+    Z = np.empty_like(X)
+    for j in range(X.shape[1]):
+        centro, escala = _centro_escala(X[:, j], codigos, n_grupos, robusto, ordem)
+        escala = np.where(escala > 0, escala, np.nan)     # escala zero → NaN, nunca outlier
+        with np.errstate(invalid="ignore", divide="ignore"):
+            Z[:, j] = (X[:, j] - centro[codigos]) / escala[codigos]
+    return Z
+
+
+def mascara_outliers(df: pd.DataFrame, colunas, grupos=None, limite=3.0,
+                     robusto=False, por_coluna=False):
+    """
+    Marca as linhas com |z| > limite.
+    - por_coluna=False: Series booleana (True se qualquer coluna for outlier)
+    - por_coluna=True: DataFrame booleano, uma coluna por variável
+    A máscara compartilha o índice de df; nenhuma cópia dos dados é criada.
+    """
+    colunas = [colunas] if isinstance(colunas, str) else list(colunas)
+    with np.errstate(invalid="ignore"):
+        fora = np.abs(escores_z(df, colunas, grupos, robusto)) > limite
+    if por_coluna:
+        return pd.DataFrame(fora, index=df.index, columns=colunas)
+    return pd.Series(fora.any(axis=1), index=df.index, name="outlier")
+
+
+def avaliar_regras(df: pd.DataFrame, regras=None):
+    """
+    Avalia todas as regras sobre df sem copiar dados.
+    - regras: dicionário nome -> (coluna, operador, limite) (padrão: REGRAS_SECAGEM)
+    Retorna (máscara das linhas válidas, Series com rejeições por regra).
+    Valores ausentes reprovam a regra, como nos filtros encadeados originais.
+    """
+    regras = REGRAS_SECAGEM if regras is None else regras
+    valido = np.ones(len(df), dtype=bool)
+    rejeicoes = {}
+    for nome, (coluna, operador, limite) in regras.items():
+        if operador not in OPERADORES:
+            raise ValueError(f"Operador desconhecido na regra '{nome}': {operador}")
+        with np.errstate(invalid="ignore"):
+            ok = OPERADORES[operador](df[coluna].to_numpy(), limite)
+        rejeicoes[nome] = int(len(ok) - np.count_nonzero(ok))
+        valido &= ok
+    return valido, pd.Series(rejeicoes, name="rejeitadas", dtype=int)
+
+
+def aplicar_regras(df: pd.DataFrame, regras=None):
+    """
+    Mantém só as linhas que passam em todas as regras, com uma única cópia.
+    Retorna (DataFrame limpo, Series com rejeições por regra).
+    """
+    valido, rejeicoes = avaliar_regras(df, regras)
+    return df.loc[valido], rejeicoes
@@ -0,0 +1,207 @@
+# -*- coding: utf-8 -*-
+"""
+Simulador vetorizado de experimentos de secagem (Henderson e Pabis modificado)
+Disciplina: ENG6001 - Introdução à Ciência de Dados com Python Aplicada à Engenharia Agrícola
+
+Descrição:
+    Gera campanhas sintéticas de secagem com o modelo MR = a * exp(-k * t) + c
+    sobre a grade (temperatura x repetição x tempo). Todo o ruído é sorteado
+    em uma única chamada por parâmetro e o modelo é avaliado por broadcasting,
+    sem laços em Python e sem montar uma lista de dicionários.
+
+    Para campanhas maiores que a memória, gerar_blocos_secagem produz blocos de
+    tamanho fixo e salvar_simulacao os grava incrementalmente em CSV ou Parquet,
+    mantendo o pico de memória limitado ao tamanho de um bloco.
+
+Uso:
+    from simulador_secagem import simular_secagem, salvar_simulacao
+    df = simular_secagem(temperaturas=[40, 50, 60, 70], n_repeticoes=5, seed=42)
+    salvar_simulacao("campanha.parquet", temperaturas=range(30, 80), n_repeticoes=2000)
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+
+
+# ---------------------------
+# Parâmetros padrão
+# ---------------------------
+
+# Tempos de amostragem (minutos)
+TEMPOS_PADRAO = np.array([0, 15, 30, 45, 60, 90, 120, 150, 180, 210, 240, 270, 300])
+
+# temperatura (°C) -> (a médio, k médio, desvio de k, c)
+PARAMETROS_PADRAO = {
+    40: (0.95, 0.008, 0.001, 0.05),
+    50: (0.96, 0.012, 0.001, 0.04),
+    60: (0.97, 0.018, 0.002, 0.03),
+    70: (0.98, 0.025, 0.002, 0.02),
+}
+
+COLUNAS = ["temperatura", "repeticao", "tempo_min",
+           "umidade_percentual", "massa_g", "razao_umidade"]
+
+DESVIO_A = 0.02          # desvio de a entre repetições
+DESVIO_MR = 0.01         # ruído de leitura da razão de umidade
+MR_MINIMO = 0.02         # limite inferior de MR
+UMIDADE_INICIAL = (82.0, 1.0)      # média e desvio (% b.u.)
+UMIDADE_EQUILIBRIO = (5.0, 0.5)    # média e desvio (% b.u.)
+MASSA_SECA = 10.0        # g
+LINHAS_POR_BLOCO = 1_000_000
+
+
+# ---------------------------
+# Funções auxiliares
+# ---------------------------
+
+def parametros_por_temperatura(temperaturas, parametros=None) -> np.ndarray:
+    """
+    Retorna uma matriz (n_temperaturas, 4) com (a, k, desvio_k, c) por temperatura.
+    - parametros: dicionário temperatura -> (a, k, desvio_k, c); se None, usa
+      PARAMETROS_PADRAO interpolado linearmente (e limitado aos extremos),
+      o que permite simular qualquer número de temperaturas.
+    """
+    temperaturas = np.asarray(temperaturas, dtype=float)
+    if parametros is not None:
+        faltando = [t for t in temperaturas.tolist() if t not in parametros]
+        if faltando:
+            raise KeyError(f"Sem parâmetros para as temperaturas: {faltando}")
+        return np.array([parametros[t] for t in temperaturas.tolist()], dtype=float)
+
+    ref_t = np.array(sorted(PARAMETROS_PADRAO), dtype=float)
+    ref_p = np.array([PARAMETROS_PADRAO[t] for t in sorted(PARAMETROS_PADRAO)], dtype=float)
+    return np.column_stack([np.interp(temperaturas, ref_t, ref_p[:, j])
+                            for j in range(ref_p.shape[1])])
+
+
+def _simular_unidades(rng, temperatura_u, repeticao_u, params_u, tempos,
+                      massa_seca=MASSA_SECA) -> dict:
+    """
+    Simula um conjunto de unidades experimentais (temperatura, repetição).
+    - params_u: matriz (n_unidades, 4) com (a, k, desvio_k, c) de cada unidade
+    Retorna um dicionário de colunas (arrays 1-D) no esquema COLUNAS.
+    """
+    n_u = len(temperatura_u)
+    n_t = len(tempos)
+
+    # Um sorteio por parâmetro, para todas as unidades/tempos de uma vez
+    a = params_u[:, 0] + rng.normal(0, DESVIO_A, n_u)
+    k = params_u[:, 1] + params_u[:, 2] * rng.normal(0, 1, n_u)
+    c = params_u[:, 3]
+    ruido = rng.normal(0, DESVIO_MR, (n_u, n_t))
+    umidade_inicial = rng.normal(*UMIDADE_INICIAL, (n_u, n_t))
+    umidade_equilibrio = rng.normal(*UMIDADE_EQUILIBRIO, (n_u, n_t))
+
+    # MR = a * exp(-k * t) + c, por broadcasting (unidade x tempo)
+    mr = a[:, None] * np.exp(-k[:, None] * tempos[None, :]) + c[:, None] + ruido
+    np.maximum(mr, MR_MINIMO, out=mr)
+
+    umidade = mr * (umidade_inicial - umidade_equilibrio) + umidade_equilibrio
+    fracao = umidade / 100
+    massa = massa_seca * (1 + fracao) / (1 - fracao)
+
+    return {
+        "temperatura": np.repeat(temperatura_u, n_t),
+        "repeticao": np.repeat(repeticao_u, n_t),
+        "tempo_min": np.tile(tempos, n_u),
+        "umidade_percentual": np.round(umidade, 2).ravel(),
+        "massa_g": np.round(massa, 3).ravel(),
+        "razao_umidade": np.round(mr, 4).ravel(),
+    }
+
+
+# ---------------------------
+# API principal
+# ---------------------------
+
+def simular_secagem(temperaturas=(40, 50, 60, 70), n_repeticoes=5, tempos=None,
+                    parametros=None, seed=42, massa_seca=MASSA_SECA) -> pd.DataFrame:
+    """
+    Simula uma campanha completa de secagem e devolve um DataFrame com as colunas
+    temperatura, repeticao, tempo_min, umidade_percentual, massa_g, razao_umidade.
+    - temperaturas: temperaturas do ar (°C)
+    - n_repeticoes: repetições por temperatura
+    - tempos: tempos de amostragem em minutos (padrão: TEMPOS_PADRAO)
+    - parametros: dicionário temperatura -> (a, k, desvio_k, c) (opcional)
+    - seed: semente do gerador; a mesma semente reproduz os mesmos dados
+    """
+    temperaturas = np.asarray(temperaturas)
+    tempos = TEMPOS_PADRAO if tempos is None else np.asarray(tempos)
+    params_t = parametros_por_temperatura(temperaturas, parametros)
+
+    temperatura_u = np.repeat(temperaturas, n_repeticoes)
+    repeticao_u = np.tile(np.arange(1, n_repeticoes + 1), len(temperaturas))
+    params_u = np.repeat(params_t, n_repeticoes, axis=0)
+
+    rng = np.random.default_rng(seed)
+    colunas = _simular_unidades(rng, temperatura_u, repeticao_u, params_u, tempos, massa_seca)
+    return pd.DataFrame(colunas, columns=COLUNAS)
+
+
+def gerar_blocos_secagem(temperaturas=(40, 50, 60, 70), n_repeticoes=5, tempos=None,
+                         parametros=None, seed=42, massa_seca=MASSA_SECA,
+                         linhas_por_bloco=LINHAS_POR_BLOCO):
+    """
+    Gera a campanha em blocos (DataFrames) de aproximadamente linhas_por_bloco
+    linhas, sempre com unidades (temperatura, repetição) completas.
+    - Apenas um bloco existe em memória por vez.
+    - A mesma semente e o mesmo linhas_por_bloco reproduzem os mesmos dados.
+    """
+    temperaturas = np.asarray(temperaturas)
+    tempos = TEMPOS_PADRAO if tempos is None else np.asarray(tempos)
+    params_t = parametros_por_temperatura(temperaturas, parametros)
+
+    n_unidades = len(temperaturas) * n_repeticoes
+    unidades_por_bloco = max(1, linhas_por_bloco // len(tempos))
+    rng = np.random.default_rng(seed)
+
+    for inicio in range(0, n_unidades, unidades_por_bloco):
+        u = np.arange(inicio, min(inicio + unidades_por_bloco, n_unidades))
+        idx_temp = u // n_repeticoes
+        colunas = _simular_unidades(rng, temperaturas[idx_temp], u % n_repeticoes + 1,
+                                    params_t[idx_temp], tempos, massa_seca)
+        yield pd.DataFrame(colunas, columns=COLUNAS)
+
+
+def salvar_simulacao(caminho: str, formato=None, **kwargs) -> int:
+    """
+    Gera a campanha em blocos e grava cada bloco assim que ele é produzido.
+    - caminho: arquivo de saída (.csv ou .parquet); é sobrescrito
+    - formato: "csv" ou "parquet" (padrão: deduzido da extensão)
+    - kwargs: repassados para gerar_blocos_secagem
+    Retorna o número total de linhas gravadas.
+    """
+    if formato is None:
+        formato = "parquet" if caminho.lower().endswith((".parquet", ".pq")) else "csv"
+    if formato not in ("csv", "parquet"):
+        raise ValueError(f"Formato não suportado: {formato}")
+
+    total = 0
+    if formato == "csv":
+        if os.path.exists(caminho):
+            os.remove(caminho)
+        for i, bloco in enumerate(gerar_blocos_secagem(**kwargs)):
+            bloco.to_csv(caminho, mode="a", header=(i == 0), index=False)
+            total += len(bloco)
+        return total
+
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError("Gravação em Parquet requer o pacote pyarrow") from e
+
+    escritor = None
+    try:
+        for bloco in gerar_blocos_secagem(**kwargs):
+            tabela = pa.Table.from_pandas(bloco, preserve_index=False)
+            if escritor is None:
+                escritor = pq.ParquetWriter(caminho, tabela.schema)
+            escritor.write_table(tabela)
+            total += len(bloco)
+    finally:
+        if escritor is not None:
+            escritor.close()
+    return total
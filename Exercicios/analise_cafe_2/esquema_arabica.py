@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+"""
+Carregamento do dataset arabica_data_cleaned.csv com esquema de tipos
+Descrição:
+    Lido sem esquema, o CSV vira 44 colunas em que quase todos os textos
+    (país, variedade, método de processamento, cor, peso da saca...) ficam
+    como strings Python. carregar_arabica aplica o esquema já na leitura:
+    - colunas de baixa cardinalidade → category
+    - notas da prova (Aroma, Flavor, ..., Total.Cup.Points), umidade e
+      altitudes → float32
+    - contagens (sacas, defeitos) → menor inteiro que comporta os valores
+    - Grading.Date e Expiration ("April 4th, 2015") → datetime64
+    Colunas de texto fora do esquema viram category quando têm poucos valores
+    distintos (inferir_categorias). relatorio_memoria compara o uso de
+    memória da leitura padrão com o da leitura tipada, coluna a coluna.
+
+Uso:
+    from esquema_arabica import carregar_arabica
+    df = carregar_arabica("arabica_data_cleaned.csv")
+    python esquema_arabica.py            # imprime o relatório de memória
+"""
+
+import sys
+
+import numpy as np
+import pandas as pd
+
+
+COLUNAS_CATEGORICAS = [
+    "Species", "Country.of.Origin", "In.Country.Partner", "Harvest.Year",
+    "Variety", "Processing.Method", "Color", "Bag.Weight",
+    "Certification.Body", "Certification.Address", "Certification.Contact",
+    "unit_of_measurement",
+]
+COLUNAS_NOTAS = [
+    "Aroma", "Flavor", "Aftertaste", "Acidity", "Body", "Balance",
+    "Uniformity", "Clean.Cup", "Sweetness", "Cupper.Points", "Total.Cup.Points",
+]
+COLUNAS_FLOAT32 = COLUNAS_NOTAS + [
+    "Moisture", "Quakers",
+    "altitude_low_meters", "altitude_high_meters", "altitude_mean_meters",
+]
+COLUNAS_INTEIRAS = ["Number.of.Bags", "Category.One.Defects", "Category.Two.Defects"]
+COLUNAS_DATA = ["Grading.Date", "Expiration"]
+
+ESQUEMA = {**{c: "category" for c in COLUNAS_CATEGORICAS},
+           **{c: "float32" for c in COLUNAS_FLOAT32}}
+FORMATO_DATA = "%B %d, %Y"
+REGEX_ORDINAL = r"(\d+)(?:st|nd|rd|th)"
+FRACAO_CATEGORIA = 0.5  # texto vira category se distintos / linhas <= este valor
+
+
+# ---------------------------
+# Conversões
+# ---------------------------
+
+def converter_datas(serie: pd.Series) -> pd.Series:
+    """
+    "April 4th, 2015" → Timestamp. As datas se repetem muito, então cada
+    valor distinto é convertido uma única vez (via categorias) e o resultado
+    é espalhado pelos códigos.
+    """
+    cat = serie.astype("category")
+    texto = cat.cat.categories.to_series().str.strip().str.replace(REGEX_ORDINAL, r"\1", regex=True)
+    datas = pd.to_datetime(texto, format=FORMATO_DATA, errors="coerce").to_numpy()
+    datas = np.append(datas, np.array(["NaT"], dtype=datas.dtype))  # código -1 (NaN) → NaT
+    return pd.Series(datas[cat.cat.codes.to_numpy()], index=serie.index, name=serie.name)
+
+
+def reduzir_inteiros(df: pd.DataFrame, colunas) -> pd.DataFrame:
+    for col in colunas:
+        if col in df.columns and pd.api.types.is_integer_dtype(df[col]):
+            df[col] = pd.to_numeric(df[col], downcast="integer")
+    return df
+
+
+def inferir_categorias(df: pd.DataFrame, fracao=FRACAO_CATEGORIA, excluir=()) -> pd.DataFrame:
+    """Converte para category as colunas de texto com poucos valores distintos."""
+    for col in df.columns:
+        if col in excluir or isinstance(df[col].dtype, pd.CategoricalDtype):
+            continue
+        if pd.api.types.is_string_dtype(df[col]) and len(df) > 0:
+            if df[col].nunique(dropna=True) <= fracao * len(df):
+                df[col] = df[col].astype("category")
+    return df
+
+
+# ---------------------------
+# API principal
+# ---------------------------
+
+def carregar_arabica(caminho="arabica_data_cleaned.csv", inferir=True, **kwargs) -> pd.DataFrame:
+    """
+    Lê o CSV já com os tipos do esquema.
+    - inferir: também converte para category os textos repetitivos fora do esquema
+    - kwargs: repassados ao pd.read_csv (ex.: usecols, nrows)
+    """
+    df = pd.read_csv(caminho, dtype=ESQUEMA, encoding="utf-8", **kwargs)
+
+    for col in COLUNAS_DATA:
+        if col in df.columns:
+            df[col] = converter_datas(df[col])
+    reduzir_inteiros(df, COLUNAS_INTEIRAS + ["Unnamed: 0"])
+    if inferir:
+        inferir_categorias(df)
+    return df
+
+
+def relatorio_memoria(caminho="arabica_data_cleaned.csv", **kwargs) -> pd.DataFrame:
+    """
+    Memória por coluna (bytes, contando o conteúdo das strings) na leitura
+    padrão e na leitura tipada, com os dtypes de cada uma.
+    """
+    antes = pd.read_csv(caminho, encoding="utf-8", **kwargs)
+    depois = carregar_arabica(caminho, **kwargs)
+    relatorio = pd.DataFrame({
+        "dtype_antes": antes.dtypes.astype(str),
+        "bytes_antes": antes.memory_usage(deep=True, index=False),
+        "dtype_depois": depois.dtypes.astype(str),
+        "bytes_depois": depois.memory_usage(deep=True, index=False),
+    })
+    relatorio["reducao_%"] = (100 * (1 - relatorio["bytes_depois"] / relatorio["bytes_antes"])).round(1)
+    return relatorio
+
+
+if __name__ == "__main__":
+    caminho = sys.argv[1] if len(sys.argv) > 1 else "arabica_data_cleaned.csv"
+    rel = relatorio_memoria(caminho)
+    print(rel.to_string())
+    antes, depois = rel["bytes_antes"].sum(), rel["bytes_depois"].sum()
+    print(f"\nTotal: {antes / 1e6:.2f} MB → {depois / 1e6:.2f} MB "
+          f"({100 * (1 - depois / antes):.1f}% menor)")
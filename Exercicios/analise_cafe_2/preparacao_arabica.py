@@ -0,0 +1,174 @@
+# -*- coding: utf-8 -*-
+"""
+Preparação incremental de arabica_data_cleaned_prepared.csv
+Descrição:
+    Reproduz as etapas de preparação do notebook cafe_qualidade_analise_final
+    (nomes de colunas padronizados, remoção de duplicatas e recálculo de
+    altitude_mean_meters) como um pipeline reutilizável que só processa as
+    linhas novas ou alteradas.
+
+    Cada linha da fonte recebe uma impressão digital (hash de 64 bits do texto
+    de todos os campos, lidos sem inferência de tipos, pd.util.hash_pandas_object),
+    de modo que a impressão de uma linha não depende das outras. As impressões
+    das linhas já preparadas ficam em <saida>.impressoes.npy, na ordem do
+    arquivo de saída, precedidas pela impressão do esquema (nomes e tipos
+    inferidos das colunas). A cada execução:
+    - nada mudou → nada é reescrito
+    - só há linhas novas no fim da fonte → apenas elas são preparadas e
+      anexadas à saída
+    - linhas removidas, alteradas ou reordenadas, ou um tipo de coluna que
+      mudou (ex.: inteiros com um campo vazio viram float) → só as linhas novas
+      são preparadas; as demais são reaproveitadas da saída atual, convertidas
+      para os tipos atuais, e o arquivo é regravado na ordem da fonte
+    Duplicatas exatas têm a mesma impressão e são descartadas (fica a
+    primeira ocorrência, como em drop_duplicates). O resultado é sempre o
+    mesmo de uma preparação completa.
+
+Uso:
+    python preparacao_arabica.py                      # atualiza a saída padrão
+    python preparacao_arabica.py fonte.csv saida.csv --completo
+"""
+
+import argparse
+import os
+
+import numpy as np
+import pandas as pd
+
+
+ORIGEM = "arabica_data_cleaned.csv"
+SAIDA = "arabica_data_cleaned_prepared.csv"
+SUFIXO_ESTADO = ".impressoes.npy"
+
+
+# ---------------------------
+# Etapas de preparação (linha a linha)
+# ---------------------------
+
+def padronizar_nomes(df: pd.DataFrame) -> pd.DataFrame:
+    df.columns = [c.strip().lower().replace(" ", "_") for c in df.columns]
+    return df
+
+
+def preparar_linhas(df: pd.DataFrame) -> pd.DataFrame:
+    """Etapas do notebook que dependem só da própria linha."""
+    df = padronizar_nomes(df.copy())
+    if "altitude_low_meters" in df.columns and "altitude_high_meters" in df.columns:
+        df["altitude_mean_meters"] = df[["altitude_low_meters", "altitude_high_meters"]].mean(axis=1)
+    return df
+
+
+def ler_fonte(origem: str):
+    """(fonte com tipos inferidos, mesma fonte como texto cru) — o texto dá as impressões."""
+    fonte = pd.read_csv(origem, encoding="utf-8")
+    texto = pd.read_csv(origem, encoding="utf-8", dtype=str, keep_default_na=False)
+    return fonte, texto
+
+
+def impressoes(df: pd.DataFrame) -> np.ndarray:
+    """Hash de 64 bits do conteúdo de cada linha (independente do índice)."""
+    return pd.util.hash_pandas_object(df, index=False).to_numpy()
+
+
+def impressao_esquema(df: pd.DataFrame) -> np.uint64:
+    """Hash de 64 bits dos nomes e tipos das colunas."""
+    esquema = repr([(c, str(t)) for c, t in df.dtypes.items()])
+    return pd.util.hash_array(np.array([esquema], dtype=object))[0]
+
+
+# ---------------------------
+# Estado
+# ---------------------------
+
+def _caminho_estado(saida: str) -> str:
+    return saida + SUFIXO_ESTADO
+
+
+def _ler_estado(saida: str):
+    """(impressão do esquema, impressões das linhas da saída), ou None se saída/estado não existirem."""
+    estado = _caminho_estado(saida)
+    if not (os.path.exists(saida) and os.path.exists(estado)):
+        return None
+    estado = np.load(estado)
+    return estado[0], estado[1:]
+
+
+def _gravar(df: pd.DataFrame, saida: str, esquema, linhas: np.ndarray, anexar=False):
+    if anexar:
+        df.to_csv(saida, mode="a", header=False, index=False)
+    else:
+        temporario = f"{saida}.{os.getpid()}.tmp"
+        df.to_csv(temporario, index=False)
+        os.replace(temporario, saida)
+    # salvo em arquivo temporário com a extensão .npy (np.save acrescentaria outra)
+    temporario = f"{saida}.{os.getpid()}.tmp.npy"
+    np.save(temporario, np.concatenate([[esquema], linhas]).astype(np.uint64))
+    os.replace(temporario, _caminho_estado(saida))
+
+
+# ---------------------------
+# Pipeline
+# ---------------------------
+
+def atualizar_preparado(origem=ORIGEM, saida=SAIDA, completo=False) -> dict:
+    """
+    Atualiza saida a partir de origem preparando só as linhas novas/alteradas.
+    - completo: ignora o estado e prepara tudo de novo
+    Retorna um resumo: modo ("completo", "anexado", "regravado" ou
+    "inalterado"), linhas preparadas, removidas e total na saída.
+    """
+    fonte, texto = ler_fonte(origem)
+    todas = impressoes(texto)
+    _, primeiras = np.unique(todas, return_index=True)
+    primeiras.sort()                       # sem duplicatas, na ordem da fonte
+    atuais = todas[primeiras]
+    esquema = impressao_esquema(fonte)
+
+    estado = None if completo else _ler_estado(saida)
+    if estado is None:
+        _gravar(preparar_linhas(fonte.iloc[primeiras]), saida, esquema, atuais)
+        return {"modo": "completo", "preparadas": len(primeiras), "removidas": 0, "total": len(atuais)}
+    esquema_anterior, estado = estado
+
+    existentes = np.isin(atuais, estado)
+    mantidas = np.isin(estado, atuais)
+    novas = primeiras[~existentes]
+    resumo = {"preparadas": len(novas), "removidas": int((~mantidas).sum()), "total": len(atuais)}
+
+    n_existentes = int(existentes.sum())
+    mesma_ordem = (esquema == esquema_anterior and mantidas.all() and existentes[:n_existentes].all()
+                   and np.array_equal(estado, atuais[:n_existentes]))
+    if mesma_ordem:
+        if len(novas) == 0:
+            return {"modo": "inalterado", **resumo}
+        _gravar(preparar_linhas(fonte.iloc[novas]), saida, esquema, atuais, anexar=True)
+        return {"modo": "anexado", **resumo}
+
+    # remoções/alterações/reordenação/tipos novos: reaproveita as linhas já
+    # preparadas, nos tipos atuais, e regrava tudo na ordem da fonte
+    # round_trip: os floats relidos precisam ser exatamente os que foram gravados
+    antigo = pd.read_csv(saida, encoding="utf-8", float_precision="round_trip")
+    if len(antigo) != len(estado):
+        return atualizar_preparado(origem, saida, completo=True)
+    tipos = preparar_linhas(fonte.iloc[:0]).dtypes
+    partes = [antigo[mantidas].astype(tipos.to_dict()).set_axis(estado[mantidas])]
+    if len(novas):
+        partes.append(preparar_linhas(fonte.iloc[novas]).set_axis(atuais[~existentes]))
+    _gravar(pd.concat(partes).loc[atuais].reset_index(drop=True), saida, esquema, atuais)
+    return {"modo": "regravado", **resumo}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Preparação incremental do dataset arabica")
+    parser.add_argument("origem", nargs="?", default=ORIGEM)
+    parser.add_argument("saida", nargs="?", default=SAIDA)
+    parser.add_argument("--completo", action="store_true", help="prepara tudo de novo")
+    args = parser.parse_args()
+
+    resumo = atualizar_preparado(args.origem, args.saida, args.completo)
+    print(f"{resumo['modo']}: {resumo['preparadas']} linhas preparadas, "
+          f"{resumo['removidas']} removidas, {resumo['total']} na saída → {args.saida}")
+
+
+if __name__ == "__main__":
+    main()
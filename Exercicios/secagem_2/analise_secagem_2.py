@@ -1,9 +1,19 @@
 # Importando bibliotecas necessárias
 import pandas as pd
 import numpy as np
+import os
+import sys
+
+# módulos compartilhados do curso (modelo de secagem, figuras e ANOVA fatorial)
+PASTA_PROJETO = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..")
+sys.path.append(os.path.join(PASTA_PROJETO, "Aula_15_Projeto_Final"))
+sys.path.append(os.path.join(PASTA_PROJETO, "Aula_14_SciPy_Estatistica"))
+from ajuste_secagem import ModeloExponencialAssintotico
+from anova_fatorial import anova_fatorial
+from graficos_secagem import configurar_renderizacao, mostrar_ou_salvar
+configurar_renderizacao()  # FIGDIR definido -> figuras salvas em arquivo
 import matplotlib.pyplot as plt
 from scipy.optimize import curve_fit
-import os
 
 # 1. IMPORTAR OS DADOS
 print("1. Importando dados do arquivo CSV...")
@@ -61,7 +71,19 @@ print(f"Velocidade(s) do ar utilizada(s): {vel_const} m/s")
 if len(temp_const) == 1 and len(vel_const) == 1:
     print("Condições experimentais são constantes. Análise univariada (umidade vs tempo) é válida.")
 else:
-    print("Atenção: Condições variam. Análise mais complexa pode ser necessária.")
+    print("Atenção: Condições variam. ANOVA fatorial da umidade (condições x tempo):")
+    condicoes = [c for c in ['temperatura_C', 'velocidade_ar_m_s'] if df[c].nunique() > 1]
+    fatores = condicoes + ['tempo_h']
+    if 'repeticao' in df.columns:
+        # cada lote (condição + repetição) é pesado ao longo do tempo: medidas
+        # repetidas, com as condições testadas contra o erro entre lotes
+        print(anova_fatorial(df, 'umidade_g_agua_g_ms', fatores,
+                             sujeito=condicoes + ['repeticao']).round(4))
+    else:
+        # um lote por condição: não há erro entre lotes e, sem repetições por
+        # célula, a interação de maior ordem fica como resíduo
+        ordem = len(fatores) - 1 if not df.duplicated(fatores).any() else None
+        print(anova_fatorial(df, 'umidade_g_agua_g_ms', fatores, ordem=ordem).round(4))
 
 # 4. VISUALIZAR OS DADOS
 print("\n4. Visualizando os dados...")
@@ -73,7 +95,7 @@ plt.ylabel('Umidade (g água / g matéria seca)', fontsize=12)
 plt.grid(True, linestyle='--', alpha=0.7)
 plt.legend()
 plt.tight_layout()
-plt.show()
+mostrar_ou_salvar('curva_secagem')
 
 # 5. AJUSTAR MODELO COM SCIPY
 print("\n5. Ajustando modelo com SciPy...")
@@ -85,22 +107,23 @@ print("\n5. Ajustando modelo com SciPy...")
 #   Umidade_eq: umidade de equilíbrio (assintótica)
 #   k: constante de secagem
 
-def modelo_exponencial(t, U_eq, k):
-    U_0 = df['umidade_g_agua_g_ms'].iloc[0]  # Pega a umidade inicial dos dados
-    return U_eq + (U_0 - U_eq) * np.exp(-k * t)
-
 # Preparar dados para ajuste
 t_data = df['tempo_h'].values
 U_data = df['umidade_g_agua_g_ms'].values
 
+# U_0 (umidade inicial) é lido uma única vez e fica guardado no modelo;
+# antes ele era buscado no DataFrame a cada avaliação feita pelo curve_fit
+modelo_exponencial = ModeloExponencialAssintotico(U_data[0])
+
 # Chute inicial para os parâmetros [U_eq, k]
 # U_eq: valor próximo ao último ponto
 # k: um valor positivo pequeno
 p0 = [U_data[-1], 0.5]
 
-# Realizar o ajuste
+# Realizar o ajuste (com jacobiano analítico)
 try:
-    popt, pcov = curve_fit(modelo_exponencial, t_data, U_data, p0=p0)
+    popt, pcov = curve_fit(modelo_exponencial, t_data, U_data, p0=p0,
+                           jac=modelo_exponencial.jacobiano)
     U_eq_ajustado, k_ajustado = popt
     print(f"Parâmetros ajustados:")
     print(f"  Umidade de Equilíbrio (U_eq) = {U_eq_ajustado:.4f} g água / g ms")
@@ -126,7 +149,7 @@ try:
     plt.grid(True, linestyle='--', alpha=0.7)
     plt.legend()
     plt.tight_layout()
-    plt.show()
+    mostrar_ou_salvar('ajuste_exponencial')
 
 except Exception as e:
     print(f"Erro ao ajustar o modelo: {e}")
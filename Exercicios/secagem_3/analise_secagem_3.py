@@ -4,7 +4,13 @@
 # -----------------------------------------------------------------------------
 
 # Etapa 1: Importação das Bibliotecas
+import os
+import sys
 import pandas as pd
+# renderização compartilhada com o projeto final (FIGDIR definido -> figuras salvas em arquivo)
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "Aula_15_Projeto_Final"))
+from graficos_secagem import configurar_renderizacao, mostrar_ou_salvar
+configurar_renderizacao()
 import matplotlib.pyplot as plt
 from scipy.optimize import curve_fit
 import numpy as np
@@ -91,7 +97,15 @@ def modelo_page(t, k, n):
 # Ele retorna:
 # - popt: Array com os parâmetros otimizados (k e n, na ordem)
 # - pcov: Matriz de covariância dos parâmetros
-parametros_otimizados, matriz_covariancia = curve_fit(modelo_page, tempo, razao_umidade)
+#
+# O chute inicial (p0) vem da linearização do modelo: ln(-ln RU) = ln(k) + n*ln(t),
+# usando apenas os pontos com t > 0 e 0 < RU < 1 (onde o logaritmo existe).
+validos = (tempo > 0) & (razao_umidade > 0) & (razao_umidade < 1)
+n_inicial, ln_k_inicial = np.polyfit(np.log(tempo[validos]),
+                                     np.log(-np.log(razao_umidade[validos])), 1)
+p0 = [np.exp(ln_k_inicial), n_inicial]
+
+parametros_otimizados, matriz_covariancia = curve_fit(modelo_page, tempo, razao_umidade, p0=p0)
 
 # 3. Extrair os parâmetros encontrados
 k_ajustado = parametros_otimizados[0]
@@ -133,7 +147,7 @@ plt.savefig('grafico_secagem_ajuste.png')
 
 print("\n[SUCESSO] Gráfico 'grafico_secagem_ajuste.png' foi salvo no diretório.")
 
-# Exibir o gráfico
-plt.show()
+# Exibir o gráfico (ou, com FIGDIR, salvar também nessa pasta)
+mostrar_ou_salvar('grafico_secagem_ajuste')
 
 print("\n--- ANÁLISE CONCLUÍDA ---")
\ No newline at end of file
@@ -11,116 +11,98 @@ Descrição:
     5) Modelagem preditiva (Regressão Logística) para prever sobrevivência
     6) Geração de arquivos de saída: figuras PNG, CSV limpo e um resumo em TXT
 
+    Cada etapa também pode ser chamada isoladamente como subcomando. Só
+    pandas/numpy são importados no carregamento do módulo; matplotlib e
+    scikit-learn são importados sob demanda pelas etapas que os usam, e o
+    tempo gasto em importações é informado ao final de cada execução.
+
 Uso:
-    python analise_dados_titanic.py
+    python analise_titanic_2.py            # pipeline completo (equivale a "all")
+    python analise_titanic_2.py report     # perfil (faltantes + estatísticas) + CSV limpo
+    python analise_titanic_2.py plots      # gráficos exploratórios
+    python analise_titanic_2.py model      # regressão logística + modelo_titanic.json
+    python analise_titanic_2.py cv --dobras 5 --repeticoes 10 --processos 4
+    python analise_titanic_2.py score entrada.csv previsoes.csv
 """
 
+import argparse
+import importlib
 import os
+import sys
+import time
+
+_inicio_importacao = time.perf_counter()
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
 
-from sklearn.model_selection import train_test_split
-from sklearn.preprocessing import StandardScaler
-from sklearn.linear_model import LogisticRegression
-from sklearn.metrics import (
-    accuracy_score,
-    classification_report,
-    roc_auc_score,
-    roc_curve,
-    confusion_matrix
-)
+from preprocessamento_titanic import PreprocessadorTitanic, salvar_modelo
+
+# módulo -> segundos gastos na importação
+TEMPOS_IMPORTACAO = {"pandas/numpy": time.perf_counter() - _inicio_importacao}
 
 
 # ---------------------------
 # Funções auxiliares
 # ---------------------------
 
+def importar(modulo: str):
+    """Importa modulo sob demanda e registra o tempo gasto em TEMPOS_IMPORTACAO."""
+    if modulo in sys.modules:
+        return sys.modules[modulo]
+    inicio = time.perf_counter()
+    mod = importlib.import_module(modulo)
+    TEMPOS_IMPORTACAO[modulo] = time.perf_counter() - inicio
+    return mod
+
+
 def ensure_dir(path: str):
     """Cria diretório se não existir"""
     if not os.path.exists(path):
         os.makedirs(path)
 
 
+def _cache_dados():
+    """Módulo datasets/cache_dados.py, se disponível (senão None)."""
+    diretorio = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "datasets")
+    if os.path.isdir(diretorio) and diretorio not in sys.path:
+        sys.path.append(diretorio)
+    try:
+        return importar("cache_dados")
+    except ImportError:
+        return None
+
+
 def carregar_dados(caminho_csv: str) -> pd.DataFrame:
     """
     Carrega o dataset Titanic
     - caminho_csv: nome do arquivo (na mesma pasta do script)
+    A leitura passa pelo cache colunar de datasets/cache_dados.py quando existe.
     """
-    df = pd.read_csv(caminho_csv, sep=",", encoding="utf-8")
+    cache = _cache_dados()
+    leitor = pd.read_csv if cache is None else cache.ler_csv
+    df = leitor(caminho_csv, sep=",", encoding="utf-8")
     # padroniza nomes de colunas
     df.columns = [c.strip().lower().replace(" ", "_") for c in df.columns]
     return df
 
 
-def faltantes(df: pd.DataFrame) -> pd.DataFrame:
-    total = df.isna().sum()
-    perc = (total / len(df) * 100).round(2)
-    out = pd.DataFrame({"faltantes": total, "percentual": perc}).sort_values("percentual", ascending=False)
-    return out
-
-
-def estatisticas_numericas(df: pd.DataFrame) -> pd.DataFrame:
-    num_cols = df.select_dtypes(include=[np.number]).columns
-    return df[num_cols].describe(percentiles=[.05, .25, .5, .75, .95]).T
-
-
-def estatisticas_categoricas(df: pd.DataFrame, top_n=10) -> dict:
-    cat_cols = df.select_dtypes(exclude=[np.number]).columns
-    info = {}
-    for c in cat_cols:
-        info[c] = df[c].value_counts(dropna=False).head(top_n)
-    return info
-
-
-def tratar_dados(df: pd.DataFrame) -> pd.DataFrame:
+def tratar_dados(df: pd.DataFrame, prep: PreprocessadorTitanic = None) -> pd.DataFrame:
     """
-    Estratégias simples:
-    - sex, embarked → moda
+    Estratégias simples (ver PreprocessadorTitanic.tratar):
+    - sex, embarked → moda (dtype category)
     - age, fare → mediana
     - flags para presença de infos textuais (cabin, boat, home_dest etc.)
-    - extração de títulos do nome
+    - extração de títulos do nome (category, com títulos raros → "Rare")
     - family_size e is_alone
+    Se prep não for informado, as modas, medianas e títulos são aprendidos de df.
     """
-    dfc = df.copy()
-
-    if "home.dest" in dfc.columns and "home_dest" not in dfc.columns:
-        dfc = dfc.rename(columns={"home.dest": "home_dest"})
-
-    for col in ["sex", "embarked"]:
-        if col in dfc.columns:
-            moda = dfc[col].mode(dropna=True)
-            if len(moda) > 0:
-                dfc[col] = dfc[col].fillna(moda.iloc[0])
-
-    for col in ["age", "fare"]:
-        if col in dfc.columns:
-            med = dfc[col].median()
-            dfc[col] = dfc[col].fillna(med)
-
-    for col in ["cabin", "boat", "home_dest", "ticket", "name"]:
-        if col in dfc.columns:
-            dfc[f"has_{col}"] = (~dfc[col].isna()).astype(int)
-
-    if "name" in dfc.columns:
-        dfc["title"] = (
-            dfc["name"]
-            .astype(str)
-            .str.extract(r",\s*([^\.]+)\.", expand=False)
-            .str.strip()
-        )
-        title_counts = dfc["title"].value_counts(dropna=False)
-        raros = set(title_counts[title_counts < 10].index.tolist())
-        dfc["title"] = dfc["title"].apply(lambda x: "Rare" if x in raros else x)
-
-    if set(["sibsp", "parch"]).issubset(dfc.columns):
-        dfc["family_size"] = dfc["sibsp"].fillna(0) + dfc["parch"].fillna(0) + 1
-        dfc["is_alone"] = (dfc["family_size"] == 1).astype(int)
-
-    return dfc
+    if prep is None:
+        prep = PreprocessadorTitanic().ajustar(df)
+    return prep.tratar(df)
 
 
 def criar_graficos_basicos(df: pd.DataFrame, figdir: str):
+    plt = importar("matplotlib.pyplot")
     ensure_dir(figdir)
 
     if "age" in df.columns:
@@ -158,32 +140,24 @@ def criar_graficos_basicos(df: pd.DataFrame, figdir: str):
         plt.close()
 
 
-def preparar_modelagem(df: pd.DataFrame):
+def preparar_modelagem(df: pd.DataFrame, prep: PreprocessadorTitanic):
+    """
+    Monta X (dummies + padronização) com o estado já aprendido por prep, sem
+    reajustar nada; o mesmo prep transforma lotes novos de forma idêntica.
+    """
     if "survived" not in df.columns:
         return None, None
 
     y = df["survived"].astype(int)
-
-    possiveis = [
-        "pclass", "sex", "age", "sibsp", "parch", "fare", "embarked",
-        "family_size", "is_alone", "title",
-        "has_cabin", "has_boat", "has_home_dest", "has_ticket", "has_name"
-    ]
-    cols = [c for c in possiveis if c in df.columns]
-
-    X = df[cols].copy()
-
-    cat_cols = X.select_dtypes(exclude=[np.number]).columns.tolist()
-    X = pd.get_dummies(X, columns=cat_cols, drop_first=True)
-
-    num_cols = X.select_dtypes(include=[np.number]).columns
-    scaler = StandardScaler()
-    X[num_cols] = scaler.fit_transform(X[num_cols])
-
+    X = pd.DataFrame(prep.transformar_tratado(df), columns=prep.colunas, index=df.index)
     return X, y
 
 
 def modelar_e_avaliar(X, y, figdir: str):
+    plt = importar("matplotlib.pyplot")
+    train_test_split = importar("sklearn.model_selection").train_test_split
+    LogisticRegression = importar("sklearn.linear_model").LogisticRegression
+    metricas = importar("sklearn.metrics")
     ensure_dir(figdir)
 
     X_train, X_test, y_train, y_test = train_test_split(
@@ -196,11 +170,11 @@ def modelar_e_avaliar(X, y, figdir: str):
     y_pred = clf.predict(X_test)
     y_proba = clf.predict_proba(X_test)[:, 1]
 
-    acc = accuracy_score(y_test, y_pred)
-    auc = roc_auc_score(y_test, y_proba)
+    acc = metricas.accuracy_score(y_test, y_pred)
+    auc = metricas.roc_auc_score(y_test, y_proba)
 
     # curva ROC
-    fpr, tpr, _ = roc_curve(y_test, y_proba)
+    fpr, tpr, _ = metricas.roc_curve(y_test, y_proba)
     plt.figure()
     plt.plot(fpr, tpr, label=f"ROC AUC = {auc:.3f}")
     plt.plot([0, 1], [0, 1], linestyle="--")
@@ -212,7 +186,7 @@ def modelar_e_avaliar(X, y, figdir: str):
     plt.savefig(os.path.join(figdir, "roc_curve.png"))
     plt.close()
 
-    cm = confusion_matrix(y_test, y_pred)
+    cm = metricas.confusion_matrix(y_test, y_pred)
     plt.figure()
     plt.imshow(cm, interpolation="nearest")
     plt.title("Matriz de Confusão")
@@ -227,66 +201,171 @@ def modelar_e_avaliar(X, y, figdir: str):
     plt.savefig(os.path.join(figdir, "confusion_matrix.png"))
     plt.close()
 
-    clf_report = classification_report(y_test, y_pred, digits=3)
+    clf_report = metricas.classification_report(y_test, y_pred, digits=3)
 
     return acc, auc, clf_report, clf
 
 
 # ---------------------------
-# Programa principal
+# Subcomandos
 # ---------------------------
 
-def main():
-    arquivo_csv = "dados_titanic.csv"          # dataset na mesma pasta
-    figdir = "figures"
-    relatorio = "resumo_analise.txt"
-    csv_limpo = "dados_titanic_clean.csv"
+def escrever_relatorio(f, df: pd.DataFrame, arquivo_perfil=None):
+    """
+    Seções descritivas do relatório (faltantes e estatísticas), calculadas em
+    uma única passada por PerfilDados; opcionalmente grava o perfil em JSON.
+    """
+    perfil = importar("perfil_dados").perfilar(df)
+    f.write(perfil.para_texto())
+    if arquivo_perfil is not None:
+        perfil.para_json(arquivo_perfil)
 
-    # 1) Carregar
-    df = carregar_dados(arquivo_csv)
 
-    # 2) Análises básicas
-    falt_txt = faltantes(df)
-    est_num = estatisticas_numericas(df)
-    est_cat = estatisticas_categoricas(df)
+def escrever_modelagem(f, df_clean: pd.DataFrame, prep: PreprocessadorTitanic,
+                       figdir: str, arquivo_modelo: str):
+    """Ajusta e avalia a regressão logística e grava coeficientes e modelo."""
+    X, y = preparar_modelagem(df_clean, prep)
+    if X is None or y is None:
+        return
 
-    # 3) Tratar
-    df_clean = tratar_dados(df)
+    acc, auc, clf_report, clf = modelar_e_avaliar(X, y, figdir)
+    f.write("\n==== MODELAGEM ====\n")
+    f.write(f"Acurácia: {acc:.4f}\n")
+    f.write(f"ROC AUC: {auc:.4f}\n")
+    f.write(clf_report + "\n")
 
-    # 4) Gráficos
-    criar_graficos_basicos(df_clean, figdir)
+    coefs = pd.Series(clf.coef_[0], index=X.columns).sort_values(ascending=False)
+    coefs.to_csv("coeficientes_logistica.csv", encoding="utf-8")
+    f.write("\nCoeficientes salvos em coeficientes_logistica.csv\n")
 
-    # 5) Modelagem
-    X, y = preparar_modelagem(df_clean)
+    salvar_modelo(arquivo_modelo, prep, clf.coef_[0], clf.intercept_[0])
+    f.write(f"Modelo (pré-processamento + coeficientes) salvo em {arquivo_modelo}\n")
 
-    with open(relatorio, "w", encoding="utf-8") as f:
-        f.write("==== DADOS FALTANTES ====\n")
-        f.write(falt_txt.to_string() + "\n\n")
 
-        f.write("==== ESTATÍSTICAS NUMÉRICAS ====\n")
-        f.write(est_num.to_string() + "\n\n")
+def comando_all(args):
+    # 1) Carregar
+    df = carregar_dados(args.dados)
 
-        f.write("==== ESTATÍSTICAS CATEGÓRICAS (top 10 cada) ====\n")
-        for col, vc in est_cat.items():
-            f.write(f"\nColuna: {col}\n{vc.to_string()}\n")
+    # 2) Tratar (o pré-processador aprende modas, medianas, títulos, layout das
+    #    dummies e padronização uma única vez)
+    prep = PreprocessadorTitanic().ajustar(df)
+    df_clean = tratar_dados(df, prep)
 
-        if X is not None and y is not None:
-            acc, auc, clf_report, clf = modelar_e_avaliar(X, y, figdir)
-            f.write("\n==== MODELAGEM ====\n")
-            f.write(f"Acurácia: {acc:.4f}\n")
-            f.write(f"ROC AUC: {auc:.4f}\n")
-            f.write(clf_report + "\n")
+    # 3) Gráficos
+    criar_graficos_basicos(df_clean, args.figdir)
 
-            coefs = pd.Series(clf.coef_[0], index=X.columns).sort_values(ascending=False)
-            coefs.to_csv("coeficientes_logistica.csv", encoding="utf-8")
-            f.write("\nCoeficientes salvos em coeficientes_logistica.csv\n")
+    # 4) Relatório descritivo + modelagem
+    with open(args.relatorio, "w", encoding="utf-8") as f:
+        escrever_relatorio(f, df, args.perfil)
+        escrever_modelagem(f, df_clean, prep, args.figdir, args.modelo)
 
-    df_clean.to_csv(csv_limpo, index=False, encoding="utf-8")
+    df_clean.to_csv(args.csv_limpo, index=False, encoding="utf-8")
     print("Análise concluída! Arquivos gerados:")
-    print(f"- {relatorio}")
-    print(f"- {csv_limpo}")
-    print(f"- figuras em {figdir}/")
+    print(f"- {args.relatorio}")
+    print(f"- {args.perfil}")
+    print(f"- {args.csv_limpo}")
+    print(f"- figuras em {args.figdir}/")
     print("- coeficientes_logistica.csv (se modelagem rodou)")
+    print(f"- {args.modelo} (se modelagem rodou)")
+
+
+def comando_report(args):
+    df = carregar_dados(args.dados)
+    with open(args.relatorio, "w", encoding="utf-8") as f:
+        escrever_relatorio(f, df, args.perfil)
+    tratar_dados(df).to_csv(args.csv_limpo, index=False, encoding="utf-8")
+    print(f"Relatório salvo em {args.relatorio} (perfil em {args.perfil}); dados tratados em {args.csv_limpo}")
+
+
+def comando_plots(args):
+    df = carregar_dados(args.dados)
+    criar_graficos_basicos(tratar_dados(df), args.figdir)
+    print(f"Figuras salvas em {args.figdir}/")
+
+
+def comando_model(args):
+    df = carregar_dados(args.dados)
+    prep = PreprocessadorTitanic().ajustar(df)
+    df_clean = tratar_dados(df, prep)
+    with open(args.relatorio_modelo, "w", encoding="utf-8") as f:
+        escrever_modelagem(f, df_clean, prep, args.figdir, args.modelo)
+    print(f"Modelo salvo em {args.modelo}; métricas em {args.relatorio_modelo}")
+
+
+def comando_cv(args):
+    validacao = importar("validacao_titanic")
+    for modulo in validacao.DEPENDENCIAS:      # scikit-learn entra na contagem de importações
+        importar(modulo)
+    df = carregar_dados(args.dados)
+    prep = PreprocessadorTitanic().ajustar(df)
+    X, y = preparar_modelagem(tratar_dados(df, prep), prep)
+    if X is None:
+        print("Coluna 'survived' ausente: validação cruzada não realizada")
+        return
+
+    res = validacao.validar_cruzado(X.to_numpy(), y.to_numpy(), k=args.dobras,
+                                    repeticoes=args.repeticoes, n_processos=args.processos,
+                                    seed=args.seed)
+    texto = validacao.formatar_validacao(res)
+    with open(args.relatorio_cv, "w", encoding="utf-8") as f:
+        f.write(texto)
+    res["por_dobra"].to_csv(args.relatorio_cv.rsplit(".", 1)[0] + "_dobras.csv",
+                            index=False, encoding="utf-8")
+    print(texto)
+
+
+def comando_score(args):
+    pontuar = importar("pontuar_titanic")
+    n = pontuar.pontuar_arquivo(args.entrada, args.saida, args.modelo,
+                                args.tamanho_bloco, args.limiar, args.manter)
+    print(f"{n} registros pontuados → {args.saida}")
+
+
+def criar_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Análise do dataset Titanic")
+    parser.add_argument("--dados", default="dados_titanic.csv", help="dataset na mesma pasta")
+    parser.add_argument("--figdir", default="figures")
+    parser.add_argument("--relatorio", default="resumo_analise.txt")
+    parser.add_argument("--relatorio-modelo", default="resumo_modelo.txt")
+    parser.add_argument("--perfil", default="perfil_dados.json", help="perfil do dataset em JSON")
+    parser.add_argument("--csv-limpo", default="dados_titanic_clean.csv")
+    parser.add_argument("--modelo", default="modelo_titanic.json")
+    parser.set_defaults(funcao=comando_all)
+
+    sub = parser.add_subparsers(title="subcomandos")
+    sub.add_parser("all", help="pipeline completo").set_defaults(funcao=comando_all)
+    sub.add_parser("report", help="faltantes, estatísticas e CSV limpo").set_defaults(funcao=comando_report)
+    sub.add_parser("plots", help="gráficos exploratórios").set_defaults(funcao=comando_plots)
+    sub.add_parser("model", help="regressão logística e artefato do modelo").set_defaults(funcao=comando_model)
+
+    cv = sub.add_parser("cv", help="validação cruzada k-fold (repetida) em paralelo")
+    cv.add_argument("--dobras", type=int, default=5)
+    cv.add_argument("--repeticoes", type=int, default=1)
+    cv.add_argument("--processos", type=int, default=1)
+    cv.add_argument("--seed", type=int, default=42)
+    cv.add_argument("--relatorio-cv", default="validacao_cruzada.txt")
+    cv.set_defaults(funcao=comando_cv)
+
+    score = sub.add_parser("score", help="pontua um CSV/Parquet com o modelo salvo")
+    score.add_argument("entrada")
+    score.add_argument("saida")
+    score.add_argument("--tamanho-bloco", type=int, default=200_000)
+    score.add_argument("--limiar", type=float, default=0.5)
+    score.add_argument("--manter", nargs="*", default=[])
+    score.set_defaults(funcao=comando_score)
+    return parser
+
+
+# ---------------------------
+# Programa principal
+# ---------------------------
+
+def main(argv=None):
+    args = criar_parser().parse_args(argv)
+    args.funcao(args)
+
+    tempos = ", ".join(f"{m} {s:.2f} s" for m, s in TEMPOS_IMPORTACAO.items())
+    print(f"Importações: {tempos} (total {sum(TEMPOS_IMPORTACAO.values()):.2f} s)")
 
 
 if __name__ == "__main__":
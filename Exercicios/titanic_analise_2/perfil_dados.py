@@ -0,0 +1,264 @@
+# -*- coding: utf-8 -*-
+"""
+Perfil de um conjunto de dados em uma única passada por blocos
+Descrição:
+    Substitui as três varreduras separadas do relatório (isna().sum(),
+    describe e um value_counts por coluna) por um único percurso dos dados,
+    bloco a bloco, que atualiza ao mesmo tempo:
+    - contagem de faltantes de todas as colunas
+    - contagem, média, desvio, mínimo e máximo das colunas numéricas (exatos;
+      média e variância combinadas entre blocos pela fórmula de Chan)
+    - percentis por amostragem de reservatório de linhas (exatos enquanto o
+      número de linhas não passa do tamanho da amostra)
+    - frequências top-N das colunas não numéricas por um resumo Misra-Gries
+      com capacidade fixa (exato enquanto o número de valores distintos não
+      passa da capacidade; acima disso, contagens são limites inferiores com
+      erro máximo informado)
+
+    O resultado sai como texto (mesmo layout do resumo_analise.txt) ou como
+    dicionário/JSON.
+
+Uso:
+    from perfil_dados import perfilar
+    perfil = perfilar("dados_titanic.csv", tamanho_bloco=100_000)
+    print(perfil.para_texto())
+    perfil.para_json("perfil_dados.json")
+"""
+
+import json
+import warnings
+
+import numpy as np
+import pandas as pd
+
+
+PERCENTIS = (0.05, 0.25, 0.5, 0.75, 0.95)
+TAMANHO_BLOCO = 100_000
+
+
+class PerfilDados:
+    """
+    Acumulador do perfil; chame atualizar(bloco) para cada bloco de linhas.
+    - top_n: valores mais frequentes listados por coluna não numérica
+    - amostra: tamanho do reservatório de linhas usado nos percentis
+    - capacidade: contadores mantidos por coluna no resumo Misra-Gries
+    As colunas (e quais são numéricas) são definidas pelo primeiro bloco;
+    valores não numéricos que apareçam depois em uma coluna numérica ficam
+    fora das estatísticas numéricas (mas não contam como faltantes).
+    """
+
+    def __init__(self, top_n=10, amostra=100_000, capacidade=10_000,
+                 percentis=PERCENTIS, seed=42):
+        self.top_n = top_n
+        self.amostra = amostra
+        self.capacidade = capacidade
+        self.percentis = tuple(percentis)
+        self.rng = np.random.default_rng(seed)
+
+        self.colunas = None
+        self.numericas = None
+        self.categoricas = None
+        self.linhas = 0
+        self.faltantes_contagem = None
+        # numéricas: vetores alinhados com self.numericas
+        self.n = self.media = self.m2 = self.minimo = self.maximo = None
+        self.reservatorio = None
+        # categóricas: coluna -> Series valor -> contagem; coluna -> erro máximo
+        self.contagens = {}
+        self.erro = {}
+
+    # ---------------------------
+    # Atualização
+    # ---------------------------
+
+    def _iniciar(self, bloco: pd.DataFrame):
+        self.colunas = list(bloco.columns)
+        self.numericas = list(bloco.select_dtypes(include=[np.number]).columns)
+        self.categoricas = list(bloco.select_dtypes(exclude=[np.number]).columns)
+        self.faltantes_contagem = np.zeros(len(self.colunas), dtype=np.int64)
+        k = len(self.numericas)
+        self.n = np.zeros(k)
+        self.media = np.zeros(k)
+        self.m2 = np.zeros(k)
+        self.minimo = np.full(k, np.inf)
+        self.maximo = np.full(k, -np.inf)
+        self.reservatorio = np.empty((0, k))
+        self.contagens = {c: pd.Series(dtype=np.int64) for c in self.categoricas}
+        self.erro = {c: 0 for c in self.categoricas}
+
+    def atualizar(self, bloco: pd.DataFrame):
+        if self.colunas is None:
+            self._iniciar(bloco)
+        bloco = bloco[self.colunas]
+
+        self.faltantes_contagem += bloco.isna().sum().to_numpy()
+        if self.numericas:
+            numericas = bloco[self.numericas].apply(pd.to_numeric, errors="coerce")
+            self._atualizar_numericas(numericas.to_numpy(dtype=float, na_value=np.nan))
+        for col in self.categoricas:
+            self._atualizar_frequencias(col, bloco[col].value_counts(dropna=False, sort=False))
+        self.linhas += len(bloco)
+        return self
+
+    def _atualizar_numericas(self, X: np.ndarray):
+        validos = ~np.isnan(X)
+        n_b = validos.sum(axis=0).astype(float)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            media_b = np.where(n_b > 0, np.nansum(X, axis=0) / n_b, 0.0)
+            m2_b = np.nansum((X - media_b) ** 2, axis=0)
+
+            # combinação de média e soma de quadrados (Chan et al.)
+            n_total = self.n + n_b
+            delta = media_b - self.media
+            self.media = np.where(n_total > 0, self.media + delta * n_b / n_total, 0.0)
+            self.m2 = self.m2 + m2_b + np.where(n_total > 0, delta ** 2 * self.n * n_b / n_total, 0.0)
+        self.n = n_total
+        if len(X):
+            self.minimo = np.minimum(self.minimo, np.where(validos, X, np.inf).min(axis=0))
+            self.maximo = np.maximum(self.maximo, np.where(validos, X, -np.inf).max(axis=0))
+        self._atualizar_reservatorio(X)
+
+    def _atualizar_reservatorio(self, X: np.ndarray):
+        """Algoritmo R vetorizado: a linha de posição global i entra com probabilidade k/(i+1)."""
+        livres = self.amostra - len(self.reservatorio)
+        if livres > 0:
+            self.reservatorio = np.vstack([self.reservatorio, X[:livres]])
+            X = X[livres:]
+        if len(X) == 0:
+            return
+        inicio = self.linhas + livres if livres > 0 else self.linhas
+        posicoes = inicio + np.arange(len(X))
+        destino = self.rng.integers(0, posicoes + 1)
+        aceitas = destino < self.amostra
+        # com destinos repetidos vale a última atribuição, como no algoritmo sequencial
+        self.reservatorio[destino[aceitas]] = X[aceitas]
+
+    def _atualizar_frequencias(self, col, contagem_bloco: pd.Series):
+        """Resumo Misra-Gries combinável: soma as contagens e, se exceder a capacidade, desconta o excedente."""
+        atual = pd.concat([self.contagens[col], contagem_bloco])
+        atual = atual.groupby(level=0, sort=False, dropna=False).sum()
+        if len(atual) > self.capacidade:
+            corte = np.partition(atual.to_numpy(), len(atual) - self.capacidade - 1)[
+                len(atual) - self.capacidade - 1]
+            atual = atual - corte
+            atual = atual[atual > 0]
+            self.erro[col] += int(corte)
+        self.contagens[col] = atual
+
+    # ---------------------------
+    # Resultados
+    # ---------------------------
+
+    def faltantes(self) -> pd.DataFrame:
+        total = pd.Series(self.faltantes_contagem, index=self.colunas)
+        perc = (total / self.linhas * 100).round(2)
+        return (pd.DataFrame({"faltantes": total, "percentual": perc})
+                .sort_values("percentual", ascending=False))
+
+    def estatisticas_numericas(self) -> pd.DataFrame:
+        """Tabela no formato de describe(percentiles=...).T."""
+        with np.errstate(invalid="ignore", divide="ignore"):
+            desvio = np.sqrt(self.m2 / (self.n - 1))
+        vazias = self.n == 0
+        tabela = {
+            "count": self.n,
+            "mean": np.where(vazias, np.nan, self.media),
+            "std": np.where(self.n > 1, desvio, np.nan),
+            "min": np.where(vazias, np.nan, self.minimo),
+        }
+        if len(self.reservatorio):
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore", RuntimeWarning)  # colunas sem valores na amostra
+                quantis = np.nanquantile(self.reservatorio, self.percentis, axis=0)
+        else:
+            quantis = np.full((len(self.percentis), len(self.numericas)), np.nan)
+        for p, q in zip(self.percentis, quantis):
+            tabela[f"{p * 100:g}%"] = q
+        tabela["max"] = np.where(vazias, np.nan, self.maximo)
+        return pd.DataFrame(tabela, index=self.numericas)
+
+    def estatisticas_categoricas(self) -> dict:
+        """Coluna -> Series com os top_n valores (NaN incluído) e suas contagens."""
+        info = {}
+        for col, contagem in self.contagens.items():
+            top = contagem.sort_values(ascending=False, kind="stable").head(self.top_n)
+            top.index.name = col
+            info[col] = top.rename("count")
+        return info
+
+    def aproximado(self) -> dict:
+        """Indica quais partes do perfil são aproximadas."""
+        return {
+            "percentis": self.linhas > self.amostra,
+            "frequencias": {c: e for c, e in self.erro.items() if e > 0},
+        }
+
+    def para_texto(self) -> str:
+        partes = ["==== DADOS FALTANTES ====\n", self.faltantes().to_string() + "\n\n",
+                  "==== ESTATÍSTICAS NUMÉRICAS ====\n", self.estatisticas_numericas().to_string() + "\n\n",
+                  f"==== ESTATÍSTICAS CATEGÓRICAS (top {self.top_n} cada) ====\n"]
+        for col, vc in self.estatisticas_categoricas().items():
+            partes.append(f"\nColuna: {col}\n{vc.to_string()}\n")
+        aprox = self.aproximado()
+        if aprox["percentis"]:
+            partes.append(f"\nPercentis estimados com amostra de {self.amostra} linhas\n")
+        for col, erro in aprox["frequencias"].items():
+            partes.append(f"Frequências de {col} subestimadas em no máximo {erro}\n")
+        return "".join(partes)
+
+    def para_dict(self) -> dict:
+        def valor(v):
+            if v is None or (isinstance(v, float) and np.isnan(v)) or v is pd.NA:
+                return None
+            return v.item() if isinstance(v, np.generic) else v
+
+        falt = self.faltantes()
+        num = self.estatisticas_numericas()
+        cat = self.estatisticas_categoricas()
+        colunas = {}
+        for col in self.colunas:
+            info = {"faltantes": int(falt.at[col, "faltantes"]),
+                    "percentual": float(falt.at[col, "percentual"])}
+            if col in num.index:
+                info["tipo"] = "numerica"
+                info.update({k: valor(v) for k, v in num.loc[col].items()})
+            else:
+                info["tipo"] = "categorica"
+                info["top"] = [[None if pd.isna(k) else str(k), int(v)] for k, v in cat[col].items()]
+            colunas[str(col)] = info
+        return {"linhas": self.linhas, "colunas": colunas, "aproximado": self.aproximado()}
+
+    def para_json(self, caminho=None) -> str:
+        texto = json.dumps(self.para_dict(), ensure_ascii=False, indent=2)
+        if caminho is not None:
+            with open(caminho, "w", encoding="utf-8") as f:
+                f.write(texto)
+        return texto
+
+
+def ler_blocos(fonte, tamanho_bloco=TAMANHO_BLOCO):
+    """
+    Blocos de um DataFrame em memória ou de um arquivo CSV/Parquet.
+    No CSV os tipos são inferidos no primeiro bloco e as colunas não numéricas
+    são lidas como texto em todos os blocos (senão um bloco só com "13" viraria
+    inteiro e contaria separado do "13" texto de outro bloco).
+    """
+    if isinstance(fonte, pd.DataFrame):
+        for inicio in range(0, max(len(fonte), 1), tamanho_bloco):
+            yield fonte.iloc[inicio:inicio + tamanho_bloco]
+    elif str(fonte).lower().endswith((".parquet", ".pq")):
+        import pyarrow.parquet as pq
+        for lote in pq.ParquetFile(fonte).iter_batches(batch_size=tamanho_bloco):
+            yield lote.to_pandas()
+    else:
+        primeiro = pd.read_csv(fonte, sep=",", encoding="utf-8", nrows=tamanho_bloco)
+        texto = {c: str for c in primeiro.select_dtypes(exclude=[np.number]).columns}
+        yield from pd.read_csv(fonte, sep=",", encoding="utf-8", chunksize=tamanho_bloco, dtype=texto)
+
+
+def perfilar(fonte, tamanho_bloco=TAMANHO_BLOCO, **kwargs) -> PerfilDados:
+    """Perfil de fonte (DataFrame ou caminho CSV/Parquet) em uma passada; kwargs vão para PerfilDados."""
+    perfil = PerfilDados(**kwargs)
+    for bloco in ler_blocos(fonte, tamanho_bloco):
+        perfil.atualizar(bloco)
+    return perfil
@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+"""
+Pontuação em lote com o modelo logístico do Titanic
+Descrição:
+    Carrega o artefato salvo por analise_titanic_2.py (modelo_titanic.json:
+    estado do pré-processamento + coeficientes) e pontua arquivos CSV ou
+    Parquet em blocos. Para cada bloco: tratamento e matriz de variáveis com o
+    estado já aprendido, produto escalar em NumPy e sigmoide; as previsões
+    são gravadas assim que cada bloco fica pronto. O scikit-learn não é
+    importado, o que mantém a inicialização rápida.
+
+Uso:
+    python pontuar_titanic.py entrada.csv previsoes.csv
+    python pontuar_titanic.py entrada.parquet previsoes.parquet --tamanho-bloco 500000
+    python pontuar_titanic.py dados_titanic.csv previsoes.csv --manter name ticket
+"""
+
+import argparse
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+from preprocessamento_titanic import carregar_modelo
+
+
+TAMANHO_BLOCO = 200_000
+
+
+def _e_parquet(caminho: str) -> bool:
+    return caminho.lower().endswith((".parquet", ".pq"))
+
+
+def ler_blocos(caminho: str, tamanho_bloco=TAMANHO_BLOCO):
+    """Lê CSV ou Parquet em DataFrames de até tamanho_bloco linhas."""
+    if _e_parquet(caminho):
+        import pyarrow.parquet as pq
+        arquivo = pq.ParquetFile(caminho)
+        for lote in arquivo.iter_batches(batch_size=tamanho_bloco):
+            yield lote.to_pandas()
+    else:
+        yield from pd.read_csv(caminho, sep=",", encoding="utf-8", chunksize=tamanho_bloco)
+
+
+def padronizar_colunas(df: pd.DataFrame) -> pd.DataFrame:
+    """Mesma padronização de nomes de carregar_dados."""
+    df.columns = [c.strip().lower().replace(" ", "_") for c in df.columns]
+    return df
+
+
+def sigmoide(z: np.ndarray) -> np.ndarray:
+    """1 / (1 + exp(-z)) sem overflow para |z| grande."""
+    saida = np.empty_like(z)
+    pos = z >= 0
+    saida[pos] = 1.0 / (1.0 + np.exp(-z[pos]))
+    ez = np.exp(z[~pos])
+    saida[~pos] = ez / (1.0 + ez)
+    return saida
+
+
+def pontuar_bloco(df: pd.DataFrame, prep, coeficientes, intercepto, limiar=0.5, manter=()):
+    """Probabilidade de sobrevivência e classe prevista para um bloco de dados brutos."""
+    X = prep.transformar(padronizar_colunas(df))
+    prob = sigmoide(X @ coeficientes + intercepto)
+    saida = {c: df[c].to_numpy() for c in manter if c in df.columns}
+    saida["prob_sobrevivencia"] = prob
+    saida["previsao"] = (prob >= limiar).astype(np.int8)
+    return pd.DataFrame(saida)
+
+
+def pontuar_arquivo(entrada: str, saida: str, modelo="modelo_titanic.json",
+                    tamanho_bloco=TAMANHO_BLOCO, limiar=0.5, manter=()) -> int:
+    """
+    Pontua entrada (CSV/Parquet) e grava saida (CSV/Parquet) bloco a bloco.
+    Retorna o número de linhas pontuadas.
+    """
+    prep, coeficientes, intercepto = carregar_modelo(modelo)
+    manter = [c.strip().lower().replace(" ", "_") for c in manter]
+
+    total = 0
+    escritor = None
+    if not _e_parquet(saida) and os.path.exists(saida):
+        os.remove(saida)
+    try:
+        for i, bloco in enumerate(ler_blocos(entrada, tamanho_bloco)):
+            previsoes = pontuar_bloco(bloco, prep, coeficientes, intercepto, limiar, manter)
+            if _e_parquet(saida):
+                import pyarrow as pa
+                import pyarrow.parquet as pq
+                tabela = pa.Table.from_pandas(previsoes, preserve_index=False)
+                if escritor is None:
+                    escritor = pq.ParquetWriter(saida, tabela.schema)
+                escritor.write_table(tabela)
+            else:
+                previsoes.to_csv(saida, mode="a", header=(i == 0), index=False, encoding="utf-8")
+            total += len(previsoes)
+    finally:
+        if escritor is not None:
+            escritor.close()
+    return total
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pontua registros com o modelo logístico do Titanic")
+    parser.add_argument("entrada", help="arquivo CSV ou Parquet com os registros")
+    parser.add_argument("saida", help="arquivo CSV ou Parquet de saída")
+    parser.add_argument("--modelo", default="modelo_titanic.json")
+    parser.add_argument("--tamanho-bloco", type=int, default=TAMANHO_BLOCO)
+    parser.add_argument("--limiar", type=float, default=0.5)
+    parser.add_argument("--manter", nargs="*", default=[],
+                        help="colunas da entrada copiadas para a saída (ex.: identificadores)")
+    args = parser.parse_args()
+
+    inicio = time.perf_counter()
+    n = pontuar_arquivo(args.entrada, args.saida, args.modelo,
+                        args.tamanho_bloco, args.limiar, args.manter)
+    duracao = time.perf_counter() - inicio
+    print(f"{n} registros pontuados em {duracao:.2f} s "
+          f"({n / max(duracao, 1e-9) * 60:,.0f} linhas/min) → {args.saida}")
+
+
+if __name__ == "__main__":
+    main()
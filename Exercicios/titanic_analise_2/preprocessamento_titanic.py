@@ -0,0 +1,237 @@
+# -*- coding: utf-8 -*-
+"""
+Pré-processamento do Titanic com ajuste único e transformação reutilizável
+Descrição:
+    PreprocessadorTitanic aprende uma única vez tudo o que o tratamento e a
+    modelagem precisam (modas, medianas, títulos frequentes, layout das
+    variáveis dummy e média/desvio do padronizador) e depois transforma
+    qualquer lote novo sem reajustar nada. O estado é salvo em JSON junto com
+    os coeficientes da regressão logística (salvar_modelo / carregar_modelo),
+    de forma que novos registros podem ser pontuados sem o scikit-learn.
+
+Uso:
+    prep = PreprocessadorTitanic().ajustar(df)
+    X = prep.transformar(df_novo)             # np.ndarray (n, n_variaveis)
+    salvar_modelo("modelo_titanic.json", prep, clf.coef_[0], clf.intercept_[0])
+"""
+
+import json
+
+import numpy as np
+import pandas as pd
+
+
+COLUNAS_MODA = ["sex", "embarked"]
+COLUNAS_MEDIANA = ["age", "fare"]
+COLUNAS_FLAG = ["cabin", "boat", "home_dest", "ticket", "name"]
+COLUNAS_MODELO = [
+    "pclass", "sex", "age", "sibsp", "parch", "fare", "embarked",
+    "family_size", "is_alone", "title",
+    "has_cabin", "has_boat", "has_home_dest", "has_ticket", "has_name"
+]
+COLUNAS_CATEGORICAS = ["sex", "embarked", "title"]
+REGEX_TITULO = r",\s*([^\.]+)\."
+MINIMO_TITULO = 10
+ROTULO_RARO = "Rare"
+
+
+def agrupar_raros(serie: pd.Series, minimo=10, rotulo="Rare") -> pd.Series:
+    """
+    Converte para Categorical e junta as categorias com menos de `minimo`
+    ocorrências em `rotulo`. A troca é feita nos códigos inteiros (um
+    bincount e um remapeamento por indexação), sem apply linha a linha.
+    As categorias resultantes ficam em ordem alfabética.
+    """
+    cat = serie.astype("category")
+    codigos = cat.cat.codes.to_numpy()
+    categorias = cat.cat.categories
+    contagem = np.bincount(codigos[codigos >= 0], minlength=len(categorias))
+
+    raros = contagem < minimo
+    if not raros.any():
+        return cat
+
+    novas = sorted(set(categorias[~raros]) | {rotulo})
+    posicao = {c: i for i, c in enumerate(novas)}
+    mapa = np.array([posicao[rotulo] if raro else posicao[c]
+                     for c, raro in zip(categorias, raros)] + [-1])  # -1 (NaN) continua -1
+    return pd.Series(pd.Categorical.from_codes(mapa[codigos], novas),
+                     index=serie.index, name=serie.name)
+
+
+def extrair_titulos(nomes: pd.Series) -> pd.Series:
+    return nomes.astype(str).str.extract(REGEX_TITULO, expand=False).str.strip()
+
+
+class PreprocessadorTitanic:
+    """
+    Estado aprendido:
+    - modas / medianas: valores de imputação
+    - titulos: títulos mantidos (os demais viram "Rare")
+    - categorias: categorias de cada coluna categórica (a primeira é descartada
+      nas dummies, como em get_dummies(drop_first=True))
+    - colunas_numericas, media, desvio: padronização (StandardScaler)
+    - colunas: nomes das variáveis da matriz final, na ordem do modelo
+    """
+
+    def __init__(self):
+        self.modas = {}
+        self.medianas = {}
+        self.titulos = None
+        self.categorias = {}
+        self.colunas_numericas = []
+        self.media = None
+        self.desvio = None
+        self.colunas = []
+
+    # ---------------------------
+    # Ajuste
+    # ---------------------------
+
+    def ajustar(self, df: pd.DataFrame):
+        """Aprende o estado a partir dos dados brutos (saída de carregar_dados)."""
+        df = self._padronizar_nomes(df)
+        for col in COLUNAS_MODA:
+            if col in df.columns:
+                moda = df[col].mode(dropna=True)
+                if len(moda) > 0:
+                    self.modas[col] = moda.iloc[0]
+        for col in COLUNAS_MEDIANA:
+            if col in df.columns:
+                self.medianas[col] = float(df[col].median())
+        if "name" in df.columns:
+            titulos = agrupar_raros(extrair_titulos(df["name"]), MINIMO_TITULO, ROTULO_RARO)
+            self.titulos = [c for c in titulos.cat.categories if c != ROTULO_RARO]
+
+        tratado = self.tratar(df)
+        cols = [c for c in COLUNAS_MODELO if c in tratado.columns]
+        # só as categorias observadas, como em get_dummies
+        self.categorias = {c: [str(v) for v in tratado[c].cat.remove_unused_categories().cat.categories]
+                           for c in cols if c in COLUNAS_CATEGORICAS}
+        self.colunas_numericas = [c for c in cols if c not in self.categorias]
+
+        numericos = tratado[self.colunas_numericas].to_numpy(dtype=float)
+        self.media = numericos.mean(axis=0)
+        desvio = numericos.std(axis=0)
+        self.desvio = np.where(desvio == 0, 1.0, desvio)  # como o StandardScaler
+
+        self.colunas = self.colunas_numericas + [
+            f"{c}_{v}" for c, cats in self.categorias.items() for v in cats[1:]]
+        return self
+
+    # ---------------------------
+    # Transformação
+    # ---------------------------
+
+    @staticmethod
+    def _padronizar_nomes(df: pd.DataFrame) -> pd.DataFrame:
+        if "home.dest" in df.columns and "home_dest" not in df.columns:
+            df = df.rename(columns={"home.dest": "home_dest"})
+        return df
+
+    def tratar(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Tratamento com o estado aprendido (sem reajuste):
+        - sex, embarked → moda (dtype category)
+        - age, fare → mediana
+        - flags para presença de infos textuais (cabin, boat, home_dest etc.)
+        - extração de títulos do nome (category, títulos raros → "Rare")
+        - family_size e is_alone
+        """
+        dfc = self._padronizar_nomes(df.copy())
+
+        for col in COLUNAS_MODA:
+            if col in dfc.columns:
+                if col in self.modas:
+                    dfc[col] = dfc[col].fillna(self.modas[col])
+                dfc[col] = dfc[col].astype("category")
+
+        for col in COLUNAS_MEDIANA:
+            if col in dfc.columns and col in self.medianas:
+                dfc[col] = dfc[col].fillna(self.medianas[col])
+
+        for col in COLUNAS_FLAG:
+            if col in dfc.columns:
+                dfc[f"has_{col}"] = (~dfc[col].isna()).astype(int)
+
+        if "name" in dfc.columns and self.titulos is not None:
+            titulos = extrair_titulos(dfc["name"])
+            categorias = sorted(set(self.titulos) | {ROTULO_RARO})
+            conhecidos = titulos.where(titulos.isin(self.titulos))
+            codigos = pd.Categorical(conhecidos, categories=self.titulos).codes
+            mapa = np.array([categorias.index(t) for t in self.titulos]
+                            + [categorias.index(ROTULO_RARO)])
+            # código -1 (título raro ou desconhecido) → "Rare"; NaN continua NaN
+            novos = np.where(titulos.isna().to_numpy(), -1, mapa[codigos])
+            dfc["title"] = pd.Categorical.from_codes(novos, categorias)
+
+        if set(["sibsp", "parch"]).issubset(dfc.columns):
+            dfc["family_size"] = dfc["sibsp"].fillna(0) + dfc["parch"].fillna(0) + 1
+            dfc["is_alone"] = (dfc["family_size"] == 1).astype(int)
+
+        return dfc
+
+    def transformar_tratado(self, tratado: pd.DataFrame) -> np.ndarray:
+        """Matriz do modelo a partir de dados já tratados: numéricas padronizadas + dummies."""
+        numericos = tratado[self.colunas_numericas].to_numpy(dtype=float)
+        blocos = [(numericos - self.media) / self.desvio]
+        for col, cats in self.categorias.items():
+            valores = tratado[col].astype(object)
+            codigos = pd.Categorical(valores.where(valores.isin(cats)), categories=cats).codes
+            dummies = np.zeros((len(tratado), len(cats) - 1))
+            linhas = np.flatnonzero(codigos >= 1)
+            dummies[linhas, codigos[linhas] - 1] = 1.0
+            blocos.append(dummies)
+        return np.hstack(blocos)
+
+    def transformar(self, df: pd.DataFrame) -> np.ndarray:
+        """Trata e transforma dados brutos em uma matriz (n, len(colunas))."""
+        return self.transformar_tratado(self.tratar(df))
+
+    # ---------------------------
+    # Persistência
+    # ---------------------------
+
+    def para_dict(self) -> dict:
+        return {
+            "modas": {k: str(v) for k, v in self.modas.items()},
+            "medianas": self.medianas,
+            "titulos": self.titulos,
+            "categorias": self.categorias,
+            "colunas_numericas": self.colunas_numericas,
+            "media": self.media.tolist(),
+            "desvio": self.desvio.tolist(),
+            "colunas": self.colunas,
+        }
+
+    @classmethod
+    def de_dict(cls, estado: dict):
+        prep = cls()
+        prep.modas = estado["modas"]
+        prep.medianas = estado["medianas"]
+        prep.titulos = estado["titulos"]
+        prep.categorias = estado["categorias"]
+        prep.colunas_numericas = estado["colunas_numericas"]
+        prep.media = np.asarray(estado["media"], dtype=float)
+        prep.desvio = np.asarray(estado["desvio"], dtype=float)
+        prep.colunas = estado["colunas"]
+        return prep
+
+
+def salvar_modelo(caminho: str, prep: PreprocessadorTitanic, coeficientes, intercepto):
+    """Grava pré-processamento + regressão logística em um único JSON."""
+    artefato = {
+        "preprocessamento": prep.para_dict(),
+        "coeficientes": [float(c) for c in coeficientes],
+        "intercepto": float(intercepto),
+    }
+    with open(caminho, "w", encoding="utf-8") as f:
+        json.dump(artefato, f, ensure_ascii=False, indent=2)
+
+
+def carregar_modelo(caminho: str):
+    """Retorna (PreprocessadorTitanic, coeficientes np.ndarray, intercepto float)."""
+    with open(caminho, "r", encoding="utf-8") as f:
+        artefato = json.load(f)
+    prep = PreprocessadorTitanic.de_dict(artefato["preprocessamento"])
+    return prep, np.asarray(artefato["coeficientes"], dtype=float), artefato["intercepto"]
@@ -0,0 +1,194 @@
+# -*- coding: utf-8 -*-
+"""
+Validação cruzada (k-fold e k-fold repetido) da regressão logística do Titanic
+Descrição:
+    Em vez de uma única divisão 75/25, avalia o modelo em k dobras
+    estratificadas, opcionalmente repetidas com embaralhamentos diferentes.
+    A matriz de variáveis X, o alvo y e a atribuição das dobras são copiados
+    uma única vez para memória compartilhada (multiprocessing.shared_memory);
+    cada processo trabalhador apenas se conecta a esses blocos e recebe, por
+    tarefa, só o par (repetição, dobra). Nada de X é serializado por dobra.
+
+    Acurácia, AUC e a matriz de confusão de cada dobra são agregadas em média,
+    desvio padrão e intervalo de confiança t de Student. As dobras não são
+    independentes (compartilham dados de treino), então o intervalo é uma
+    aproximação otimista, útil para comparar modelos entre si.
+
+Uso:
+    from validacao_titanic import validar_cruzado, formatar_validacao
+    res = validar_cruzado(X, y, k=5, repeticoes=10, n_processos=4)
+    print(formatar_validacao(res))
+"""
+
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+import pandas as pd
+
+
+METRICAS = ["acuracia", "auc"]
+# módulos usados por avaliar_dobra; quem chama pode importá-los antes (e medir
+# o tempo), e os processos criados por fork já os recebem carregados
+DEPENDENCIAS = ("sklearn.linear_model", "sklearn.metrics")
+CELULAS_CONFUSAO = ["vn", "fp", "fn", "vp"]  # ordem de confusion_matrix(...).ravel()
+
+# blocos de memória compartilhada abertos no processo trabalhador
+_compartilhado = {}
+
+
+# ---------------------------
+# Dobras e memória compartilhada
+# ---------------------------
+
+def atribuir_dobras(y, k=5, repeticoes=1, seed=42) -> np.ndarray:
+    """
+    Matriz (repeticoes, n) com o número da dobra de cada linha. Em cada
+    repetição as linhas são embaralhadas dentro de cada classe e distribuídas
+    em rodízio, de modo que todas as dobras tenham a mesma proporção de classes.
+    """
+    y = np.asarray(y)
+    rng = np.random.default_rng(seed)
+    dobras = np.empty((repeticoes, len(y)), dtype=np.int16)
+    for r in range(repeticoes):
+        ordem = rng.permutation(len(y))
+        ordem = ordem[np.argsort(y[ordem], kind="stable")]
+        dobras[r, ordem] = np.arange(len(y)) % k
+    return dobras
+
+
+def _criar_compartilhado(arr: np.ndarray):
+    """Copia arr para um bloco novo de memória compartilhada; retorna (bloco, descritor)."""
+    bloco = shared_memory.SharedMemory(create=True, size=max(arr.nbytes, 1))
+    np.ndarray(arr.shape, dtype=arr.dtype, buffer=bloco.buf)[...] = arr
+    return bloco, (bloco.name, arr.shape, arr.dtype.str)
+
+
+def _abrir_compartilhado(descritor) -> np.ndarray:
+    """Visão NumPy (sem cópia) de um bloco criado por _criar_compartilhado."""
+    nome, forma, dtype = descritor
+    if sys.version_info >= (3, 13):
+        # o processo pai é o dono do bloco: o trabalhador não o registra
+        bloco = shared_memory.SharedMemory(name=nome, track=False)
+    else:
+        # antes do 3.13 o trabalhador registra o bloco no resource_tracker do
+        # pai (compartilhado com os filhos); o unlink do pai remove o registro
+        bloco = shared_memory.SharedMemory(name=nome)
+    _compartilhado[nome] = bloco
+    return np.ndarray(forma, dtype=np.dtype(dtype), buffer=bloco.buf)
+
+
+def _iniciar_trabalhador(desc_X, desc_y, desc_dobras):
+    _compartilhado["dados"] = tuple(_abrir_compartilhado(d) for d in (desc_X, desc_y, desc_dobras))
+
+
+# ---------------------------
+# Avaliação de uma dobra
+# ---------------------------
+
+def avaliar_dobra(X, y, dobras, repeticao, dobra, max_iter=200):
+    """Treina nas demais dobras e avalia na dobra indicada: (acurácia, AUC, vn, fp, fn, vp)."""
+    from sklearn.linear_model import LogisticRegression
+    from sklearn.metrics import accuracy_score, confusion_matrix, roc_auc_score
+
+    teste = dobras[repeticao] == dobra
+    clf = LogisticRegression(max_iter=max_iter)
+    clf.fit(X[~teste], y[~teste])
+
+    y_proba = clf.predict_proba(X[teste])[:, 1]
+    y_pred = (y_proba >= 0.5).astype(y.dtype)
+    cm = confusion_matrix(y[teste], y_pred, labels=[0, 1]).ravel()
+    return (accuracy_score(y[teste], y_pred), roc_auc_score(y[teste], y_proba), *cm)
+
+
+def _tarefa_dobra(args):
+    """Executa avaliar_dobra em um processo do pool, sobre os dados compartilhados."""
+    repeticao, dobra, max_iter = args
+    X, y, dobras = _compartilhado["dados"]
+    return avaliar_dobra(X, y, dobras, repeticao, dobra, max_iter)
+
+
+# ---------------------------
+# API principal
+# ---------------------------
+
+def intervalo_confianca(valores, nivel=0.95):
+    """Média, desvio e intervalo t de Student para a média das colunas de valores."""
+    from scipy import stats
+
+    valores = np.asarray(valores, dtype=float)
+    n = valores.shape[0]
+    media = valores.mean(axis=0)
+    desvio = valores.std(axis=0, ddof=1) if n > 1 else np.zeros_like(media)
+    meia = stats.t.ppf(0.5 + nivel / 2, n - 1) * desvio / np.sqrt(n) if n > 1 else 0.0
+    return media, desvio, media - meia, media + meia
+
+
+def validar_cruzado(X, y, k=5, repeticoes=1, n_processos=1, seed=42, max_iter=200, nivel=0.95):
+    """
+    Validação cruzada estratificada k-fold (repetida `repeticoes` vezes).
+    - n_processos: processos trabalhadores (1 = serial, no próprio processo)
+    Resultados são idênticos para qualquer n_processos.
+    Retorna um dicionário com:
+    - por_dobra: DataFrame (repeticao, dobra, acuracia, auc, vn, fp, fn, vp)
+    - metricas: DataFrame (métrica x media, desvio, ic_inf, ic_sup)
+    - confusao: matriz 2x2 média por dobra; confusao_ic_inf / confusao_ic_sup
+    """
+    X = np.ascontiguousarray(X, dtype=float)
+    y = np.ascontiguousarray(y, dtype=np.int64)
+    dobras = atribuir_dobras(y, k, repeticoes, seed)
+    tarefas = [(r, d, max_iter) for r in range(repeticoes) for d in range(k)]
+
+    if n_processos == 1:
+        linhas = [avaliar_dobra(X, y, dobras, r, d, m) for r, d, m in tarefas]
+    else:
+        blocos, descritores = zip(*(_criar_compartilhado(a) for a in (X, y, dobras)))
+        try:
+            with ProcessPoolExecutor(max_workers=n_processos, initializer=_iniciar_trabalhador,
+                                     initargs=descritores) as pool:
+                linhas = list(pool.map(_tarefa_dobra, tarefas))
+        finally:
+            for bloco in blocos:
+                bloco.close()
+                bloco.unlink()
+
+    por_dobra = pd.DataFrame(linhas, columns=METRICAS + CELULAS_CONFUSAO)
+    por_dobra.insert(0, "dobra", [d for _, d, _ in tarefas])
+    por_dobra.insert(0, "repeticao", [r for r, _, _ in tarefas])
+
+    media, desvio, ic_inf, ic_sup = intervalo_confianca(por_dobra[METRICAS + CELULAS_CONFUSAO], nivel)
+    n_met = len(METRICAS)
+    metricas = pd.DataFrame({"media": media[:n_met], "desvio": desvio[:n_met],
+                             "ic_inf": ic_inf[:n_met], "ic_sup": ic_sup[:n_met]}, index=METRICAS)
+    rotulos = ["Não Sobreviveu", "Sobreviveu"]
+
+    def matriz(v):
+        return pd.DataFrame(np.reshape(v[n_met:], (2, 2)), index=rotulos, columns=rotulos)
+
+    return {
+        "por_dobra": por_dobra,
+        "metricas": metricas,
+        "confusao": matriz(media),
+        "confusao_ic_inf": matriz(ic_inf),
+        "confusao_ic_sup": matriz(ic_sup),
+        "k": k,
+        "repeticoes": repeticoes,
+        "nivel": nivel,
+    }
+
+
+def formatar_validacao(res: dict) -> str:
+    """Texto para o relatório: métricas com IC e matriz de confusão média por dobra."""
+    nivel = int(round(res["nivel"] * 100))
+    linhas = [f"==== VALIDAÇÃO CRUZADA ({res['k']} dobras x {res['repeticoes']} repetições) ===="]
+    for nome, m in res["metricas"].iterrows():
+        linhas.append(f"{nome}: {m['media']:.4f} ± {m['desvio']:.4f} "
+                      f"(IC {nivel}%: {m['ic_inf']:.4f} – {m['ic_sup']:.4f})")
+    linhas.append("\nMatriz de confusão média por dobra (linhas = real, colunas = previsto):")
+    linhas.append(res["confusao"].round(2).to_string())
+    linhas.append(f"IC {nivel}% inferior:")
+    linhas.append(res["confusao_ic_inf"].round(2).to_string())
+    linhas.append(f"IC {nivel}% superior:")
+    linhas.append(res["confusao_ic_sup"].round(2).to_string())
+    return "\n".join(linhas) + "\n"
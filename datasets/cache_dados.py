@@ -0,0 +1,325 @@
+# -*- coding: utf-8 -*-
+"""
+Acesso aos datasets do curso com cache colunar (Parquet/Feather)
+Descrição:
+    Resolve um dataset pelo nome (DATASETS) ou pelo caminho do arquivo, calcula
+    o SHA-256 do conteúdo e, na primeira leitura, converte o CSV para um
+    arquivo colunar tipado em datasets/.cache. As leituras seguintes vêm do
+    cache; o CSV só é analisado de novo quando o checksum muda.
+
+    - A chave do cache é o conteúdo (sha256) + os parâmetros de leitura, então
+      cópias idênticas do mesmo CSV em pastas diferentes (ex.: dados_titanic.csv
+      em titanic_analise_1 e titanic_analise_2) compartilham uma única entrada.
+    - Para não reler o arquivo inteiro a cada chamada só para calcular o hash,
+      o índice .cache/indice.json guarda (tamanho, mtime) de cada fonte; o hash
+      é recalculado apenas quando esses metadados mudam.
+    - Planilhas Excel (ler_excel): cada aba pedida, só com as colunas pedidas,
+      vira um arquivo colunar próprio, com a mesma chave (checksum da pasta de
+      trabalho, reaproveitado enquanto tamanho e mtime não mudam). As abas
+      ainda não convertidas podem ser lidas em paralelo, em processos
+      separados; se python-calamine estiver instalado, é usado no lugar do
+      openpyxl.
+    - Sem pyarrow, as funções caem para pd.read_csv / pd.read_excel sem cache.
+      O mesmo vale para parâmetros que não são literais (ex.: converters com
+      funções, usecols como função), que não dão uma chave estável, e para
+      DataFrames que não cabem no arquivo colunar (tipos misturados).
+
+Uso:
+    import cache_dados
+    df = cache_dados.carregar("titanic")
+    df = cache_dados.ler_csv("Exercicios/analise_cafe_2/arabica_data_cleaned.csv")
+    abas = cache_dados.ler_excel("datasets_curso", n_processos=4)   # {aba: DataFrame}
+    df = cache_dados.ler_excel("rendimentos.xlsx", planilhas=0, colunas=["Rendimento de Óleo (%)"])
+    python datasets/cache_dados.py            # pré-aquece o cache de todos os datasets
+                                              # e confere cada um contra a leitura direta
+"""
+
+import hashlib
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+
+DIRETORIO = os.path.dirname(os.path.abspath(__file__))
+RAIZ = os.path.dirname(DIRETORIO)
+DIRETORIO_CACHE = os.environ.get("CACHE_DADOS", os.path.join(DIRETORIO, ".cache"))
+ARQUIVO_INDICE = "indice.json"
+VERSAO_CACHE = 2  # entra na chave: muda quando o conteúdo gravado no cache muda (2: índice preservado)
+FORMATOS = ("parquet", "feather")
+
+# nome -> caminho relativo à raiz do repositório
+DATASETS = {
+    "titanic": "Exercicios/titanic_analise_2/dados_titanic.csv",
+    "arabica": "Exercicios/analise_cafe_2/arabica_data_cleaned.csv",
+    "arabica_preparado": "Exercicios/analise_cafe_2/arabica_data_cleaned_prepared.csv",
+    "secagem_folhas": "Aula_15_Projeto_Final/dados_secagem_folhas.csv",
+    "secagem_simulados": "Aula_15_Projeto_Final/dados_secagem_simulados.csv",
+    "metodos_secagem": "datasets/metodos_secagem.csv",
+    "rendimento_oleo": "datasets/rendimento_oleo.csv",
+    "umidade_graos": "datasets/umidade_graos.csv",
+    "datasets_curso": "datasets/datasets_curso.xlsx",
+    "rendimentos": "Aula_05_Pandas_IO/rendimentos.xlsx",
+}
+EXTENSOES_EXCEL = (".xlsx", ".xlsm", ".xls")
+
+
+# ---------------------------
+# Resolução e checksum
+# ---------------------------
+
+def resolver(nome_ou_caminho: str) -> str:
+    """Caminho absoluto de um dataset registrado em DATASETS ou de um arquivo."""
+    caminho = DATASETS.get(nome_ou_caminho, nome_ou_caminho)
+    if not os.path.isabs(caminho) and not os.path.exists(caminho):
+        caminho = os.path.join(RAIZ, caminho)
+    caminho = os.path.abspath(caminho)
+    if not os.path.exists(caminho):
+        raise FileNotFoundError(f"Dataset não encontrado: {nome_ou_caminho}")
+    return caminho
+
+
+def sha256_arquivo(caminho: str, tamanho_bloco=1 << 20) -> str:
+    h = hashlib.sha256()
+    with open(caminho, "rb") as f:
+        for bloco in iter(lambda: f.read(tamanho_bloco), b""):
+            h.update(bloco)
+    return h.hexdigest()
+
+
+def _ler_indice() -> dict:
+    try:
+        with open(os.path.join(DIRETORIO_CACHE, ARQUIVO_INDICE), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def _gravar_indice(indice: dict):
+    os.makedirs(DIRETORIO_CACHE, exist_ok=True)
+    destino = os.path.join(DIRETORIO_CACHE, ARQUIVO_INDICE)
+    temporario = f"{destino}.{os.getpid()}.tmp"
+    with open(temporario, "w", encoding="utf-8") as f:
+        json.dump(indice, f, indent=2)
+    os.replace(temporario, destino)
+
+
+def checksum(caminho: str) -> str:
+    """SHA-256 do arquivo, reaproveitado do índice enquanto tamanho e mtime não mudam."""
+    caminho = os.path.abspath(caminho)
+    info = os.stat(caminho)
+    indice = _ler_indice()
+    registro = indice.get(caminho)
+    if registro and registro["tamanho"] == info.st_size and registro["mtime_ns"] == info.st_mtime_ns:
+        return registro["sha256"]
+
+    digest = sha256_arquivo(caminho)
+    indice[caminho] = {"tamanho": info.st_size, "mtime_ns": info.st_mtime_ns, "sha256": digest}
+    _gravar_indice(indice)
+    return digest
+
+
+# ---------------------------
+# Cache colunar
+# ---------------------------
+
+def _tem_pyarrow() -> bool:
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _literal(valor) -> bool:
+    """Valor que entra na chave pelo repr: escalares, tipos/dtypes e coleções deles (sem funções ou objetos)."""
+    if valor is None or isinstance(valor, (bool, int, float, str, bytes, type, np.dtype,
+                                           pd.api.extensions.ExtensionDtype)):
+        return True
+    if isinstance(valor, dict):
+        return all(_literal(k) and _literal(v) for k, v in valor.items())
+    if isinstance(valor, (list, tuple, set, frozenset)):
+        return all(_literal(v) for v in valor)
+    return False
+
+
+def caminho_cache(caminho: str, formato="parquet", **kwargs) -> str:
+    """Arquivo de cache para (conteúdo de caminho, parâmetros de leitura, formato)."""
+    if formato not in FORMATOS:
+        raise ValueError(f"Formato de cache desconhecido: {formato} (use {FORMATOS})")
+    if not _literal(kwargs):
+        raise ValueError("Parâmetros de leitura não literais (funções, objetos) não servem de chave de cache")
+    parametros = hashlib.sha256(repr((VERSAO_CACHE, sorted(kwargs.items()))).encode("utf-8")).hexdigest()
+    return os.path.join(DIRETORIO_CACHE, f"{checksum(caminho)[:16]}-{parametros[:8]}.{formato}")
+
+
+def _gravar_cache(df: pd.DataFrame, destino: str, formato: str):
+    os.makedirs(DIRETORIO_CACHE, exist_ok=True)
+    temporario = f"{destino}.{os.getpid()}.tmp"
+    try:
+        # o índice (ex.: index_col=0) vai junto, nos metadados pandas do arquivo
+        if formato == "parquet":
+            df.to_parquet(temporario)
+        else:
+            import pyarrow as pa
+            from pyarrow import feather
+            feather.write_feather(pa.Table.from_pandas(df), temporario)
+    except BaseException:
+        if os.path.exists(temporario):
+            os.remove(temporario)
+        raise
+    os.replace(temporario, destino)
+
+
+def _ler_cache(destino: str, formato: str) -> pd.DataFrame:
+    return pd.read_parquet(destino) if formato == "parquet" else pd.read_feather(destino)
+
+
+def ler_csv(caminho: str, formato="parquet", **kwargs) -> pd.DataFrame:
+    """
+    pd.read_csv(caminho, **kwargs) servido pelo cache colunar.
+    - formato: "parquet" ou "feather"
+    O CSV é analisado só na primeira leitura de cada conteúdo/parâmetros.
+    Parâmetros não literais ou um DataFrame que não cabe no arquivo colunar
+    dispensam o cache (o DataFrame é devolvido normalmente).
+    """
+    caminho = resolver(caminho)
+    if not _tem_pyarrow() or not _literal(kwargs):
+        return pd.read_csv(caminho, **kwargs)
+
+    destino = caminho_cache(caminho, formato, **kwargs)
+    if os.path.exists(destino):
+        return _ler_cache(destino, formato)
+
+    df = pd.read_csv(caminho, **kwargs)
+    try:
+        _gravar_cache(df, destino, formato)
+    except (TypeError, ValueError, ImportError) as erro:
+        # colunas com tipos misturados não cabem em um arquivo colunar tipado
+        print(f"Aviso: '{os.path.basename(caminho)}' não foi para o cache ({erro})")
+    return df
+
+
+# ---------------------------
+# Planilhas Excel
+# ---------------------------
+
+def _motor_excel():
+    """Motor calamine (muito mais rápido) se python-calamine estiver instalado; senão o padrão do pandas."""
+    try:
+        import python_calamine  # noqa: F401
+    except ImportError:
+        return None
+    return "calamine"
+
+
+def nomes_planilhas(caminho: str) -> list:
+    """Nomes das abas da pasta de trabalho, guardados em cache junto com o checksum."""
+    caminho = resolver(caminho)
+    destino = os.path.join(DIRETORIO_CACHE, f"{checksum(caminho)[:16]}-planilhas.json")
+    if os.path.exists(destino):
+        with open(destino, "r", encoding="utf-8") as f:
+            return json.load(f)
+    with pd.ExcelFile(caminho, engine=_motor_excel()) as arquivo:
+        nomes = list(arquivo.sheet_names)
+    if _tem_pyarrow():
+        os.makedirs(DIRETORIO_CACHE, exist_ok=True)
+        with open(destino, "w", encoding="utf-8") as f:
+            json.dump(nomes, f, ensure_ascii=False)
+    return nomes
+
+
+def _converter_planilha(args):
+    """Lê uma aba e grava seu cache; devolve o caminho do cache (ou o DataFrame, se não der para gravar)."""
+    caminho, planilha, colunas, destino, formato = args
+    df = pd.read_excel(caminho, sheet_name=planilha, usecols=colunas, engine=_motor_excel())
+    try:
+        _gravar_cache(df, destino, formato)
+    except (TypeError, ValueError, ImportError) as erro:
+        # colunas com tipos misturados não cabem em um arquivo colunar tipado
+        print(f"Aviso: aba '{planilha}' não foi para o cache ({erro})")
+        return df
+    return destino
+
+
+def ler_excel(caminho: str, planilhas=None, colunas=None, formato="parquet", n_processos=1):
+    """
+    Lê abas de uma pasta de trabalho Excel pelo cache colunar.
+    - planilhas: nome ou índice de uma aba (devolve um DataFrame) ou lista de
+      abas / None para todas (devolve {aba: DataFrame}, na ordem pedida)
+    - colunas: colunas a ler (como usecols do pd.read_excel), iguais para todas as abas
+    - n_processos: processos usados para converter as abas que não estão em cache
+    """
+    caminho = resolver(caminho)
+    nomes = nomes_planilhas(caminho)
+    unica = isinstance(planilhas, (str, int))
+    pedidas = nomes if planilhas is None else [planilhas] if unica else list(planilhas)
+    pedidas = [nomes[p] if isinstance(p, int) else p for p in pedidas]
+    if not _tem_pyarrow() or not _literal(colunas):
+        resultado = pd.read_excel(caminho, sheet_name=pedidas, usecols=colunas)
+        return resultado[pedidas[0]] if unica else resultado
+
+    destinos = {p: caminho_cache(caminho, formato, sheet_name=p, usecols=colunas) for p in pedidas}
+    faltando = [(caminho, p, colunas, destinos[p], formato)
+                for p in pedidas if not os.path.exists(destinos[p])]
+    if n_processos > 1 and len(faltando) > 1:
+        with ProcessPoolExecutor(max_workers=min(n_processos, len(faltando))) as pool:
+            convertidas = dict(zip((t[1] for t in faltando), pool.map(_converter_planilha, faltando)))
+    else:
+        convertidas = {t[1]: _converter_planilha(t) for t in faltando}
+
+    resultado = {}
+    for p in pedidas:
+        origem = convertidas.get(p, destinos[p])
+        resultado[p] = origem if isinstance(origem, pd.DataFrame) else _ler_cache(origem, formato)
+    return resultado[pedidas[0]] if unica else resultado
+
+
+def carregar(nome: str, formato="parquet", **kwargs):
+    """Dataset registrado em DATASETS (ou caminho), lido pelo cache (CSV ou Excel)."""
+    caminho = resolver(nome)
+    if caminho.lower().endswith(EXTENSOES_EXCEL):
+        return ler_excel(caminho, formato=formato, **kwargs)
+    return ler_csv(caminho, formato, **kwargs)
+
+
+def verificar_cache(nome: str, formato="parquet", **kwargs) -> bool:
+    """
+    Confere se a leitura servida pelo cache é igual (valores, tipos e índice)
+    à leitura direta da fonte com os mesmos parâmetros.
+    """
+    caminho = resolver(nome)
+    carregar(caminho, formato, **kwargs)              # garante que o cache exista
+    servido = carregar(caminho, formato, **kwargs)    # esta leitura vem do cache
+    if caminho.lower().endswith(EXTENSOES_EXCEL):
+        abas = list(servido) if isinstance(servido, dict) else kwargs.get("planilhas")
+        direto = pd.read_excel(caminho, sheet_name=abas, usecols=kwargs.get("colunas"),
+                               engine=_motor_excel())
+    else:
+        direto = pd.read_csv(caminho, **kwargs)
+    if isinstance(servido, dict):
+        return all(servido[aba].equals(direto[aba]) for aba in servido)
+    return servido.equals(direto)
+
+
+def limpar_cache():
+    """Remove todos os arquivos do cache (o índice de checksums também)."""
+    if not os.path.isdir(DIRETORIO_CACHE):
+        return 0
+    arquivos = os.listdir(DIRETORIO_CACHE)
+    for nome in arquivos:
+        os.remove(os.path.join(DIRETORIO_CACHE, nome))
+    return len(arquivos)
+
+
+if __name__ == "__main__":
+    for nome in sys.argv[1:] or DATASETS:
+        dados = carregar(nome)
+        tabelas = dados.items() if isinstance(dados, dict) else [(None, dados)]
+        for aba, df in tabelas:
+            rotulo = nome if aba is None else f"{nome}[{aba}]"
+            print(f"{rotulo}: {df.shape[0]} linhas x {df.shape[1]} colunas")
+        print(f"{nome}: cache igual à leitura direta: {verificar_cache(nome)}")